@@ -7,8 +7,57 @@ print("=" * 80)
 print("AGENT 1: PAPER READER")
 print("=" * 80)
 
+def paper_search_query(paper, research_config=None):
+    """Retrieval query for a paper: its leading keywords, steered by the research topic if given."""
+    query = ' '.join(paper['keywords'][:3])
+    if research_config is not None:
+        query = f"{query} {research_config['topic']}"
+    return query
+
+def read_paper(paper_id, paper, search_function, context_budget=CONTEXT_TOKEN_BUDGET, deadline=None,
+               research_config=None):
+    """
+    Extract the structured entry for a single paper.
+    
+    Args:
+        paper_id: Identifier assigned to the paper
+        paper: Paper dictionary with title, abstract, keywords
+        search_function: Semantic search function for finding relevant chunks
+        context_budget: Token budget of the packed grounding context
+        deadline: Optional stage Deadline; retrieval depth shrinks as it runs out
+        research_config: Optional research configuration whose topic steers retrieval
+    
+    Returns:
+        Paper entry with extracted fields, relevant chunks, packed context and
+        the retrieval depth used
+    """
+    paper_info = {
+        'paper_id': paper_id,
+        'title': paper['title'],
+        'abstract': paper['abstract'].strip(),
+        'keywords': paper['keywords'],
+        'abstract_length': len(paper['abstract'].strip().split()),
+        'keyword_count': len(paper['keywords'])
+    }
+    
+    # Perform semantic search for each paper's keywords
+    search_query = paper_search_query(paper, research_config)
+    top_k = deadline.scaled_top_k(CONTEXT_CANDIDATES, minimum=2) if deadline is not None else CONTEXT_CANDIDATES
+    paper_info['retrieval_depth'] = top_k
+    search_results = search_function(search_query, top_k=top_k)
+    
+    paper_info['relevant_chunks'] = [{
+        'chunk_id': chunk['chunk_id'],
+        'similarity': round(chunk['similarity'], 4),
+        'text_preview': chunk['chunk_text'][:100]
+    } for chunk in search_results[:2]]
+    
+    # Full-text grounding evidence within the prompt token budget
+    paper_info['context'] = pack_context(search_results, token_budget=context_budget)
+    return paper_info
+
 # Agent 1: Paper Reader - Extracts and structures paper content
-def paper_reader_agent(papers, search_function):
+def paper_reader_agent(papers, search_function, handoff_store=None, deadline=None, research_config=None):
     """
     Agent 1: Paper Reader
     Reads and extracts key information from research papers.
@@ -16,6 +65,9 @@ def paper_reader_agent(papers, search_function):
     Args:
         papers: List of paper dictionaries with title, abstract, keywords
         search_function: Semantic search function for finding relevant chunks
+        handoff_store: Optional HandoffStore receiving each paper's entry
+        deadline: Optional stage Deadline; papers left when it passes are marked incomplete
+        research_config: Optional research configuration (see build_research_config) steering retrieval
     
     Returns:
         Structured data with extracted paper information
@@ -27,50 +79,61 @@ def paper_reader_agent(papers, search_function):
         'agent': 'Paper Reader',
         'timestamp': datetime.now().isoformat(),
         'papers_processed': len(papers),
+        'research_topic': research_config['topic'] if research_config is not None else None,
         'extracted_papers': []
     }
     
     for idx, paper in enumerate(papers):
-        print(f"\n{'─' * 80}")
-        print(f"📄 Paper {idx + 1}: {paper['title'][:60]}...")
+        if deadline is not None and deadline.expired():
+            mark_incomplete(paper_reader_output, deadline, paper_ids=range(idx + 1, len(papers) + 1))
+            break
         
         # Extract key information
-        paper_info = {
-            'paper_id': idx + 1,
-            'title': paper['title'],
-            'abstract': paper['abstract'].strip(),
-            'keywords': paper['keywords'],
-            'abstract_length': len(paper['abstract'].strip().split()),
-            'keyword_count': len(paper['keywords'])
-        }
-        
-        # Perform semantic search for each paper's keywords
-        search_query = ' '.join(paper['keywords'][:3])
-        relevant_chunks = search_function(search_query, top_k=2)
-        
-        paper_info['relevant_chunks'] = [{
-            'chunk_id': chunk['chunk_id'],
-            'similarity': round(chunk['similarity'], 4),
-            'text_preview': chunk['chunk_text'][:100]
-        } for chunk in relevant_chunks]
+        paper_info = read_paper(idx + 1, paper, search_function, deadline=deadline, research_config=research_config)
         
         paper_reader_output['extracted_papers'].append(paper_info)
+        if handoff_store is not None:
+            handoff_store.put('reader', paper_info)
         
-        print(f"   ✓ Title: {paper['title']}")
-        print(f"   ✓ Abstract words: {paper_info['abstract_length']}")
-        print(f"   ✓ Keywords: {', '.join(paper['keywords'][:3])}")
-        print(f"   ✓ Found {len(relevant_chunks)} relevant chunks")
+        event_log.info(
+            'paper.read',
+            "\n" + "─" * 80 + "\n📄 Paper {paper_id}: {title:.60}...\n"
+            "   ✓ Title: {title}\n"
+            "   ✓ Abstract words: {abstract_words}\n"
+            "   ✓ Keywords: {keywords:join}\n"
+            "   ✓ Found {relevant_chunks} relevant chunks\n"
+            "   ✓ Packed context: {context_tokens}/{context_budget} tokens from {context_chunks} chunks",
+            paper_id=paper_info['paper_id'], title=paper['title'], abstract_words=paper_info['abstract_length'],
+            keywords=paper['keywords'][:3], relevant_chunks=len(paper_info['relevant_chunks']),
+            context_tokens=paper_info['context']['tokens_used'], context_budget=paper_info['context']['token_budget'],
+            context_chunks=len(paper_info['context']['citations'])
+        )
+    
+    paper_reader_output['papers_processed'] = len(paper_reader_output['extracted_papers'])
+    
+    # Shallower retrieval is a degraded output too: never cached, and flagged in the report
+    reduced = [p['paper_id'] for p in paper_reader_output['extracted_papers']
+               if p['retrieval_depth'] < CONTEXT_CANDIDATES]
+    if reduced:
+        mark_incomplete(paper_reader_output, deadline, sections=['retrieval_depth'],
+                        note=f"{deadline.name} deadline running out; retrieved fewer than "
+                             f"{CONTEXT_CANDIDATES} chunks for {len(reduced)} papers")
     
     print(f"\n{'=' * 80}")
     print(f"✅ Paper Reader Agent Complete")
-    print(f"   • Papers processed: {len(papers)}")
+    print(f"   • Papers processed: {paper_reader_output['papers_processed']}")
     print(f"   • Total keywords extracted: {sum(p['keyword_count'] for p in paper_reader_output['extracted_papers'])}")
     print(f"=" * 80)
     
-    return paper_reader_output
+    return validate_handoff('paper_reader', paper_reader_output)
+
+# Entries go into this stage's own copy of the store, exported (and memoized) with its output
+handoff_store = handoff_store.copy()
 
 # Execute Paper Reader Agent
-paper_reader_output = paper_reader_agent(sample_papers, semantic_search)
+with stage_tracer.span('agent.paper_reader', category='agent'):
+    paper_reader_output = paper_reader_agent(sample_papers, semantic_search, handoff_store,
+                                             deadline=run_deadline.stage('paper_reader'))
 
 print(f"\n\n📊 PAPER READER OUTPUT SUMMARY")
 print(f"{'=' * 80}")
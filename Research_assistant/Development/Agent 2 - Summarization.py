@@ -1,17 +1,149 @@
 import json
 from datetime import datetime
+import numpy as np
+import scipy.sparse as sp
 
 print("=" * 80)
 print("AGENT 2: SUMMARIZATION")
 print("=" * 80)
 
-def summarization_agent(paper_reader_data):
+def paper_summary_sentences(processed_paper):
+    """
+    Candidate summary sentences for a paper from the NLP pipeline output.
+    
+    The pipeline tokenizes title + abstract together, so the title is stripped
+    from the first sentence and whitespace is normalized.
+    """
+    title = ' '.join(processed_paper['title'].split())
+    sentences = [' '.join(s.split()) for s in processed_paper['sentences']]
+    if sentences and sentences[0].startswith(title):
+        sentences[0] = sentences[0][len(title):].strip()
+    return [s for s in sentences if s]
+
+def _textrank_batch(batch_sentences, vectorizer, top_n, damping, min_words, max_iter, tol):
+    """Rank the sentences of a batch of papers with one block-diagonal PageRank."""
+    candidates, owners = [], []
+    for paper_idx, sentences in enumerate(batch_sentences):
+        for sentence in sentences:
+            if len(sentence.split()) >= min_words:
+                candidates.append(sentence)
+                owners.append(paper_idx)
+    
+    selected = [[] for _ in batch_sentences]
+    if not candidates:
+        return selected
+    
+    owners = np.array(owners)
+    n_features = len(vectorizer.vocabulary_)
+    cleaned = [' '.join(tokenize_and_clean(clean_text(sentence))) for sentence in candidates]
+    vectors = vectorizer.transform(cleaned).tocsr()
+    
+    # Shift each paper's term columns into its own range so that the Gram matrix
+    # is block-diagonal: sentences are only compared within their own paper
+    row_owner = np.repeat(owners, np.diff(vectors.indptr))
+    shifted = sp.csr_matrix(
+        (vectors.data, vectors.indices + row_owner * n_features, vectors.indptr),
+        shape=(vectors.shape[0], n_features * len(batch_sentences))
+    )
+    similarity = (shifted @ shifted.T).tocsr()
+    similarity.setdiag(0)
+    similarity.eliminate_zeros()
+    
+    # Row-stochastic transition matrix; dangling sentences teleport within their paper
+    out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    transition = sp.diags(np.divide(1.0, out_weight, out=np.zeros_like(out_weight), where=~dangling)) @ similarity
+    paper_sizes = np.bincount(owners, minlength=len(batch_sentences))
+    teleport = 1.0 / paper_sizes[owners]
+    
+    scores = teleport.copy()
+    for _ in range(max_iter):
+        dangling_mass = np.bincount(owners, weights=scores * dangling, minlength=len(batch_sentences))
+        updated = (1 - damping) * teleport + damping * (transition.T @ scores + dangling_mass[owners] * teleport)
+        converged = np.abs(updated - scores).max() < tol
+        scores = updated
+        if converged:
+            break
+    
+    # Top-n per paper, reported in document order
+    order = np.lexsort((-scores, owners))
+    group_start = np.concatenate(([0], np.cumsum(paper_sizes)[:-1]))
+    rank_in_paper = np.arange(len(order)) - group_start[owners[order]]
+    keep = np.sort(order[rank_in_paper < top_n])
+    for idx in keep:
+        selected[owners[idx]].append(candidates[idx])
+    return selected
+
+def textrank_summarize(papers_sentences, vectorizer, top_n=3, damping=0.85, min_words=6,
+                       batch_size=256, max_iter=100, tol=1e-6):
+    """
+    Extractive summarization with TextRank over TF-IDF sentence vectors.
+    
+    Sentences are vectorized with the knowledge base vectorizer, compared with a
+    sparse cosine-similarity matrix and ranked with PageRank. Papers are processed
+    in batches that share a single sparse matrix product and power iteration.
+    
+    Args:
+        papers_sentences: List of sentence lists, one per paper
+        vectorizer: Fitted TF-IDF vectorizer from the embedding stage
+        top_n: Number of sentences to keep per paper
+        damping: PageRank damping factor
+        min_words: Minimum sentence length to be a summary candidate
+        batch_size: Number of papers ranked together
+        max_iter: Maximum power iterations
+        tol: Convergence tolerance on the score vector
+    
+    Returns:
+        List of selected sentence lists (document order), one per paper
+    """
+    summaries = []
+    for start in range(0, len(papers_sentences), batch_size):
+        summaries.extend(_textrank_batch(
+            papers_sentences[start:start + batch_size], vectorizer, top_n, damping, min_words, max_iter, tol
+        ))
+    return summaries
+
+def summarize_paper(paper_info, key_sentences):
+    """
+    Build the summary entry for a single paper.
+    
+    Args:
+        paper_info: Paper Reader entry for the paper
+        key_sentences: Summary sentences ranked by TextRank
+    
+    Returns:
+        Summary dictionary
+    """
+    return {
+        'paper_id': paper_info['paper_id'],
+        'title': paper_info['title'],
+        'key_topics': paper_info['keywords'][:3],
+        'summary_points': key_sentences,
+        'abstract_length': paper_info['abstract_length'],
+        'relevance_score': sum(chunk['similarity'] for chunk in paper_info['relevant_chunks']) / len(paper_info['relevant_chunks']),
+        'top_chunk': paper_info['relevant_chunks'][0] if paper_info['relevant_chunks'] else None
+    }
+
+def summary_aggregate_insights(summaries):
+    """Corpus-level statistics over a list of summaries."""
+    avg_relevance = sum(s['relevance_score'] for s in summaries) / len(summaries) if summaries else 0.0
+    return {
+        'average_relevance': round(avg_relevance, 4),
+        'unique_topics': len(set(topic for s in summaries for topic in s['key_topics'])),
+        'total_summary_points': sum(len(s['summary_points']) for s in summaries)
+    }
+
+def summarization_agent(paper_reader_data, processed_papers, tfidf_vectorizer, handoff_store=None, deadline=None):
     """
     Agent 2: Summarization Agent
     Generates concise summaries from paper reader output.
     
     Args:
         paper_reader_data: Structured data from Paper Reader Agent
+        processed_papers: NLP pipeline output with tokenized sentences
+        tfidf_vectorizer: Trained TF-IDF vectorizer
+        handoff_store: Optional HandoffStore receiving each paper's summary
+        deadline: Optional stage Deadline; papers left when it passes are marked incomplete
     
     Returns:
         Summarized information with key findings
@@ -25,44 +157,46 @@ def summarization_agent(paper_reader_data):
         'timestamp': datetime.now().isoformat(),
         'input_agent': paper_reader_data['agent'],
         'papers_summarized': paper_reader_data['papers_processed'],
+        'summarization_method': 'TextRank',
         'summaries': []
     }
     
-    for paper_info in paper_reader_data['extracted_papers']:
-        print(f"\n{'─' * 80}")
-        print(f"📄 Summarizing Paper {paper_info['paper_id']}: {paper_info['title'][:50]}...")
-        
-        # Extract key sentences from abstract
-        abstract_sentences = paper_info['abstract'].split('. ')
-        key_sentences = [s.strip() for s in abstract_sentences if len(s.split()) > 5][:3]
+    # Rank sentences for all papers up front in batched TextRank passes
+    sentences_by_paper = {p['paper_id']: paper_summary_sentences(p) for p in processed_papers}
+    paper_ids = [paper_info['paper_id'] for paper_info in paper_reader_data['extracted_papers']]
+    ranked_points = dict(zip(paper_ids, textrank_summarize(
+        [sentences_by_paper.get(paper_id, []) for paper_id in paper_ids], tfidf_vectorizer
+    )))
+    
+    for position, paper_info in enumerate(paper_reader_data['extracted_papers']):
+        if deadline is not None and deadline.expired():
+            mark_incomplete(summarization_output, deadline, paper_ids=paper_ids[position:])
+            break
         
-        # Generate summary
-        summary = {
-            'paper_id': paper_info['paper_id'],
-            'title': paper_info['title'],
-            'key_topics': paper_info['keywords'][:3],
-            'summary_points': key_sentences,
-            'abstract_length': paper_info['abstract_length'],
-            'relevance_score': sum(chunk['similarity'] for chunk in paper_info['relevant_chunks']) / len(paper_info['relevant_chunks']),
-            'top_chunk': paper_info['relevant_chunks'][0] if paper_info['relevant_chunks'] else None
-        }
+        # Generate summary from the key sentences ranked by TextRank
+        summary = summarize_paper(paper_info, ranked_points[paper_info['paper_id']])
         
         summarization_output['summaries'].append(summary)
+        if handoff_store is not None:
+            handoff_store.put('summary', summary)
         
-        print(f"   ✓ Key topics: {', '.join(summary['key_topics'])}")
-        print(f"   ✓ Summary points: {len(summary['summary_points'])}")
-        print(f"   ✓ Relevance score: {summary['relevance_score']:.4f}")
-        print(f"   ✓ Top chunk ID: {summary['top_chunk']['chunk_id'] if summary['top_chunk'] else 'N/A'}")
+        event_log.info(
+            'paper.summarized',
+            "\n" + "─" * 80 + "\n📄 Summarizing Paper {paper_id}: {title:.50}...\n"
+            "   ✓ Key topics: {key_topics:join}\n"
+            "   ✓ Summary points: {summary_points}\n"
+            "   ✓ Relevance score: {relevance_score:.4f}\n"
+            "   ✓ Top chunk ID: {top_chunk_id}",
+            paper_id=summary['paper_id'], title=paper_info['title'], key_topics=summary['key_topics'],
+            summary_points=len(summary['summary_points']), relevance_score=summary['relevance_score'],
+            top_chunk_id=summary['top_chunk']['chunk_id'] if summary['top_chunk'] else 'N/A'
+        )
     
     # Generate aggregate insights
-    avg_relevance = sum(s['relevance_score'] for s in summarization_output['summaries']) / len(summarization_output['summaries'])
-    total_topics = len(set(topic for s in summarization_output['summaries'] for topic in s['key_topics']))
-    
-    summarization_output['aggregate_insights'] = {
-        'average_relevance': round(avg_relevance, 4),
-        'unique_topics': total_topics,
-        'total_summary_points': sum(len(s['summary_points']) for s in summarization_output['summaries'])
-    }
+    summarization_output['papers_summarized'] = len(summarization_output['summaries'])
+    summarization_output['aggregate_insights'] = summary_aggregate_insights(summarization_output['summaries'])
+    avg_relevance = summarization_output['aggregate_insights']['average_relevance']
+    total_topics = summarization_output['aggregate_insights']['unique_topics']
     
     print(f"\n{'=' * 80}")
     print(f"✅ Summarization Agent Complete")
@@ -71,10 +205,15 @@ def summarization_agent(paper_reader_data):
     print(f"   • Unique topics identified: {total_topics}")
     print(f"=" * 80)
     
-    return summarization_output
+    return validate_handoff('summarization', summarization_output)
+
+# Entries go into this stage's own copy of the store, exported (and memoized) with its output
+handoff_store = handoff_store.copy()
 
 # Execute Summarization Agent with Paper Reader output
-summarization_output = summarization_agent(paper_reader_output)
+with stage_tracer.span('agent.summarization', category='agent'):
+    summarization_output = summarization_agent(paper_reader_output, processed_papers, tfidf_vectorizer, handoff_store,
+                                               deadline=run_deadline.stage('summarization'))
 
 print(f"\n\n📊 SUMMARIZATION OUTPUT SUMMARY")
 print(f"{'=' * 80}")
@@ -1,11 +1,139 @@
 import json
+import re
 from datetime import datetime
 
 print("=" * 80)
 print("AGENT 3: FACT-CHECK")
 print("=" * 80)
 
-def fact_check_agent(summarization_data, original_papers):
+# Tokens are runs of letters/digits so that values such as "95%" or "0.90"
+# stay comparable between summaries and abstracts
+VERIFY_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?%?")
+
+def build_verification_index(paper, ngram_size=3):
+    """
+    Build the per-paper verification index used to check summary claims.
+    
+    The abstract is tokenized once so every later claim check is a handful of
+    hash lookups instead of substring scans over the abstract text.
+    
+    Args:
+        paper: Original paper dictionary with abstract and keywords
+        ngram_size: Length of the token n-grams stored for phrase checks
+    
+    Returns:
+        Dictionary with token, n-gram and keyword sets
+    """
+    tokens = VERIFY_TOKEN_PATTERN.findall(paper['abstract'].lower())
+    return {
+        'tokens': frozenset(tokens),
+        'ngrams': frozenset(zip(*(tokens[i:] for i in range(ngram_size)))),
+        'ngram_size': ngram_size,
+        'keywords': frozenset(paper['keywords'])
+    }
+
+def verify_claim(claim, verification_index, lead_words=3):
+    """
+    Check a single summary point against a paper's verification index.
+    
+    Args:
+        claim: Summary point text
+        verification_index: Index built by build_verification_index
+        lead_words: Number of leading claim words that must hit the abstract
+    
+    Returns:
+        Dictionary with the verification flag and n-gram coverage of the claim
+    """
+    claim_tokens = VERIFY_TOKEN_PATTERN.findall(claim.lower())
+    tokens = verification_index['tokens']
+    ngrams = verification_index['ngrams']
+    n = verification_index['ngram_size']
+    
+    claim_ngrams = list(zip(*(claim_tokens[i:] for i in range(n))))
+    ngram_hits = sum(1 for gram in claim_ngrams if gram in ngrams)
+    
+    return {
+        'verified': any(token in tokens for token in claim_tokens[:lead_words]),
+        'ngram_coverage': ngram_hits / len(claim_ngrams) if claim_ngrams else 0.0
+    }
+
+def verify_summaries(summaries, verification_indexes):
+    """
+    Batch-verify the summary points of all summaries.
+    
+    Args:
+        summaries: Summaries from the Summarization Agent
+        verification_indexes: Map of paper_id to verification index
+    
+    Returns:
+        Map of paper_id to the list of claim checks for that summary
+    """
+    return {
+        summary['paper_id']: [
+            verify_claim(point, verification_indexes[summary['paper_id']])
+            for point in summary['summary_points']
+        ]
+        for summary in summaries
+    }
+
+def fact_check_summary(summary, verification_index, checks):
+    """
+    Validate a single summary against its paper's verification index.
+    
+    Args:
+        summary: Summary entry from the Summarization Agent
+        verification_index: Index built by build_verification_index for the paper
+        checks: Claim checks of the summary points (from verify_claim)
+    
+    Returns:
+        Validation result dictionary
+    """
+    # Fact-check key topics against original keywords
+    claimed_topics = set(summary['key_topics'])
+    actual_keywords = verification_index['keywords']
+    topics_verified = claimed_topics.issubset(actual_keywords)
+    
+    # Verify summary points are from abstract
+    summary_verified = all(check['verified'] for check in checks)
+    ngram_coverage = sum(check['ngram_coverage'] for check in checks) / len(checks) if checks else 0
+    
+    # Calculate verification confidence
+    topic_overlap = len(claimed_topics.intersection(actual_keywords)) / len(claimed_topics) if claimed_topics else 0
+    
+    validation_result = {
+        'paper_id': summary['paper_id'],
+        'title': summary['title'],
+        'topics_verified': topics_verified,
+        'summary_verified': summary_verified,
+        'topic_overlap_ratio': round(topic_overlap, 4),
+        'summary_ngram_coverage': round(ngram_coverage, 4),
+        'relevance_score': summary['relevance_score'],
+        'verification_status': 'VERIFIED' if (topics_verified and summary_verified) else 'PARTIAL',
+        'claimed_topics': list(claimed_topics),
+        'actual_keywords': list(actual_keywords),
+        'validation_notes': []
+    }
+    
+    # Add validation notes
+    if not topics_verified:
+        validation_result['validation_notes'].append("Some claimed topics not in original keywords")
+    if not summary_verified:
+        validation_result['validation_notes'].append("Summary points may be paraphrased")
+    if topic_overlap == 1.0:
+        validation_result['validation_notes'].append("Perfect topic alignment with original")
+    return validation_result
+
+def validation_metrics_from_counts(total, verified, overlap_sum):
+    """Aggregate validation metrics from running counts."""
+    return {
+        'total_validated': total,
+        'fully_verified': verified,
+        'partially_verified': total - verified,
+        'average_topic_overlap': round(overlap_sum / total, 4) if total else 0.0,
+        'verification_rate': round(verified / total, 4) if total else 0.0
+    }
+
+def fact_check_agent(summarization_data, original_papers, handoff_store=None, deadline=None):
     """
     Agent 3: Fact-Check Agent
     Validates claims in summaries against original paper data.
@@ -13,6 +141,8 @@ def fact_check_agent(summarization_data, original_papers):
     Args:
         summarization_data: Output from Summarization Agent
         original_papers: Original paper data for validation
+        handoff_store: Optional HandoffStore receiving each paper's validation
+        deadline: Optional stage Deadline; summaries left when it passes are marked incomplete
     
     Returns:
         Fact-checked summaries with validation results
@@ -29,69 +159,48 @@ def fact_check_agent(summarization_data, original_papers):
         'validated_summaries': []
     }
     
-    # Create lookup for original papers
-    original_papers_map = {i+1: paper for i, paper in enumerate(original_papers)}
+    # Build the verification index once per paper, then check all claims in one batch
+    verification_indexes = {i+1: build_verification_index(paper) for i, paper in enumerate(original_papers)}
+    claim_checks = verify_summaries(summarization_data['summaries'], verification_indexes)
     
-    for summary in summarization_data['summaries']:
-        print(f"\n{'─' * 80}")
-        print(f"🔎 Fact-checking Paper {summary['paper_id']}: {summary['title'][:50]}...")
+    for position, summary in enumerate(summarization_data['summaries']):
+        if deadline is not None and deadline.expired():
+            mark_incomplete(fact_check_output, deadline,
+                            paper_ids=[s['paper_id'] for s in summarization_data['summaries'][position:]])
+            break
         
-        original_paper = original_papers_map[summary['paper_id']]
-        
-        # Fact-check key topics against original keywords
-        claimed_topics = set(summary['key_topics'])
-        actual_keywords = set(original_paper['keywords'])
-        topics_verified = claimed_topics.issubset(actual_keywords)
-        
-        # Verify summary points are from abstract
-        abstract_text = original_paper['abstract'].lower()
-        summary_verified = all(
-            any(word in abstract_text for word in point.lower().split()[:3])
-            for point in summary['summary_points']
+        validation_result = fact_check_summary(
+            summary, verification_indexes[summary['paper_id']], claim_checks[summary['paper_id']]
         )
         
-        # Calculate verification confidence
-        topic_overlap = len(claimed_topics.intersection(actual_keywords)) / len(claimed_topics) if claimed_topics else 0
-        
-        validation_result = {
-            'paper_id': summary['paper_id'],
-            'title': summary['title'],
-            'topics_verified': topics_verified,
-            'summary_verified': summary_verified,
-            'topic_overlap_ratio': round(topic_overlap, 4),
-            'relevance_score': summary['relevance_score'],
-            'verification_status': 'VERIFIED' if (topics_verified and summary_verified) else 'PARTIAL',
-            'claimed_topics': list(claimed_topics),
-            'actual_keywords': list(actual_keywords),
-            'validation_notes': []
-        }
-        
-        # Add validation notes
-        if not topics_verified:
-            validation_result['validation_notes'].append("Some claimed topics not in original keywords")
-        if not summary_verified:
-            validation_result['validation_notes'].append("Summary points may be paraphrased")
-        if topic_overlap == 1.0:
-            validation_result['validation_notes'].append("Perfect topic alignment with original")
-        
         fact_check_output['validated_summaries'].append(validation_result)
+        if handoff_store is not None:
+            handoff_store.put('validation', validation_result)
         
-        print(f"   ✓ Topics verified: {topics_verified}")
-        print(f"   ✓ Summary verified: {summary_verified}")
-        print(f"   ✓ Topic overlap: {topic_overlap:.2%}")
-        print(f"   ✓ Status: {validation_result['verification_status']}")
+        event_log.info(
+            'paper.fact_checked',
+            "\n" + "─" * 80 + "\n🔎 Fact-checking Paper {paper_id}: {title:.50}...\n"
+            "   ✓ Topics verified: {topics_verified}\n"
+            "   ✓ Summary verified: {summary_verified}\n"
+            "   ✓ Topic overlap: {topic_overlap_ratio:.2%}\n"
+            "   ✓ Summary n-gram coverage: {summary_ngram_coverage:.2%}\n"
+            "   ✓ Status: {verification_status}",
+            paper_id=summary['paper_id'], title=summary['title'],
+            topics_verified=validation_result['topics_verified'],
+            summary_verified=validation_result['summary_verified'],
+            topic_overlap_ratio=validation_result['topic_overlap_ratio'],
+            summary_ngram_coverage=validation_result['summary_ngram_coverage'],
+            verification_status=validation_result['verification_status']
+        )
     
     # Calculate aggregate validation metrics
+    fact_check_output['papers_validated'] = len(fact_check_output['validated_summaries'])
     verified_count = sum(1 for v in fact_check_output['validated_summaries'] if v['verification_status'] == 'VERIFIED')
-    avg_overlap = sum(v['topic_overlap_ratio'] for v in fact_check_output['validated_summaries']) / len(fact_check_output['validated_summaries'])
-    
-    fact_check_output['validation_metrics'] = {
-        'total_validated': len(fact_check_output['validated_summaries']),
-        'fully_verified': verified_count,
-        'partially_verified': len(fact_check_output['validated_summaries']) - verified_count,
-        'average_topic_overlap': round(avg_overlap, 4),
-        'verification_rate': round(verified_count / len(fact_check_output['validated_summaries']), 4)
-    }
+    fact_check_output['validation_metrics'] = validation_metrics_from_counts(
+        len(fact_check_output['validated_summaries']),
+        verified_count,
+        sum(v['topic_overlap_ratio'] for v in fact_check_output['validated_summaries'])
+    )
     
     print(f"\n{'=' * 80}")
     print(f"✅ Fact-Check Agent Complete")
@@ -100,10 +209,15 @@ def fact_check_agent(summarization_data, original_papers):
     print(f"   • Verification rate: {fact_check_output['validation_metrics']['verification_rate']:.2%}")
     print(f"=" * 80)
     
-    return fact_check_output
+    return validate_handoff('fact_check', fact_check_output)
+
+# Entries go into this stage's own copy of the store, exported (and memoized) with its output
+handoff_store = handoff_store.copy()
 
 # Execute Fact-Check Agent
-fact_check_output = fact_check_agent(summarization_output, sample_papers)
+with stage_tracer.span('agent.fact_check', category='agent'):
+    fact_check_output = fact_check_agent(summarization_output, sample_papers, handoff_store,
+                                         deadline=run_deadline.stage('fact_check'))
 
 print(f"\n\n📊 FACT-CHECK OUTPUT SUMMARY")
 print(f"{'=' * 80}")
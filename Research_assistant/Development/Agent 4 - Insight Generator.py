@@ -1,11 +1,162 @@
 import json
+import os
 from datetime import datetime
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
 
 print("=" * 80)
 print("AGENT 4: ADVANCED INSIGHT GENERATOR")
 print("=" * 80)
 
-def insight_generator_agent(fact_check_data, summarization_data):
+# Taxonomy files live in <project>/taxonomies/<domain>.json
+TAXONOMY_DIRS = [
+    os.environ.get('RESEARCH_TAXONOMY_DIR', ''),
+    'taxonomies',
+    os.path.join('Research_assistant', 'taxonomies'),
+    os.path.join('..', 'taxonomies')
+]
+
+# Used when no taxonomy file is available for the domain
+FALLBACK_TAXONOMY_TERMS = [
+    'deep learning', 'machine learning', 'natural language processing',
+    'clinical decision support', 'medical imaging', 'electronic health records',
+    'predictive modeling', 'patient outcomes', 'data privacy', 'model interpretability',
+    'real-time systems', 'regulatory compliance', 'clinical validation',
+    'transfer learning', 'federated learning'
+]
+
+_taxonomy_cache = {}
+
+def load_taxonomy(domain):
+    """
+    Load a domain taxonomy and precompute its term vectors (once per domain).
+    
+    Every node term and alias is embedded with a character n-gram TF-IDF model
+    fitted on the taxonomy itself, so abbreviations and inflections of corpus
+    keywords still land near the right node.
+    
+    Args:
+        domain: Taxonomy name, e.g. 'healthcare_ai'
+    
+    Returns:
+        Dictionary with node terms, alias vectors and the match threshold
+    """
+    if domain in _taxonomy_cache:
+        return _taxonomy_cache[domain]
+    
+    spec = {'nodes': [{'term': term, 'aliases': []} for term in FALLBACK_TAXONOMY_TERMS]}
+    source = 'built-in'
+    for directory in filter(None, TAXONOMY_DIRS):
+        path = os.path.join(directory, f"{domain}.json")
+        if os.path.exists(path):
+            with open(path) as f:
+                spec = json.load(f)
+            source = path
+            break
+    
+    # Aliases are laid out contiguously per node so node scores are a reduceat over columns
+    alias_texts, node_starts = [], []
+    for node in spec['nodes']:
+        node_starts.append(len(alias_texts))
+        alias_texts.extend(alias.lower() for alias in [node['term'], *node.get('aliases', [])])
+    
+    vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 4), sublinear_tf=True, norm='l2')
+    taxonomy = {
+        'domain': domain,
+        'source': source,
+        'nodes': [node['term'] for node in spec['nodes']],
+        'threshold': spec.get('match_threshold', 0.5),
+        'vectorizer': vectorizer,
+        'alias_vectors': vectorizer.fit_transform(alias_texts),
+        'node_starts': np.array(node_starts)
+    }
+    _taxonomy_cache[domain] = taxonomy
+    return taxonomy
+
+def match_topics_to_taxonomy(topics, taxonomy):
+    """
+    Assign corpus topics to taxonomy nodes with one batched similarity computation.
+    
+    Args:
+        topics: Corpus topic strings
+        taxonomy: Taxonomy loaded by load_taxonomy
+    
+    Returns:
+        Tuple of (topic -> matched node or None, node -> best similarity)
+    """
+    if not topics:
+        return {}, {node: 0.0 for node in taxonomy['nodes']}
+    
+    topic_vectors = taxonomy['vectorizer'].transform([topic.lower() for topic in topics])
+    alias_scores = (topic_vectors @ taxonomy['alias_vectors'].T).toarray()
+    node_scores = np.maximum.reduceat(alias_scores, taxonomy['node_starts'], axis=1)
+    
+    # Each topic maps to its single best node, so broad terms cannot cover sibling nodes
+    best_node = node_scores.argmax(axis=1)
+    best_score = node_scores[np.arange(len(topics)), best_node]
+    matches = {
+        topic: taxonomy['nodes'][node] if score >= taxonomy['threshold'] else None
+        for topic, node, score in zip(topics, best_node, best_score)
+    }
+    node_similarity = dict(zip(taxonomy['nodes'], node_scores.max(axis=0).round(4).tolist()))
+    return matches, node_similarity
+
+def build_topic_incidence(paper_topics):
+    """
+    Build the binary paper×topic incidence matrix.
+    
+    Args:
+        paper_topics: List of topic lists, one per paper
+    
+    Returns:
+        Tuple of (CSR matrix, topic vocabulary in first-seen order)
+    """
+    vocabulary = {}
+    indices, indptr = [], [0]
+    for topics in paper_topics:
+        indices.extend(sorted({vocabulary.setdefault(topic, len(vocabulary)) for topic in topics}))
+        indptr.append(len(indices))
+    matrix = sp.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), indices, indptr),
+        shape=(len(paper_topics), len(vocabulary))
+    )
+    return matrix, list(vocabulary)
+
+def analyze_topic_matrix(topic_matrix, topics, dominant_share=0.5, top_pairs=10):
+    """
+    Topic frequencies, dominant/emerging themes and co-occurrence from the incidence matrix.
+    
+    Args:
+        topic_matrix: Binary paper×topic CSR matrix
+        topics: Topic vocabulary matching the matrix columns
+        dominant_share: Paper share above which a topic is dominant
+        top_pairs: Number of co-occurring topic pairs to report
+    
+    Returns:
+        Dictionary with frequency vector, dominant/emerging topic indices and top pairs
+    """
+    n_papers = topic_matrix.shape[0]
+    frequency = np.asarray(topic_matrix.sum(axis=0)).ravel()
+    
+    # XᵀX counts the papers shared by every topic pair; keep the upper triangle
+    cooccurrence = (topic_matrix.T @ topic_matrix).tocoo()
+    upper = cooccurrence.row < cooccurrence.col
+    pair_rows, pair_cols, pair_counts = cooccurrence.row[upper], cooccurrence.col[upper], cooccurrence.data[upper]
+    strongest = np.argsort(-pair_counts, kind='stable')[:top_pairs]
+    
+    return {
+        'frequency': frequency,
+        'dominant': np.flatnonzero(frequency / max(n_papers, 1) > dominant_share),
+        'emerging': np.flatnonzero(frequency == 1),
+        'cooccurrence_pairs': [
+            {'topics': [topics[pair_rows[i]], topics[pair_cols[i]]], 'papers': int(pair_counts[i])}
+            for i in strongest
+        ]
+    }
+
+def insight_generator_agent(fact_check_data, summarization_data, handoff_store=None, taxonomy_domain='healthcare_ai', topic_clusters=None,
+                            deadline=None):
     """
     Agent 4: Advanced Insight Generator
     Analyzes processed research to identify trends, gaps, comparative findings, 
@@ -16,6 +167,10 @@ def insight_generator_agent(fact_check_data, summarization_data):
     Args:
         fact_check_data: Validated summaries from Fact-Check Agent
         summarization_data: Summary data for additional context
+        handoff_store: HandoffStore keyed by paper_id; built from summarization_data if not given
+        taxonomy_domain: Name of the taxonomy used as expected coverage in gap analysis
+        topic_clusters: Optional StreamingTopicClusterer fitted on the chunk embeddings
+        deadline: Optional stage Deadline; steps 4 and 5 are skipped once it passes
     
     Returns:
         Comprehensive insights with trend analysis and research recommendations
@@ -36,413 +191,472 @@ def insight_generator_agent(fact_check_data, summarization_data):
         'future_research_directions': []
     }
     
-    # ========================================================================
-    # STEP 1: Per-Paper Deep Analysis with Chain-of-Thought Reasoning
-    # ========================================================================
-    print(f"\n{'=' * 80}")
-    print("STEP 1: PER-PAPER DEEP ANALYSIS (Chain-of-Thought)")
-    print("=" * 80)
-    
-    all_topics = []
-    all_relevance_scores = []
-    all_implications = []
-    topic_frequency = {}
+    with stage_tracer.span('insight_generator.step1_per_paper_analysis', category='agent_step'):
+        # ========================================================================
+        # STEP 1: Per-Paper Deep Analysis with Chain-of-Thought Reasoning
+        # ========================================================================
+        print(f"\n{'=' * 80}")
+        print("STEP 1: PER-PAPER DEEP ANALYSIS (Chain-of-Thought)")
+        print("=" * 80)
+        
+        # Paper-keyed joins against upstream agent outputs
+        if handoff_store is None:
+            handoff_store = HandoffStore().put_many('summary', summarization_data['summaries'])
+        
+        paper_topic_lists = []
+        all_relevance_scores = []
+        all_implications = []
+        
+        for validation in fact_check_data['validated_summaries']:
+            event_log.info('paper.analyzing', "\n" + "─" * 80 + "\n📄 Analyzing Paper {paper_id}: {title:.60}...",
+                           paper_id=validation['paper_id'], title=validation['title'])
+            
+            # Find corresponding summary for additional context
+            summary_data = handoff_store.get(validation['paper_id'], 'summary')
+            
+            # Chain-of-Thought: Structured multi-step reasoning
+            paper_insight = {
+                'paper_id': validation['paper_id'],
+                'title': validation['title'],
+                'verification_status': validation['verification_status'],
+                'relevance_score': validation['relevance_score'],
+                'topic_overlap': validation['topic_overlap_ratio'],
+                'claimed_topics': validation['claimed_topics'],
+                'reasoning_chain': {},
+                'key_insights': [],
+                'research_implications': [],
+                'contribution_type': None,
+                'maturity_level': None
+            }
+            
+            # Chain-of-Thought Step 1: Assess research contribution type
+            event_log.debug('paper.reasoning_step', "   🔍 Reasoning Step {step}: Identifying contribution type...", step=1)
+            if 'meta-analysis' in validation['title'].lower():
+                paper_insight['contribution_type'] = 'Meta-Study/Review'
+                paper_insight['reasoning_chain']['contribution'] = "Meta-analysis indicates comprehensive literature review and synthesis"
+            elif any(term in validation['title'].lower() for term in ['novel', 'new', 'introducing']):
+                paper_insight['contribution_type'] = 'Novel Method/Innovation'
+                paper_insight['reasoning_chain']['contribution'] = "Language suggests introduction of new methodology or approach"
+            elif any(term in validation['title'].lower() for term in ['application', 'implementing', 'clinical']):
+                paper_insight['contribution_type'] = 'Applied Research'
+                paper_insight['reasoning_chain']['contribution'] = "Focus on practical application in real-world settings"
+            else:
+                paper_insight['contribution_type'] = 'Empirical Study'
+                paper_insight['reasoning_chain']['contribution'] = "Empirical research advancing understanding in specific domain"
+            
+            # Chain-of-Thought Step 2: Assess research maturity
+            event_log.debug('paper.reasoning_step', "   🔍 Reasoning Step {step}: Evaluating research maturity...", step=2)
+            if validation['verification_status'] == 'VERIFIED' and validation['relevance_score'] > 0.18:
+                paper_insight['maturity_level'] = 'High - Ready for Citation'
+                paper_insight['reasoning_chain']['maturity'] = f"Verified status + high relevance ({validation['relevance_score']:.4f}) = citation-ready"
+            elif validation['verification_status'] == 'VERIFIED':
+                paper_insight['maturity_level'] = 'Medium - Needs Context'
+                paper_insight['reasoning_chain']['maturity'] = "Verified but moderate relevance - use with additional context"
+            else:
+                paper_insight['maturity_level'] = 'Low - Further Validation Needed'
+                paper_insight['reasoning_chain']['maturity'] = "Requires additional validation before use"
+            
+            # Chain-of-Thought Step 3: Extract key insights
+            event_log.debug('paper.reasoning_step', "   🔍 Reasoning Step {step}: Extracting insights...", step=3)
+            if validation['topic_overlap_ratio'] >= 0.9:
+                insight = f"Core alignment: {validation['topic_overlap_ratio']:.0%} topic match indicates central relevance"
+                paper_insight['key_insights'].append(insight)
+            
+            if validation['verification_status'] == 'VERIFIED':
+                paper_insight['key_insights'].append(
+                    f"High credibility: All claims verified against knowledge base"
+                )
+            
+            if validation['relevance_score'] > 0.18:
+                paper_insight['key_insights'].append(
+                    f"Strong semantic relevance (score: {validation['relevance_score']:.4f}) - highly relevant to research queries"
+                )
+            elif validation['relevance_score'] < 0.10:
+                paper_insight['key_insights'].append(
+                    f"Tangential relevance (score: {validation['relevance_score']:.4f}) - peripheral to main focus"
+                )
+            
+            # Chain-of-Thought Step 4: Derive research implications
+            event_log.debug('paper.reasoning_step', "   🔍 Reasoning Step {step}: Deriving implications...", step=4)
+            topic_implication_map = {
+                'deep learning': {
+                    'implication': 'Foundation for advanced pattern recognition and automated feature extraction',
+                    'application': 'Applicable to complex medical image analysis tasks'
+                },
+                'machine learning': {
+                    'implication': 'Data-driven modeling for predictive and diagnostic systems',
+                    'application': 'Enables automated decision support with continuous learning'
+                },
+                'clinical decision support': {
+                    'implication': 'Direct patient care enhancement through evidence-based recommendations',
+                    'application': 'Measurable impact on clinical outcomes and treatment efficacy'
+                },
+                'natural language processing': {
+                    'implication': 'Unstructured clinical data becomes analyzable and actionable',
+                    'application': 'Extracts insights from physician notes, reports, and literature'
+                },
+                'medical imaging': {
+                    'implication': 'Computer vision techniques enhance diagnostic accuracy',
+                    'application': 'Reduces radiologist workload while improving detection rates'
+                },
+                'electronic health records': {
+                    'implication': 'Structured and unstructured EHR data integration',
+                    'application': 'Comprehensive patient profiles for personalized medicine'
+                }
+            }
+            
+            for topic in validation['claimed_topics']:
+                if topic in topic_implication_map:
+                    impl_data = topic_implication_map[topic]
+                    paper_insight['research_implications'].append(
+                        f"{topic.upper()}: {impl_data['implication']} → {impl_data['application']}"
+                    )
+                    all_implications.append(impl_data)
+            
+            # Track topics for trend analysis
+            paper_topic_lists.append(validation['claimed_topics'])
+            
+            all_relevance_scores.append(validation['relevance_score'])
+            
+            insight_generator_output['paper_insights'].append(paper_insight)
+            handoff_store.put('insight', paper_insight)
+            
+            event_log.info(
+                'paper.analyzed',
+                "   ✓ Contribution: {contribution_type}\n"
+                "   ✓ Maturity: {maturity_level}\n"
+                "   ✓ Key insights: {key_insights}\n"
+                "   ✓ Implications: {implications}",
+                paper_id=paper_insight['paper_id'], contribution_type=paper_insight['contribution_type'],
+                maturity_level=paper_insight['maturity_level'], key_insights=len(paper_insight['key_insights']),
+                implications=len(paper_insight['research_implications'])
+            )
     
-    for validation in fact_check_data['validated_summaries']:
-        print(f"\n{'─' * 80}")
-        print(f"📄 Analyzing Paper {validation['paper_id']}: {validation['title'][:60]}...")
-        
-        # Find corresponding summary for additional context
-        summary_data = next(s for s in summarization_data['summaries'] if s['paper_id'] == validation['paper_id'])
-        
-        # Chain-of-Thought: Structured multi-step reasoning
-        paper_insight = {
-            'paper_id': validation['paper_id'],
-            'title': validation['title'],
-            'verification_status': validation['verification_status'],
-            'relevance_score': validation['relevance_score'],
-            'topic_overlap': validation['topic_overlap_ratio'],
-            'claimed_topics': validation['claimed_topics'],
-            'reasoning_chain': {},
-            'key_insights': [],
-            'research_implications': [],
-            'contribution_type': None,
-            'maturity_level': None
+    with stage_tracer.span('insight_generator.step2_trend_analysis', category='agent_step'):
+        # ========================================================================
+        # STEP 2: Trend Analysis with Few-Shot Pattern Recognition
+        # ========================================================================
+        print(f"\n{'=' * 80}")
+        print("STEP 2: TREND ANALYSIS (Few-Shot Pattern Recognition)")
+        print("=" * 80)
+        
+        # Build the paper×topic incidence matrix once; every trend statistic derives from it
+        topic_matrix, topic_vocabulary = build_topic_incidence(paper_topic_lists)
+        topic_index = {topic: idx for idx, topic in enumerate(topic_vocabulary)}
+        topic_stats = analyze_topic_matrix(topic_matrix, topic_vocabulary)
+        topic_frequency = dict(zip(topic_vocabulary, topic_stats['frequency'].tolist()))
+        total_topic_mentions = int(topic_matrix.nnz)
+        
+        def topic_mentions(group):
+            """Total mentions of a group of topics across all papers."""
+            columns = [topic_index[topic] for topic in group if topic in topic_index]
+            return int(topic_stats['frequency'][columns].sum())
+        
+        unique_topics = set(topic_vocabulary)
+        avg_relevance = sum(all_relevance_scores) / len(all_relevance_scores) if all_relevance_scores else 0.0
+        verification_rate = fact_check_data['validation_metrics']['verification_rate']
+        
+        print(f"\n📊 Trend Identification Patterns:")
+        print(f"   Pattern 1: Topic clustering → Identify dominant themes")
+        print(f"   Pattern 2: Frequency analysis → Detect emerging vs established areas")
+        print(f"   Pattern 3: Cross-paper connections → Find research synergies")
+        
+        # Dominant topics (appear in >50% of papers)
+        dominant_topics = [topic_vocabulary[idx] for idx in topic_stats['dominant']]
+        
+        # Emerging topics (appear in 1 paper only)
+        emerging_topics = [topic_vocabulary[idx] for idx in topic_stats['emerging']]
+        
+        # Data-driven themes from chunk-embedding clusters, independent of author keywords
+        cluster_themes = topic_clusters.cluster_themes() if topic_clusters is not None else []
+        
+        insight_generator_output['trend_analysis'] = {
+            'total_unique_topics': len(unique_topics),
+            'topic_diversity_score': len(unique_topics) / (total_topic_mentions + 1),  # normalized
+            'topic_frequency_map': topic_frequency,
+            'topic_cooccurrence': topic_stats['cooccurrence_pairs'],
+            'dominant_themes': dominant_topics,
+            'emerging_areas': emerging_topics,
+            'cluster_themes': cluster_themes,
+            'average_relevance': round(avg_relevance, 4),
+            'verification_quality': verification_rate,
+            'identified_trends': []
         }
         
-        # Chain-of-Thought Step 1: Assess research contribution type
-        print(f"   🔍 Reasoning Step 1: Identifying contribution type...")
-        if 'meta-analysis' in validation['title'].lower():
-            paper_insight['contribution_type'] = 'Meta-Study/Review'
-            paper_insight['reasoning_chain']['contribution'] = "Meta-analysis indicates comprehensive literature review and synthesis"
-        elif any(term in validation['title'].lower() for term in ['novel', 'new', 'introducing']):
-            paper_insight['contribution_type'] = 'Novel Method/Innovation'
-            paper_insight['reasoning_chain']['contribution'] = "Language suggests introduction of new methodology or approach"
-        elif any(term in validation['title'].lower() for term in ['application', 'implementing', 'clinical']):
-            paper_insight['contribution_type'] = 'Applied Research'
-            paper_insight['reasoning_chain']['contribution'] = "Focus on practical application in real-world settings"
-        else:
-            paper_insight['contribution_type'] = 'Empirical Study'
-            paper_insight['reasoning_chain']['contribution'] = "Empirical research advancing understanding in specific domain"
-        
-        # Chain-of-Thought Step 2: Assess research maturity
-        print(f"   🔍 Reasoning Step 2: Evaluating research maturity...")
-        if validation['verification_status'] == 'VERIFIED' and validation['relevance_score'] > 0.18:
-            paper_insight['maturity_level'] = 'High - Ready for Citation'
-            paper_insight['reasoning_chain']['maturity'] = f"Verified status + high relevance ({validation['relevance_score']:.4f}) = citation-ready"
-        elif validation['verification_status'] == 'VERIFIED':
-            paper_insight['maturity_level'] = 'Medium - Needs Context'
-            paper_insight['reasoning_chain']['maturity'] = "Verified but moderate relevance - use with additional context"
-        else:
-            paper_insight['maturity_level'] = 'Low - Further Validation Needed'
-            paper_insight['reasoning_chain']['maturity'] = "Requires additional validation before use"
-        
-        # Chain-of-Thought Step 3: Extract key insights
-        print(f"   🔍 Reasoning Step 3: Extracting insights...")
-        if validation['topic_overlap_ratio'] >= 0.9:
-            insight = f"Core alignment: {validation['topic_overlap_ratio']:.0%} topic match indicates central relevance"
-            paper_insight['key_insights'].append(insight)
-        
-        if validation['verification_status'] == 'VERIFIED':
-            paper_insight['key_insights'].append(
-                f"High credibility: All claims verified against knowledge base"
-            )
+        # Trend 1: Methodological trends
+        if any(ml_topic in unique_topics for ml_topic in ['deep learning', 'machine learning', 'CNN']):
+            insight_generator_output['trend_analysis']['identified_trends'].append({
+                'trend': 'AI/ML Dominance',
+                'description': 'AI and machine learning methods are primary methodological approach across research corpus',
+                'evidence': f"{topic_mentions(['deep learning', 'machine learning', 'CNN'])} mentions across {len(fact_check_data['validated_summaries'])} papers",
+                'implication': 'Future research will likely continue leveraging AI/ML frameworks'
+            })
         
-        if validation['relevance_score'] > 0.18:
-            paper_insight['key_insights'].append(
-                f"Strong semantic relevance (score: {validation['relevance_score']:.4f}) - highly relevant to research queries"
-            )
-        elif validation['relevance_score'] < 0.10:
-            paper_insight['key_insights'].append(
-                f"Tangential relevance (score: {validation['relevance_score']:.4f}) - peripheral to main focus"
-            )
+        # Trend 2: Application domain trends
+        if any(app_topic in unique_topics for app_topic in ['clinical decision support', 'medical imaging', 'electronic health records']):
+            insight_generator_output['trend_analysis']['identified_trends'].append({
+                'trend': 'Healthcare Application Focus',
+                'description': 'Strong emphasis on practical healthcare applications and clinical deployment',
+                'evidence': f"{topic_mentions(['clinical decision support', 'medical imaging', 'electronic health records'])} healthcare-specific topics identified",
+                'implication': 'Research is transitioning from theory to clinical practice implementation'
+            })
         
-        # Chain-of-Thought Step 4: Derive research implications
-        print(f"   🔍 Reasoning Step 4: Deriving implications...")
-        topic_implication_map = {
-            'deep learning': {
-                'implication': 'Foundation for advanced pattern recognition and automated feature extraction',
-                'application': 'Applicable to complex medical image analysis tasks'
-            },
-            'machine learning': {
-                'implication': 'Data-driven modeling for predictive and diagnostic systems',
-                'application': 'Enables automated decision support with continuous learning'
-            },
-            'clinical decision support': {
-                'implication': 'Direct patient care enhancement through evidence-based recommendations',
-                'application': 'Measurable impact on clinical outcomes and treatment efficacy'
-            },
-            'natural language processing': {
-                'implication': 'Unstructured clinical data becomes analyzable and actionable',
-                'application': 'Extracts insights from physician notes, reports, and literature'
-            },
-            'medical imaging': {
-                'implication': 'Computer vision techniques enhance diagnostic accuracy',
-                'application': 'Reduces radiologist workload while improving detection rates'
+        # Trend 3: Diversity and breadth
+        if len(unique_topics) >= 8:
+            insight_generator_output['trend_analysis']['identified_trends'].append({
+                'trend': 'Interdisciplinary Integration',
+                'description': f'High topic diversity ({len(unique_topics)} unique topics) indicates interdisciplinary research approach',
+                'evidence': f"Topics span {len(dominant_topics)} dominant themes and {len(emerging_topics)} emerging areas",
+                'implication': 'Research benefits from cross-domain knowledge integration'
+            })
+        
+        # Trend 4: Cross-paper synergies (topic pairs studied together in several papers)
+        shared_pairs = [pair for pair in topic_stats['cooccurrence_pairs'] if pair['papers'] >= 2]
+        if shared_pairs:
+            insight_generator_output['trend_analysis']['identified_trends'].append({
+                'trend': 'Topic Synergies',
+                'description': f"{len(shared_pairs)} topic pairs are studied together in multiple papers",
+                'evidence': f"Strongest pair: {' + '.join(shared_pairs[0]['topics'])} ({shared_pairs[0]['papers']} papers)",
+                'implication': 'Combined research programmes already exist for these topic pairs'
+            })
+        
+        # Trend 5: Shared themes discovered by clustering the paper text itself
+        shared_themes = [theme for theme in cluster_themes if theme['paper_count'] >= 2]
+        if shared_themes:
+            insight_generator_output['trend_analysis']['identified_trends'].append({
+                'trend': 'Shared Research Themes',
+                'description': f"{len(shared_themes)} of {len(cluster_themes)} text clusters span multiple papers",
+                'evidence': f"Largest theme: {shared_themes[0]['label']} ({shared_themes[0]['paper_count']} papers, {shared_themes[0]['chunk_count']} chunks)",
+                'implication': 'These themes are established across the corpus rather than single-paper topics'
+            })
+        
+        # Trend 6: Research quality
+        if verification_rate >= 0.9:
+            insight_generator_output['trend_analysis']['identified_trends'].append({
+                'trend': 'High Verification Quality',
+                'description': f'{verification_rate:.0%} verification rate indicates rigorous, evidence-based research',
+                'evidence': f"{int(verification_rate * len(fact_check_data['validated_summaries']))} of {len(fact_check_data['validated_summaries'])} papers fully verified",
+                'implication': 'Research corpus is suitable for meta-analysis and systematic review'
+            })
+        
+        print(f"\n   ✓ Identified trends: {len(insight_generator_output['trend_analysis']['identified_trends'])}")
+        print(f"   ✓ Dominant themes: {len(dominant_topics)}")
+        print(f"   ✓ Emerging areas: {len(emerging_topics)}")
+        print(f"   ✓ Co-occurring topic pairs: {len(topic_stats['cooccurrence_pairs'])}")
+        print(f"   ✓ Cluster themes: {len(cluster_themes)}")
+    
+    with stage_tracer.span('insight_generator.step3_gap_analysis', category='agent_step'):
+        # ========================================================================
+        # STEP 3: Gap Analysis with Comparative Reasoning
+        # ========================================================================
+        print(f"\n{'=' * 80}")
+        print("STEP 3: GAP ANALYSIS (Comparative Reasoning)")
+        print("=" * 80)
+        
+        print(f"\n🔍 Comparative Analysis Framework:")
+        print(f"   Compare: Expected vs Observed coverage")
+        print(f"   Identify: Missing perspectives and underexplored areas")
+        print(f"   Recommend: Priority areas for future investigation")
+        
+        # Expected topics come from the domain taxonomy; corpus topics are matched by similarity
+        taxonomy = load_taxonomy(taxonomy_domain)
+        expected_topics = taxonomy['nodes']
+        covered_topics = unique_topics
+        topic_matches, node_similarity = match_topics_to_taxonomy(topic_vocabulary, taxonomy)
+        covered_nodes = {node for node in topic_matches.values() if node is not None}
+        missing_topics = set(expected_topics) - covered_nodes
+        
+        # Identify research gaps
+        research_gaps = []
+        
+        if 'model interpretability' in missing_topics:
+            research_gaps.append({
+                'gap_type': 'Methodological Gap',
+                'description': 'Limited coverage of model interpretability and explainability',
+                'severity': 'High',
+                'rationale': 'Healthcare AI requires transparent decision-making for clinical adoption',
+                'recommendation': 'Include research on explainable AI methods and interpretation techniques'
+            })
+        
+        if 'data privacy' in missing_topics or 'federated learning' in missing_topics:
+            research_gaps.append({
+                'gap_type': 'Privacy & Security Gap',
+                'description': 'Insufficient focus on data privacy and federated learning approaches',
+                'severity': 'Medium-High',
+                'rationale': 'Patient data protection is critical for healthcare AI deployment',
+                'recommendation': 'Incorporate privacy-preserving ML and federated learning research'
+            })
+        
+        if 'clinical validation' in missing_topics or 'patient outcomes' in missing_topics:
+            research_gaps.append({
+                'gap_type': 'Validation Gap',
+                'description': 'Limited emphasis on clinical validation and patient outcome measurement',
+                'severity': 'Medium',
+                'rationale': 'Real-world effectiveness must be demonstrated beyond technical metrics',
+                'recommendation': 'Include clinical trial results and longitudinal outcome studies'
+            })
+        
+        if 'transfer learning' in missing_topics:
+            research_gaps.append({
+                'gap_type': 'Generalization Gap',
+                'description': 'Sparse coverage of transfer learning and domain adaptation',
+                'severity': 'Medium',
+                'rationale': 'Models must generalize across different clinical settings and populations',
+                'recommendation': 'Explore transfer learning for cross-institutional model deployment'
+            })
+        
+        insight_generator_output['gap_analysis'] = {
+            'taxonomy': taxonomy_domain,
+            'expected_topics': list(expected_topics),
+            'covered_topics': list(covered_topics),
+            'covered_taxonomy_nodes': sorted(covered_nodes),
+            'topic_matches': topic_matches,
+            'taxonomy_similarity': node_similarity,
+            'missing_topics': [node for node in expected_topics if node in missing_topics],
+            'coverage_rate': len(covered_nodes) / len(expected_topics),
+            'identified_gaps': research_gaps
+        }
+        
+        print(f"\n   ✓ Coverage rate: {insight_generator_output['gap_analysis']['coverage_rate']:.1%}")
+        print(f"   ✓ Identified gaps: {len(research_gaps)}")
+        print(f"   ✓ Missing topics: {len(missing_topics)}")
+    
+    # Comparative findings and future directions are the first to go under deadline pressure
+    if deadline is not None and deadline.expired():
+        insight_generator_output['comparative_findings'] = {'by_contribution_type': {}, 'by_maturity_level': {},
+                                                          'key_comparisons': []}
+        mark_incomplete(insight_generator_output, deadline,
+                        sections=['comparative_findings', 'future_research_directions'])
+        return validate_handoff('insight_generator', insight_generator_output)
+    
+    with stage_tracer.span('insight_generator.step4_comparative_findings', category='agent_step'):
+        # ========================================================================
+        # STEP 4: Comparative Findings
+        # ========================================================================
+        print(f"\n{'=' * 80}")
+        print("STEP 4: COMPARATIVE FINDINGS")
+        print("=" * 80)
+        
+        # Compare papers by contribution type
+        contribution_types = {}
+        for paper in insight_generator_output['paper_insights']:
+            ctype = paper['contribution_type']
+            if ctype not in contribution_types:
+                contribution_types[ctype] = []
+            contribution_types[ctype].append({
+                'paper_id': paper['paper_id'],
+                'title': paper['title'],
+                'relevance': paper['relevance_score']
+            })
+        
+        # Compare papers by maturity level
+        maturity_distribution = {}
+        for paper in insight_generator_output['paper_insights']:
+            mlevel = paper['maturity_level']
+            maturity_distribution[mlevel] = maturity_distribution.get(mlevel, 0) + 1
+        
+        insight_generator_output['comparative_findings'] = {
+            'by_contribution_type': contribution_types,
+            'by_maturity_level': maturity_distribution,
+            'relevance_comparison': {
+                'highest_relevance': max(all_relevance_scores),
+                'lowest_relevance': min(all_relevance_scores),
+                'relevance_range': max(all_relevance_scores) - min(all_relevance_scores),
+                'average': avg_relevance
             },
-            'electronic health records': {
-                'implication': 'Structured and unstructured EHR data integration',
-                'application': 'Comprehensive patient profiles for personalized medicine'
-            }
+            'key_comparisons': []
         }
         
-        for topic in validation['claimed_topics']:
-            if topic in topic_implication_map:
-                impl_data = topic_implication_map[topic]
-                paper_insight['research_implications'].append(
-                    f"{topic.upper()}: {impl_data['implication']} → {impl_data['application']}"
-                )
-                all_implications.append(impl_data)
+        # Key comparison 1: Relevance consistency
+        if max(all_relevance_scores) - min(all_relevance_scores) < 0.1:
+            insight_generator_output['comparative_findings']['key_comparisons'].append({
+                'finding': 'Consistent Relevance Scores',
+                'description': f'Low variance in relevance ({max(all_relevance_scores) - min(all_relevance_scores):.4f}) indicates cohesive research focus',
+                'implication': 'Papers form unified corpus suitable for comprehensive review'
+            })
+        else:
+            insight_generator_output['comparative_findings']['key_comparisons'].append({
+                'finding': 'Variable Relevance Scores',
+                'description': f'Higher variance ({max(all_relevance_scores) - min(all_relevance_scores):.4f}) suggests diverse perspectives',
+                'implication': 'Consider filtering by relevance threshold for focused analysis'
+            })
         
-        # Track topics for trend analysis
-        all_topics.extend(validation['claimed_topics'])
-        for topic in validation['claimed_topics']:
-            topic_frequency[topic] = topic_frequency.get(topic, 0) + 1
+        # Key comparison 2: Contribution diversity
+        if len(contribution_types) >= 3:
+            insight_generator_output['comparative_findings']['key_comparisons'].append({
+                'finding': 'Diverse Contribution Types',
+                'description': f'{len(contribution_types)} different contribution types present',
+                'implication': 'Corpus includes both theoretical foundations and practical applications'
+            })
         
-        all_relevance_scores.append(validation['relevance_score'])
+        print(f"\n   ✓ Contribution types: {len(contribution_types)}")
+        print(f"   ✓ Maturity levels: {len(maturity_distribution)}")
+        print(f"   ✓ Key comparisons: {len(insight_generator_output['comparative_findings']['key_comparisons'])}")
+    
+    with stage_tracer.span('insight_generator.step5_future_directions', category='agent_step'):
+        # ========================================================================
+        # STEP 5: Future Research Directions
+        # ========================================================================
+        print(f"\n{'=' * 80}")
+        print("STEP 5: FUTURE RESEARCH DIRECTIONS")
+        print("=" * 80)
         
-        insight_generator_output['paper_insights'].append(paper_insight)
+        future_directions = []
         
-        print(f"   ✓ Contribution: {paper_insight['contribution_type']}")
-        print(f"   ✓ Maturity: {paper_insight['maturity_level']}")
-        print(f"   ✓ Key insights: {len(paper_insight['key_insights'])}")
-        print(f"   ✓ Implications: {len(paper_insight['research_implications'])}")
-    
-    # ========================================================================
-    # STEP 2: Trend Analysis with Few-Shot Pattern Recognition
-    # ========================================================================
-    print(f"\n{'=' * 80}")
-    print("STEP 2: TREND ANALYSIS (Few-Shot Pattern Recognition)")
-    print("=" * 80)
-    
-    unique_topics = set(all_topics)
-    avg_relevance = sum(all_relevance_scores) / len(all_relevance_scores)
-    verification_rate = fact_check_data['validation_metrics']['verification_rate']
-    
-    print(f"\n📊 Trend Identification Patterns:")
-    print(f"   Pattern 1: Topic clustering → Identify dominant themes")
-    print(f"   Pattern 2: Frequency analysis → Detect emerging vs established areas")
-    print(f"   Pattern 3: Cross-paper connections → Find research synergies")
-    
-    # Dominant topics (appear in >50% of papers)
-    dominant_topics = [topic for topic, freq in topic_frequency.items() 
-                       if freq / len(fact_check_data['validated_summaries']) > 0.5]
-    
-    # Emerging topics (appear in 1 paper only)
-    emerging_topics = [topic for topic, freq in topic_frequency.items() if freq == 1]
-    
-    insight_generator_output['trend_analysis'] = {
-        'total_unique_topics': len(unique_topics),
-        'topic_diversity_score': len(unique_topics) / (len(all_topics) + 1),  # normalized
-        'topic_frequency_map': topic_frequency,
-        'dominant_themes': dominant_topics,
-        'emerging_areas': emerging_topics,
-        'average_relevance': round(avg_relevance, 4),
-        'verification_quality': verification_rate,
-        'identified_trends': []
-    }
-    
-    # Trend 1: Methodological trends
-    if any(ml_topic in unique_topics for ml_topic in ['deep learning', 'machine learning', 'CNN']):
-        insight_generator_output['trend_analysis']['identified_trends'].append({
-            'trend': 'AI/ML Dominance',
-            'description': 'AI and machine learning methods are primary methodological approach across research corpus',
-            'evidence': f"{len([t for t in all_topics if t in ['deep learning', 'machine learning', 'CNN']])} mentions across {len(fact_check_data['validated_summaries'])} papers",
-            'implication': 'Future research will likely continue leveraging AI/ML frameworks'
-        })
-    
-    # Trend 2: Application domain trends
-    if any(app_topic in unique_topics for app_topic in ['clinical decision support', 'medical imaging', 'electronic health records']):
-        insight_generator_output['trend_analysis']['identified_trends'].append({
-            'trend': 'Healthcare Application Focus',
-            'description': 'Strong emphasis on practical healthcare applications and clinical deployment',
-            'evidence': f"{len([t for t in all_topics if t in ['clinical decision support', 'medical imaging', 'electronic health records']])} healthcare-specific topics identified",
-            'implication': 'Research is transitioning from theory to clinical practice implementation'
-        })
-    
-    # Trend 3: Diversity and breadth
-    if len(unique_topics) >= 8:
-        insight_generator_output['trend_analysis']['identified_trends'].append({
-            'trend': 'Interdisciplinary Integration',
-            'description': f'High topic diversity ({len(unique_topics)} unique topics) indicates interdisciplinary research approach',
-            'evidence': f"Topics span {len(dominant_topics)} dominant themes and {len(emerging_topics)} emerging areas",
-            'implication': 'Research benefits from cross-domain knowledge integration'
-        })
-    
-    # Trend 4: Research quality
-    if verification_rate >= 0.9:
-        insight_generator_output['trend_analysis']['identified_trends'].append({
-            'trend': 'High Verification Quality',
-            'description': f'{verification_rate:.0%} verification rate indicates rigorous, evidence-based research',
-            'evidence': f"{int(verification_rate * len(fact_check_data['validated_summaries']))} of {len(fact_check_data['validated_summaries'])} papers fully verified",
-            'implication': 'Research corpus is suitable for meta-analysis and systematic review'
-        })
-    
-    print(f"\n   ✓ Identified trends: {len(insight_generator_output['trend_analysis']['identified_trends'])}")
-    print(f"   ✓ Dominant themes: {len(dominant_topics)}")
-    print(f"   ✓ Emerging areas: {len(emerging_topics)}")
-    
-    # ========================================================================
-    # STEP 3: Gap Analysis with Comparative Reasoning
-    # ========================================================================
-    print(f"\n{'=' * 80}")
-    print("STEP 3: GAP ANALYSIS (Comparative Reasoning)")
-    print("=" * 80)
-    
-    print(f"\n🔍 Comparative Analysis Framework:")
-    print(f"   Compare: Expected vs Observed coverage")
-    print(f"   Identify: Missing perspectives and underexplored areas")
-    print(f"   Recommend: Priority areas for future investigation")
-    
-    # Expected topics in AI healthcare research
-    expected_healthcare_ai_topics = {
-        'deep learning', 'machine learning', 'natural language processing',
-        'clinical decision support', 'medical imaging', 'electronic health records',
-        'predictive modeling', 'patient outcomes', 'data privacy', 'model interpretability',
-        'real-time systems', 'regulatory compliance', 'clinical validation',
-        'transfer learning', 'federated learning'
-    }
-    
-    covered_topics = unique_topics
-    missing_topics = expected_healthcare_ai_topics - covered_topics
-    
-    # Identify research gaps
-    research_gaps = []
-    
-    if 'model interpretability' in missing_topics or 'explainable AI' not in all_topics:
-        research_gaps.append({
-            'gap_type': 'Methodological Gap',
-            'description': 'Limited coverage of model interpretability and explainability',
-            'severity': 'High',
-            'rationale': 'Healthcare AI requires transparent decision-making for clinical adoption',
-            'recommendation': 'Include research on explainable AI methods and interpretation techniques'
-        })
-    
-    if 'data privacy' in missing_topics or 'federated learning' in missing_topics:
-        research_gaps.append({
-            'gap_type': 'Privacy & Security Gap',
-            'description': 'Insufficient focus on data privacy and federated learning approaches',
-            'severity': 'Medium-High',
-            'rationale': 'Patient data protection is critical for healthcare AI deployment',
-            'recommendation': 'Incorporate privacy-preserving ML and federated learning research'
-        })
-    
-    if 'clinical validation' in missing_topics or 'patient outcomes' in missing_topics:
-        research_gaps.append({
-            'gap_type': 'Validation Gap',
-            'description': 'Limited emphasis on clinical validation and patient outcome measurement',
-            'severity': 'Medium',
-            'rationale': 'Real-world effectiveness must be demonstrated beyond technical metrics',
-            'recommendation': 'Include clinical trial results and longitudinal outcome studies'
-        })
-    
-    if 'transfer learning' in missing_topics:
-        research_gaps.append({
-            'gap_type': 'Generalization Gap',
-            'description': 'Sparse coverage of transfer learning and domain adaptation',
-            'severity': 'Medium',
-            'rationale': 'Models must generalize across different clinical settings and populations',
-            'recommendation': 'Explore transfer learning for cross-institutional model deployment'
-        })
-    
-    insight_generator_output['gap_analysis'] = {
-        'expected_topics': list(expected_healthcare_ai_topics),
-        'covered_topics': list(covered_topics),
-        'missing_topics': list(missing_topics),
-        'coverage_rate': len(covered_topics.intersection(expected_healthcare_ai_topics)) / len(expected_healthcare_ai_topics),
-        'identified_gaps': research_gaps
-    }
-    
-    print(f"\n   ✓ Coverage rate: {insight_generator_output['gap_analysis']['coverage_rate']:.1%}")
-    print(f"   ✓ Identified gaps: {len(research_gaps)}")
-    print(f"   ✓ Missing topics: {len(missing_topics)}")
-    
-    # ========================================================================
-    # STEP 4: Comparative Findings
-    # ========================================================================
-    print(f"\n{'=' * 80}")
-    print("STEP 4: COMPARATIVE FINDINGS")
-    print("=" * 80)
-    
-    # Compare papers by contribution type
-    contribution_types = {}
-    for paper in insight_generator_output['paper_insights']:
-        ctype = paper['contribution_type']
-        if ctype not in contribution_types:
-            contribution_types[ctype] = []
-        contribution_types[ctype].append({
-            'paper_id': paper['paper_id'],
-            'title': paper['title'],
-            'relevance': paper['relevance_score']
-        })
-    
-    # Compare papers by maturity level
-    maturity_distribution = {}
-    for paper in insight_generator_output['paper_insights']:
-        mlevel = paper['maturity_level']
-        maturity_distribution[mlevel] = maturity_distribution.get(mlevel, 0) + 1
-    
-    insight_generator_output['comparative_findings'] = {
-        'by_contribution_type': contribution_types,
-        'by_maturity_level': maturity_distribution,
-        'relevance_comparison': {
-            'highest_relevance': max(all_relevance_scores),
-            'lowest_relevance': min(all_relevance_scores),
-            'relevance_range': max(all_relevance_scores) - min(all_relevance_scores),
-            'average': avg_relevance
-        },
-        'key_comparisons': []
-    }
-    
-    # Key comparison 1: Relevance consistency
-    if max(all_relevance_scores) - min(all_relevance_scores) < 0.1:
-        insight_generator_output['comparative_findings']['key_comparisons'].append({
-            'finding': 'Consistent Relevance Scores',
-            'description': f'Low variance in relevance ({max(all_relevance_scores) - min(all_relevance_scores):.4f}) indicates cohesive research focus',
-            'implication': 'Papers form unified corpus suitable for comprehensive review'
-        })
-    else:
-        insight_generator_output['comparative_findings']['key_comparisons'].append({
-            'finding': 'Variable Relevance Scores',
-            'description': f'Higher variance ({max(all_relevance_scores) - min(all_relevance_scores):.4f}) suggests diverse perspectives',
-            'implication': 'Consider filtering by relevance threshold for focused analysis'
-        })
-    
-    # Key comparison 2: Contribution diversity
-    if len(contribution_types) >= 3:
-        insight_generator_output['comparative_findings']['key_comparisons'].append({
-            'finding': 'Diverse Contribution Types',
-            'description': f'{len(contribution_types)} different contribution types present',
-            'implication': 'Corpus includes both theoretical foundations and practical applications'
-        })
-    
-    print(f"\n   ✓ Contribution types: {len(contribution_types)}")
-    print(f"   ✓ Maturity levels: {len(maturity_distribution)}")
-    print(f"   ✓ Key comparisons: {len(insight_generator_output['comparative_findings']['key_comparisons'])}")
-    
-    # ========================================================================
-    # STEP 5: Future Research Directions
-    # ========================================================================
-    print(f"\n{'=' * 80}")
-    print("STEP 5: FUTURE RESEARCH DIRECTIONS")
-    print("=" * 80)
-    
-    future_directions = []
-    
-    # Direction 1: Based on identified gaps
-    for gap in research_gaps:
-        future_directions.append({
-            'direction': f"Address {gap['gap_type']}",
-            'priority': gap['severity'],
-            'description': gap['recommendation'],
-            'rationale': gap['rationale'],
-            'expected_impact': 'High - Fills critical knowledge gap in current research landscape'
-        })
-    
-    # Direction 2: Based on emerging topics
-    if emerging_topics:
-        future_directions.append({
-            'direction': 'Expand Emerging Research Areas',
-            'priority': 'Medium',
-            'description': f"Deepen investigation into: {', '.join(emerging_topics[:3])}",
-            'rationale': 'These areas show initial promise but need more comprehensive study',
-            'expected_impact': 'Medium - Potential for breakthrough insights in underexplored domains'
-        })
-    
-    # Direction 3: Based on dominant themes
-    if dominant_topics:
-        future_directions.append({
-            'direction': 'Advanced Integration Studies',
-            'priority': 'High',
-            'description': f"Combine dominant themes ({', '.join(dominant_topics)}) in integrated systems",
-            'rationale': 'Leverage strengths of established areas for comprehensive solutions',
-            'expected_impact': 'High - Practical, deployable systems combining proven methodologies'
-        })
-    
-    # Direction 4: Cross-domain opportunities
-    future_directions.append({
-        'direction': 'Cross-Domain Knowledge Transfer',
-        'priority': 'Medium-High',
-        'description': 'Apply successful methods from one healthcare domain to others',
-        'rationale': f'With {len(unique_topics)} distinct topics, opportunities exist for knowledge transfer',
-        'expected_impact': 'Medium-High - Accelerates progress through adapted proven solutions'
-    })
-    
-    # Direction 5: Methodological advancement
-    if verification_rate == 1.0:
+        # Direction 1: Based on identified gaps
+        for gap in research_gaps:
+            future_directions.append({
+                'direction': f"Address {gap['gap_type']}",
+                'priority': gap['severity'],
+                'description': gap['recommendation'],
+                'rationale': gap['rationale'],
+                'expected_impact': 'High - Fills critical knowledge gap in current research landscape'
+            })
+        
+        # Direction 2: Based on emerging topics
+        if emerging_topics:
+            future_directions.append({
+                'direction': 'Expand Emerging Research Areas',
+                'priority': 'Medium',
+                'description': f"Deepen investigation into: {', '.join(emerging_topics[:3])}",
+                'rationale': 'These areas show initial promise but need more comprehensive study',
+                'expected_impact': 'Medium - Potential for breakthrough insights in underexplored domains'
+            })
+        
+        # Direction 3: Based on dominant themes
+        if dominant_topics:
+            future_directions.append({
+                'direction': 'Advanced Integration Studies',
+                'priority': 'High',
+                'description': f"Combine dominant themes ({', '.join(dominant_topics)}) in integrated systems",
+                'rationale': 'Leverage strengths of established areas for comprehensive solutions',
+                'expected_impact': 'High - Practical, deployable systems combining proven methodologies'
+            })
+        
+        # Direction 4: Cross-domain opportunities
         future_directions.append({
-            'direction': 'Advanced Methodological Research',
-            'priority': 'Medium',
-            'description': 'Build on solid foundation with next-generation methods',
-            'rationale': 'High verification quality enables confident advancement of state-of-the-art',
-            'expected_impact': 'High - Push boundaries of what\'s technically achievable'
+            'direction': 'Cross-Domain Knowledge Transfer',
+            'priority': 'Medium-High',
+            'description': 'Apply successful methods from one healthcare domain to others',
+            'rationale': f'With {len(unique_topics)} distinct topics, opportunities exist for knowledge transfer',
+            'expected_impact': 'Medium-High - Accelerates progress through adapted proven solutions'
         })
-    
-    insight_generator_output['future_research_directions'] = future_directions
-    
-    print(f"\n   ✓ Future directions identified: {len(future_directions)}")
-    print(f"   ✓ High priority directions: {len([d for d in future_directions if 'High' in d['priority']])}")
-    print(f"   ✓ Medium priority directions: {len([d for d in future_directions if 'Medium' in d['priority']])}")
+        
+        # Direction 5: Methodological advancement
+        if verification_rate == 1.0:
+            future_directions.append({
+                'direction': 'Advanced Methodological Research',
+                'priority': 'Medium',
+                'description': 'Build on solid foundation with next-generation methods',
+                'rationale': 'High verification quality enables confident advancement of state-of-the-art',
+                'expected_impact': 'High - Push boundaries of what\'s technically achievable'
+            })
+        
+        insight_generator_output['future_research_directions'] = future_directions
+        
+        print(f"\n   ✓ Future directions identified: {len(future_directions)}")
+        print(f"   ✓ High priority directions: {len([d for d in future_directions if 'High' in d['priority']])}")
+        print(f"   ✓ Medium priority directions: {len([d for d in future_directions if 'Medium' in d['priority']])}")
     
     # ========================================================================
     # FINAL SUMMARY
@@ -457,10 +671,16 @@ def insight_generator_agent(fact_check_data, summarization_data):
     print(f"   • Future directions: {len(insight_generator_output['future_research_directions'])}")
     print(f"=" * 80)
     
-    return insight_generator_output
+    return validate_handoff('insight_generator', insight_generator_output)
+
+# Entries go into this stage's own copy of the store, exported (and memoized) with its output
+handoff_store = handoff_store.copy()
 
 # Execute Advanced Insight Generator Agent
-insight_generator_output = insight_generator_agent(fact_check_output, summarization_output)
+with stage_tracer.span('agent.insight_generator', category='agent'):
+    insight_generator_output = insight_generator_agent(fact_check_output, summarization_output, handoff_store,
+                                                       topic_clusters=topic_clusters,
+                                                       deadline=run_deadline.stage('insight_generator'))
 
 print(f"\n\n📊 ADVANCED INSIGHT GENERATOR OUTPUT SUMMARY")
 print(f"{'=' * 80}")
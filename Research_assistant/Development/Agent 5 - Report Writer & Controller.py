@@ -5,7 +5,41 @@ print("=" * 80)
 print("AGENT 5: REPORT WRITER & CONTROLLER")
 print("=" * 80)
 
-def report_writer_agent(insight_data, fact_check_data, summarization_data, paper_reader_data):
+def iter_paper_reports(insight_data, handoff_store):
+    """
+    Build individual paper reports one at a time.
+    
+    Args:
+        insight_data: Insights from Insight Generator Agent
+        handoff_store: HandoffStore holding the summary and validation stages
+    
+    Yields:
+        Paper report dictionaries in insight order
+    """
+    for paper_insight in insight_data['paper_insights']:
+        paper_id = paper_insight['paper_id']
+        
+        # Get data from all previous agents
+        summary, validation = handoff_store.join(paper_id, 'summary', 'validation')
+        
+        yield {
+            'paper_id': paper_id,
+            'title': paper_insight['title'],
+            'verification_status': paper_insight['verification_status'],
+            'relevance_score': paper_insight['relevance_score'],
+            'key_topics': validation['claimed_topics'],
+            'summary_points': summary['summary_points'],
+            'insights': paper_insight['key_insights'],
+            'research_implications': paper_insight['research_implications'],
+            'quality_metrics': {
+                'topic_overlap': validation['topic_overlap_ratio'],
+                'verification': validation['verification_status'],
+                'semantic_relevance': summary['relevance_score']
+            }
+        }
+
+def report_writer_agent(insight_data, fact_check_data, summarization_data, paper_reader_data, handoff_store=None,
+                        retain_paper_reports=True, deadline=None, question_evidence=None):
     """
     Agent 5: Report Writer Agent
     Generates comprehensive report from all agent outputs.
@@ -16,10 +50,20 @@ def report_writer_agent(insight_data, fact_check_data, summarization_data, paper
         fact_check_data: Validation data from Fact-Check Agent
         summarization_data: Summary data from Summarization Agent
         paper_reader_data: Extracted data from Paper Reader Agent
+        handoff_store: HandoffStore keyed by paper_id; built from the agent outputs if not given
+        retain_paper_reports: Build and keep every paper report; when False the papers are
+            only counted and renderers build the reports once, streaming them from iter_paper_reports()
+        deadline: Optional stage Deadline; paper reports left when it passes are skipped
+        question_evidence: Optional per-question evidence from the RetrievalPlanner
     
     Returns:
         Final comprehensive research report
     """
+    # Fail fast if any upstream output drifted from its declared schema
+    for stage, data in [('paper_reader', paper_reader_data), ('summarization', summarization_data),
+                        ('fact_check', fact_check_data), ('insight_generator', insight_data)]:
+        AGENT_OUTPUT_SCHEMAS[stage].validate(data)
+    
     print(f"\n📄 Starting Report Writer Agent...")
     print(f"Received data from: {insight_data['agent']}")
     print(f"Compiling report for {insight_data['papers_analyzed']} papers\n")
@@ -40,19 +84,23 @@ def report_writer_agent(insight_data, fact_check_data, summarization_data, paper
         },
         'executive_summary': {},
         'paper_reports': [],
+        'papers_reported': 0,
         'synthesis': {},
+        'question_evidence': [],
         'report_complete': False
     }
     
     print(f"{'─' * 80}")
     print(f"📋 Generating Executive Summary...")
     
+    trend_analysis = insight_data['trend_analysis']
+    
     # Executive Summary
     report_output['executive_summary'] = {
         'overview': f"Analysis of {insight_data['papers_analyzed']} research papers on AI in Healthcare",
         'key_findings': [
-            f"Analyzed {insight_data['papers_analyzed']} papers with {insight_data['cross_paper_insights']['total_unique_topics']} unique topics",
-            f"Average semantic relevance: {insight_data['cross_paper_insights']['average_relevance']:.4f}",
+            f"Analyzed {insight_data['papers_analyzed']} papers with {trend_analysis['total_unique_topics']} unique topics",
+            f"Average semantic relevance: {trend_analysis['average_relevance']:.4f}",
             f"Verification rate: {fact_check_data['validation_metrics']['verification_rate']:.0%} - {fact_check_data['validation_metrics']['fully_verified']} papers fully verified",
             f"Topic diversity indicates comprehensive coverage of AI healthcare applications"
         ],
@@ -62,44 +110,64 @@ def report_writer_agent(insight_data, fact_check_data, summarization_data, paper
     print(f"   ✓ Overview generated")
     print(f"   ✓ Key findings: {len(report_output['executive_summary']['key_findings'])}")
     
+    # Sections cut short upstream to meet stage deadlines
+    incomplete_sections = []
+    for stage, data in [('paper_reader', paper_reader_data), ('summarization', summarization_data),
+                        ('fact_check', fact_check_data), ('insight_generator', insight_data)]:
+        if data.get('partial'):
+            sections = data.get('partial_sections', [])
+            if data.get('incomplete_papers') or not sections:
+                sections = ['papers'] + sections
+            incomplete_sections.extend(f"{stage}.{section}" for section in sections)
+    
+    # Paper-keyed joins against upstream agent outputs
+    if handoff_store is None:
+        handoff_store = HandoffStore()
+        handoff_store.put_many('summary', summarization_data['summaries'])
+        handoff_store.put_many('validation', fact_check_data['validated_summaries'])
+    
     # Generate individual paper reports
     print(f"\n{'─' * 80}")
     print(f"📑 Generating Individual Paper Reports...")
     
-    for paper_insight in insight_data['paper_insights']:
-        paper_id = paper_insight['paper_id']
-        
-        # Get data from all previous agents
-        summary = next(s for s in summarization_data['summaries'] if s['paper_id'] == paper_id)
-        validation = next(v for v in fact_check_data['validated_summaries'] if v['paper_id'] == paper_id)
-        
-        paper_report = {
-            'paper_id': paper_id,
-            'title': paper_insight['title'],
-            'verification_status': paper_insight['verification_status'],
-            'relevance_score': paper_insight['relevance_score'],
-            'key_topics': validation['claimed_topics'],
-            'summary_points': summary['summary_points'],
-            'insights': paper_insight['key_insights'],
-            'research_implications': paper_insight['research_implications'],
-            'quality_metrics': {
-                'topic_overlap': validation['topic_overlap_ratio'],
-                'verification': validation['verification_status'],
-                'semantic_relevance': summary['relevance_score']
-            }
-        }
-        
-        report_output['paper_reports'].append(paper_report)
-        print(f"   ✓ Report {paper_id}: {paper_insight['title'][:60]}...")
+    paper_reports = iter_paper_reports(insight_data, handoff_store) if retain_paper_reports else \
+        insight_data['paper_insights']
+    for paper_report in paper_reports:
+        if deadline is not None and deadline.expired():
+            mark_incomplete(report_output, deadline, sections=['paper_reports'])
+            incomplete_sections.append('report_writer.paper_reports')
+            break
+        if retain_paper_reports:
+            report_output['paper_reports'].append(paper_report)
+        report_output['papers_reported'] += 1
+        event_log.info('paper.reported', "   ✓ Report {paper_id}: {title:.60}...",
+                       paper_id=paper_report['paper_id'], title=paper_report['title'])
+    
+    # Evidence answering each research question
+    if question_evidence:
+        print(f"\n{'─' * 80}")
+        print(f"❓ Attaching Research Question Evidence...")
+        for entry in question_evidence:
+            report_output['question_evidence'].append({
+                'question': entry['question'],
+                'kind': entry['kind'],
+                'supporting_papers': sorted({item['paper_id'] for item in entry['evidence']}),
+                'evidence': entry['evidence']
+            })
+            event_log.info('question.evidence', "   ✓ {question:.60}: {chunks} chunks",
+                           question=entry['question'], chunks=len(entry['evidence']))
     
     # Synthesis section
     print(f"\n{'─' * 80}")
     print(f"🔗 Generating Synthesis & Recommendations...")
     
     report_output['synthesis'] = {
-        'cross_cutting_themes': insight_data['cross_paper_insights']['topic_diversity'],
-        'trend_analysis': insight_data['cross_paper_insights']['trend_analysis'],
-        'recommendations': insight_data['cross_paper_insights']['recommendations'],
+        'cross_cutting_themes': list(trend_analysis['topic_frequency_map']),
+        'trend_analysis': [f"{trend['trend']}: {trend['description']}" for trend in trend_analysis['identified_trends']],
+        'recommendations': [
+            f"{direction['direction']} ({direction['priority']} priority): {direction['description']}"
+            for direction in insight_data['future_research_directions']
+        ],
         'research_gaps': [
             "Consider longitudinal studies on AI implementation outcomes",
             "Explore interdisciplinary perspectives on AI ethics in healthcare",
@@ -112,7 +180,8 @@ def report_writer_agent(insight_data, fact_check_data, summarization_data, paper
         ]
     }
     
-    report_output['report_complete'] = True
+    report_output['incomplete_sections'] = incomplete_sections
+    report_output['report_complete'] = not incomplete_sections
     
     print(f"   ✓ Cross-cutting themes: {len(report_output['synthesis']['cross_cutting_themes'])} topics")
     print(f"   ✓ Trends identified: {len(report_output['synthesis']['trend_analysis'])}")
@@ -120,21 +189,30 @@ def report_writer_agent(insight_data, fact_check_data, summarization_data, paper
     
     print(f"\n{'=' * 80}")
     print(f"✅ Report Writer Agent Complete")
-    print(f"   • Papers in report: {len(report_output['paper_reports'])}")
+    print(f"   • Papers in report: {report_output['papers_reported']}")
     print(f"   • Executive summary: ✓")
     print(f"   • Synthesis & recommendations: ✓")
+    print(f"   • Research question evidence: {len(report_output['question_evidence'])} items")
     print(f"   • Report status: {'COMPLETE' if report_output['report_complete'] else 'INCOMPLETE'}")
+    if incomplete_sections:
+        print(f"   • Incomplete sections: {', '.join(incomplete_sections)}")
     print(f"=" * 80)
     
-    return report_output
+    return validate_handoff('report_writer', report_output)
 
 # Execute Report Writer Agent (acts as controller coordinating all previous agents)
-report_writer_output = report_writer_agent(
-    insight_generator_output,
-    fact_check_output,
-    summarization_output,
-    paper_reader_output
-)
+with stage_tracer.span('agent.report_writer', category='agent'):
+    report_writer_output = report_writer_agent(
+        insight_generator_output,
+        fact_check_output,
+        summarization_output,
+        paper_reader_output,
+        handoff_store,
+        # The report block builds the paper reports from iter_paper_reports(); only count them here
+        retain_paper_reports=False,
+        deadline=run_deadline.stage('report_writer'),
+        question_evidence=question_evidence
+    )
 
 print(f"\n\n" + "=" * 80)
 print(f"CONTROLLER ORCHESTRATION COMPLETE")
@@ -0,0 +1,97 @@
+from dataclasses import dataclass, fields, replace
+from typing import Optional
+
+print("=" * 80)
+print("AGENT HANDOFF STORE")
+print("=" * 80)
+
+@dataclass(slots=True)
+class PaperRecord:
+    """Per-paper handoff record holding the entry each agent produced for the paper."""
+    paper_id: int
+    title: str = ''
+    reader: Optional[dict] = None
+    summary: Optional[dict] = None
+    validation: Optional[dict] = None
+    enhanced_validation: Optional[dict] = None
+    insight: Optional[dict] = None
+
+HANDOFF_STAGES = tuple(f.name for f in fields(PaperRecord) if f.name not in ('paper_id', 'title'))
+
+class HandoffStore:
+    """
+    Shared store of agent outputs keyed by paper_id.
+
+    Agents write their per-paper entries with put() and downstream agents join
+    across stages with dictionary lookups instead of scanning upstream lists.
+    Each agent stage writes into its own copy(), so a store is never changed
+    after the stage that produced it finished and can be memoized with it.
+    """
+    __slots__ = ('_records',)
+
+    def __init__(self):
+        self._records = {}
+
+    def record(self, paper_id):
+        """Return the record for a paper, creating it on first access."""
+        record = self._records.get(paper_id)
+        if record is None:
+            record = self._records.setdefault(paper_id, PaperRecord(paper_id))
+        return record
+
+    def copy(self):
+        """Store with its own records; the per-stage entries are shared, not copied."""
+        store = HandoffStore()
+        store._records = {paper_id: replace(record) for paper_id, record in self._records.items()}
+        return store
+
+    def put(self, stage, entry):
+        """
+        Store an agent's per-paper entry.
+
+        Args:
+            stage: One of HANDOFF_STAGES
+            entry: Per-paper dictionary with at least a paper_id key
+        """
+        if stage not in HANDOFF_STAGES:
+            raise ValueError(f"Unknown handoff stage '{stage}', expected one of {HANDOFF_STAGES}")
+        record = self.record(entry['paper_id'])
+        if not record.title:
+            record.title = entry.get('title', '')
+        setattr(record, stage, entry)
+
+    def put_many(self, stage, entries):
+        """Store a list of per-paper entries for a stage."""
+        for entry in entries:
+            self.put(stage, entry)
+        return self
+
+    def get(self, paper_id, stage):
+        """Return a paper's entry for a stage, or None if it was not produced."""
+        record = self._records.get(paper_id)
+        return getattr(record, stage) if record is not None else None
+
+    def join(self, paper_id, *stages):
+        """Return the entries of several stages for one paper as a tuple."""
+        record = self._records[paper_id]
+        return tuple(getattr(record, stage) for stage in stages)
+
+    def __getitem__(self, paper_id):
+        return self._records[paper_id]
+
+    def __contains__(self, paper_id):
+        return paper_id in self._records
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    def __len__(self):
+        return len(self._records)
+
+# Empty store; Agents 1-4 each export a copy with their entries added, read by the downstream agents
+handoff_store = HandoffStore()
+
+print(f"\n✅ Handoff store ready: 'handoff_store'")
+print(f"   Record type: PaperRecord (slots)")
+print(f"   Stages: {', '.join(HANDOFF_STAGES)}")
+print("=" * 80)
@@ -0,0 +1,367 @@
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # checkpoints fall back to pickle without msgpack
+    msgpack = None
+
+print("=" * 80)
+print("AGENT OUTPUT SCHEMAS & CHECKPOINTS")
+print("=" * 80)
+
+# Checkpointing is enabled by pointing this variable at a directory
+CHECKPOINT_DIR = os.environ.get('RESEARCH_CHECKPOINT_DIR')
+# Per-thread override of CHECKPOINT_DIR for handoffs (see checkpoint_directory)
+_handoff_checkpoints = threading.local()
+
+NUMBER = (int, float, np.integer, np.floating)
+BOOL = (bool, np.bool_)
+
+class SchemaValidationError(ValueError):
+    """Raised when an agent output does not match its declared schema."""
+
+    def __init__(self, schema_name, version, problems):
+        self.schema_name = schema_name
+        self.version = version
+        self.problems = problems
+        listed = '\n'.join(f"  - {problem}" for problem in problems[:20])
+        more = f"\n  ... and {len(problems) - 20} more" if len(problems) > 20 else ''
+        super().__init__(f"{schema_name} v{version}: {len(problems)} schema violation(s)\n{listed}{more}")
+
+@dataclass(frozen=True)
+class Nullable:
+    """Field that may be None or match the wrapped spec."""
+    spec: object
+
+@dataclass(frozen=True)
+class MapOf:
+    """Dictionary with arbitrary string keys whose values match spec."""
+    spec: object
+
+def _check(value, spec, path, problems):
+    """Recursively collect mismatches between a value and a type spec."""
+    if isinstance(spec, Nullable):
+        if value is not None:
+            _check(value, spec.spec, path, problems)
+    elif isinstance(spec, MapOf):
+        if not isinstance(value, dict):
+            problems.append(f"{path}: expected mapping, got {type(value).__name__}")
+            return
+        for key, item in value.items():
+            _check(item, spec.spec, f"{path}[{key!r}]", problems)
+    elif isinstance(spec, dict):
+        if not isinstance(value, dict):
+            problems.append(f"{path}: expected object, got {type(value).__name__}")
+            return
+        for key, field_spec in spec.items():
+            if key not in value:
+                problems.append(f"{path}.{key}: missing required field")
+            else:
+                _check(value[key], field_spec, f"{path}.{key}", problems)
+    elif isinstance(spec, list):
+        if not isinstance(value, (list, tuple)):
+            problems.append(f"{path}: expected list, got {type(value).__name__}")
+            return
+        for idx, item in enumerate(value):
+            _check(item, spec[0], f"{path}[{idx}]", problems)
+    elif not isinstance(value, spec):
+        expected = ' | '.join(t.__name__ for t in spec) if isinstance(spec, tuple) else spec.__name__
+        problems.append(f"{path}: expected {expected}, got {type(value).__name__}")
+
+@dataclass(frozen=True)
+class AgentOutputSchema:
+    """
+    Versioned description of one agent's output dictionary.
+
+    Fields map to a type (or tuple of types), a nested dict schema, a
+    one-element list for homogeneous lists, or a Nullable / MapOf wrapper.
+    Keys not named in the schema are allowed so agents can add fields
+    without a version bump; removing or retyping a field requires one.
+    """
+    name: str
+    version: int
+    fields: dict
+
+    def validate(self, output):
+        """
+        Check an output against the schema.
+
+        Args:
+            output: Agent output dictionary
+
+        Returns:
+            The output, unchanged
+
+        Raises:
+            SchemaValidationError: If any field is missing or has the wrong type
+        """
+        problems = []
+        _check(output, self.fields, self.name, problems)
+        if problems:
+            raise SchemaValidationError(self.name, self.version, problems)
+        return output
+
+CHUNK_REFERENCE = {'chunk_id': str, 'similarity': NUMBER, 'text_preview': str}
+
+AGENT_OUTPUT_SCHEMAS = {schema.name: schema for schema in [
+    AgentOutputSchema('paper_reader', 1, {
+        'agent': str,
+        'timestamp': str,
+        'papers_processed': int,
+        'extracted_papers': [{
+            'paper_id': int,
+            'title': str,
+            'abstract': str,
+            'keywords': [str],
+            'abstract_length': int,
+            'keyword_count': int,
+            'relevant_chunks': [CHUNK_REFERENCE]
+        }]
+    }),
+    AgentOutputSchema('summarization', 1, {
+        'agent': str,
+        'timestamp': str,
+        'input_agent': str,
+        'papers_summarized': int,
+        'summarization_method': str,
+        'summaries': [{
+            'paper_id': int,
+            'title': str,
+            'key_topics': [str],
+            'summary_points': [str],
+            'relevance_score': NUMBER,
+            'top_chunk': Nullable(CHUNK_REFERENCE)
+        }],
+        'aggregate_insights': {
+            'average_relevance': NUMBER,
+            'unique_topics': int,
+            'total_summary_points': int
+        }
+    }),
+    AgentOutputSchema('fact_check', 1, {
+        'agent': str,
+        'timestamp': str,
+        'input_agent': str,
+        'papers_validated': int,
+        'validated_summaries': [{
+            'paper_id': int,
+            'title': str,
+            'topics_verified': BOOL,
+            'summary_verified': BOOL,
+            'topic_overlap_ratio': NUMBER,
+            'summary_ngram_coverage': NUMBER,
+            'relevance_score': NUMBER,
+            'verification_status': str,
+            'claimed_topics': [str],
+            'actual_keywords': [str],
+            'validation_notes': [str]
+        }],
+        'validation_metrics': {
+            'total_validated': int,
+            'fully_verified': int,
+            'partially_verified': int,
+            'average_topic_overlap': NUMBER,
+            'verification_rate': NUMBER
+        }
+    }),
+    AgentOutputSchema('enhanced_fact_check', 1, {
+        'agent': str,
+        'timestamp': str,
+        'papers_validated': int,
+        'validated_claims': [{
+            'paper_id': int,
+            'title': str,
+            'validation_status': str,
+            'confidence_score': NUMBER,
+            'cross_reference_results': [{
+                'claim': str,
+                'confidence_score': NUMBER,
+                'hallucination_flag': BOOL,
+                'inconsistency_flag': BOOL,
+                'flag_reason': Nullable(str)
+            }],
+            'hallucination_flags': int,
+            'inconsistency_flags': int,
+            'inconsistency_details': [str]
+        }],
+        'validation_metrics': {
+            'total_papers_validated': int,
+            'total_claims_checked': int,
+            'average_confidence_score': NUMBER,
+            'verification_rate': NUMBER
+        }
+    }),
+    AgentOutputSchema('insight_generator', 1, {
+        'agent': str,
+        'timestamp': str,
+        'input_agent': str,
+        'papers_analyzed': int,
+        'paper_insights': [{
+            'paper_id': int,
+            'title': str,
+            'verification_status': str,
+            'relevance_score': NUMBER,
+            'key_insights': [str],
+            'research_implications': [str],
+            'contribution_type': str,
+            'maturity_level': str
+        }],
+        'trend_analysis': {
+            'total_unique_topics': int,
+            'topic_frequency_map': MapOf(int),
+            'dominant_themes': [str],
+            'emerging_areas': [str],
+            'average_relevance': NUMBER,
+            'identified_trends': [{'trend': str, 'description': str, 'evidence': str, 'implication': str}]
+        },
+        'gap_analysis': {
+            'expected_topics': [str],
+            'missing_topics': [str],
+            'coverage_rate': NUMBER,
+            'identified_gaps': [{'gap_type': str, 'description': str, 'severity': str}]
+        },
+        'comparative_findings': {
+            'key_comparisons': [{'finding': str, 'description': str}]
+        },
+        'future_research_directions': [{
+            'direction': str,
+            'priority': str,
+            'description': str,
+            'rationale': str
+        }]
+    }),
+    AgentOutputSchema('report_writer', 1, {
+        'agent': str,
+        'timestamp': str,
+        'report_metadata': {'total_papers': int, 'generation_date': str, 'agent_pipeline': [str]},
+        'executive_summary': {'overview': str, 'key_findings': [str], 'methodology': str},
+        'paper_reports': [dict],
+        'papers_reported': int,
+        'synthesis': {
+            'cross_cutting_themes': [str],
+            'trend_analysis': [str],
+            'recommendations': [str],
+            'research_gaps': [str],
+            'future_directions': [str]
+        },
+        'report_complete': BOOL
+    })
+]}
+
+def validate_handoff(stage, output):
+    """
+    Validate an agent output at a handoff, stamp its schema version and checkpoint it.
+
+    Args:
+        stage: Schema name, e.g. 'summarization'
+        output: Agent output dictionary
+
+    Returns:
+        The validated output
+    """
+    schema = AGENT_OUTPUT_SCHEMAS[stage]
+    schema.validate(output)
+    output['schema_version'] = schema.version
+    directory = getattr(_handoff_checkpoints, 'directory', CHECKPOINT_DIR)
+    if directory:
+        save_checkpoint(stage, output, directory)
+    return output
+
+@contextmanager
+def checkpoint_directory(directory):
+    """
+    Redirect the handoff checkpoints written by the current thread.
+
+    Args:
+        directory: Checkpoint directory for this thread, or None to disable checkpointing
+    """
+    previous = getattr(_handoff_checkpoints, 'directory', CHECKPOINT_DIR)
+    _handoff_checkpoints.directory = directory
+    try:
+        yield directory
+    finally:
+        _handoff_checkpoints.directory = previous
+
+def _msgpack_default(value):
+    """Convert numpy values and sets into msgpack-native types."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def checkpoint_path(stage, directory=None):
+    """Checkpoint file for a stage at its current schema version."""
+    extension = 'msgpack' if msgpack is not None else 'pkl'
+    version = AGENT_OUTPUT_SCHEMAS[stage].version
+    return os.path.join(directory or CHECKPOINT_DIR or 'checkpoints', f"{stage}.v{version}.{extension}")
+
+def save_checkpoint(stage, output, directory=None):
+    """
+    Validate and write an agent output as a compact binary checkpoint.
+
+    Args:
+        stage: Schema name
+        output: Agent output dictionary
+        directory: Target directory (defaults to CHECKPOINT_DIR)
+
+    Returns:
+        Path of the checkpoint file
+    """
+    schema = AGENT_OUTPUT_SCHEMAS[stage]
+    schema.validate(output)
+    envelope = {
+        'stage': stage,
+        'schema_version': schema.version,
+        'saved_at': datetime.now().isoformat(),
+        'payload': output
+    }
+    path = checkpoint_path(stage, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        if msgpack is not None:
+            f.write(msgpack.packb(envelope, default=_msgpack_default, use_bin_type=True))
+        else:
+            pickle.dump(envelope, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+def load_checkpoint(stage, directory=None):
+    """
+    Load and re-validate a stage checkpoint.
+
+    Args:
+        stage: Schema name
+        directory: Checkpoint directory (defaults to CHECKPOINT_DIR)
+
+    Returns:
+        The agent output dictionary
+
+    Raises:
+        SchemaValidationError: If the checkpoint was written under another schema version
+    """
+    schema = AGENT_OUTPUT_SCHEMAS[stage]
+    with open(checkpoint_path(stage, directory), 'rb') as f:
+        if msgpack is not None:
+            envelope = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+        else:
+            envelope = pickle.load(f)
+    if envelope['schema_version'] != schema.version:
+        raise SchemaValidationError(stage, schema.version, [
+            f"checkpoint written with schema v{envelope['schema_version']}"
+        ])
+    return schema.validate(envelope['payload'])
+
+print(f"\n✅ Registered {len(AGENT_OUTPUT_SCHEMAS)} agent output schemas")
+for schema in AGENT_OUTPUT_SCHEMAS.values():
+    print(f"   • {schema.name} v{schema.version}: {len(schema.fields)} top-level fields")
+print(f"\n💾 Checkpoint format: {'msgpack' if msgpack is not None else 'pickle'}")
+print(f"   Checkpointing: {'enabled → ' + CHECKPOINT_DIR if CHECKPOINT_DIR else 'disabled (set RESEARCH_CHECKPOINT_DIR)'}")
+print("=" * 80)
@@ -1,6 +1,10 @@
 import pandas as pd
 
-def create_chunks(paper_data, chunk_size=100, overlap=20):
+# Segmentation parameters (declared in stages.yaml, part of the stage cache key)
+CHUNK_SIZE = 100
+CHUNK_OVERLAP = 20
+
+def create_chunks(paper_data, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP):
     """
     Segment text into overlapping chunks based on token count.
     
@@ -34,7 +38,9 @@ def create_chunks(paper_data, chunk_size=100, overlap=20):
             'chunk_tokens': chunk_tokens,
             'token_count': len(chunk_tokens),
             'chunk_text': chunk_text,
-            'position': chunk_id
+            'position': chunk_id,
+            'token_start': start_idx,
+            'token_end': end_idx
         })
         
         chunk_id += 1
@@ -53,22 +59,31 @@ print("=" * 80)
 print("TEXT CHUNK SEGMENTATION")
 print("=" * 80)
 print("\nSegmentation Parameters:")
-print("  - Chunk size: 100 tokens")
-print("  - Overlap: 20 tokens")
+print(f"  - Chunk size: {CHUNK_SIZE} tokens")
+print(f"  - Overlap: {CHUNK_OVERLAP} tokens")
 print("=" * 80)
 
-for paper_data in processed_papers:
-    paper_chunks = create_chunks(paper_data, chunk_size=100, overlap=20)
-    all_text_chunks.extend(paper_chunks)
-    
-    print(f"\n📄 Paper {paper_data['paper_id']}: {paper_data['title'][:60]}...")
-    print(f"   Total tokens: {paper_data['token_count']}")
-    print(f"   Generated chunks: {len(paper_chunks)}")
-    
-    for chunk in paper_chunks:
-        print(f"\n   Chunk {chunk['chunk_id']}:")
-        print(f"     - Tokens: {chunk['token_count']}")
-        print(f"     - Preview: {chunk['chunk_text'][:120]}...")
+with stage_tracer.span('chunking.segment_papers', papers=len(processed_papers)):
+    for paper_data in processed_papers:
+        paper_chunks = create_chunks(paper_data, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP)
+        all_text_chunks.extend(paper_chunks)
+        
+        event_log.info(
+            'paper.chunked',
+            "\n📄 Paper {paper_id}: {title:.60}...\n   Total tokens: {token_count}\n   Generated chunks: {chunks}",
+            paper_id=paper_data['paper_id'], title=paper_data['title'], token_count=paper_data['token_count'],
+            chunks=len(paper_chunks)
+        )
+        
+        # Per-chunk previews only at DEBUG level
+        if event_log.enabled_for('DEBUG'):
+            for chunk in paper_chunks:
+                event_log.debug(
+                    'chunk.created',
+                    "\n   Chunk {chunk_id}:\n     - Tokens: {token_count}\n     - Preview: {preview}...",
+                    chunk_id=chunk['chunk_id'], paper_id=chunk['paper_id'], token_count=chunk['token_count'],
+                    preview=chunk['chunk_text'][:120]
+                )
 
 # Create structured DataFrame for easy access
 chunks_df = pd.DataFrame([
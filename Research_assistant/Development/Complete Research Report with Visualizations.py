@@ -1,3 +1,4 @@
+from itertools import islice
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 
@@ -20,237 +21,47 @@ print("COMPREHENSIVE RESEARCH REPORT")
 print("AI IN HEALTHCARE: MULTI-AGENT ANALYSIS")
 print("=" * 100)
 
-# ===== ABSTRACT =====
-print("\n" + "=" * 100)
-print("ABSTRACT")
-print("=" * 100)
+# Headline quantitative findings come straight from the numeric fact table
+headline_facts = numeric_fact_table.facts[numeric_fact_table.facts['qualifier'] == 'change']
+headline_findings = ' and '.join(
+    f"{row.span} (Paper {row.paper_id})" for row in headline_facts.itertuples()
+) or 'no corpus-level effect sizes reported'
+
+# Report text, defined before the renderer block so its multi-line strings are not indented
+first_paper_report = next(iter_paper_reports(insight_generator_output, handoff_store), None)
+verification_level = first_paper_report['quality_metrics']['verification'][:4].lower() if first_paper_report else 'no'
+
 abstract_text = f"""
 This comprehensive research report presents a systematic analysis of {report_writer_output['report_metadata']['total_papers']} 
 research papers examining artificial intelligence applications in healthcare. Utilizing a multi-agent analytical 
 pipeline consisting of {len(report_writer_output['report_metadata']['agent_pipeline'])} specialized agents (Paper Reader, 
-Summarization, Fact-Check, Insight Generator, and Report Writer), this study achieves {report_writer_output['paper_reports'][0]['quality_metrics']['verification'][:4].lower()} 
+Summarization, Fact-Check, Insight Generator, and Report Writer), this study achieves {verification_level} 
 verification of all analyzed papers with an average semantic relevance score of 0.185.
 
 The analysis reveals {len(report_writer_output['synthesis']['cross_cutting_themes'])} distinct research themes spanning 
 medical imaging, clinical decision support systems, and natural language processing for electronic health records. 
-Key findings demonstrate that AI systems achieve diagnostic accuracy comparable to expert clinicians, with clinical 
-decision support systems improving diagnostic accuracy by 23% and reducing medical errors by 37%.
+Key findings demonstrate that AI systems achieve diagnostic accuracy comparable to expert clinicians, with reported 
+effects including: {headline_findings}.
 
 This report synthesizes methodological approaches, identifies cross-cutting themes, validates research claims, and 
 provides strategic recommendations for future research directions in AI-healthcare integration.
 """
-print(abstract_text)
-
-# ===== LITERATURE REVIEW =====
-print("\n" + "=" * 100)
-print("LITERATURE REVIEW")
-print("=" * 100)
 
 lit_review_intro = """
 The integration of artificial intelligence in healthcare represents a paradigm shift in medical practice, research, 
 and patient care delivery. This literature review examines three foundational studies that collectively demonstrate 
 the breadth and depth of AI applications across clinical domains.
 """
-print(lit_review_intro)
-
-for idx, paper in enumerate(report_writer_output['paper_reports'], 1):
-    print(f"\n{idx}. {paper['title']}")
-    print("-" * 100)
-    print(f"   Verification Status: {paper['verification_status']} | Relevance Score: {paper['relevance_score']:.4f}")
-    print(f"   Key Topics: {', '.join(paper['key_topics'])}")
-    print("\n   Summary:")
-    for point in paper['summary_points']:
-        print(f"   • {point.strip()}")
-    print("\n   Research Implications:")
-    for implication in paper['research_implications']:
-        print(f"   → {implication}")
-    print("\n   Quality Metrics:")
-    print(f"   - Topic Overlap: {paper['quality_metrics']['topic_overlap']*100:.0f}%")
-    print(f"   - Verification: {paper['quality_metrics']['verification']}")
-    print(f"   - Semantic Relevance: {paper['quality_metrics']['semantic_relevance']:.4f}")
-
-# ===== FINDINGS =====
-print("\n" + "=" * 100)
-print("FINDINGS")
-print("=" * 100)
 
 findings_intro = """
 The multi-agent analysis pipeline reveals several critical findings regarding the current state of AI in healthcare 
 research. These findings are organized by thematic areas and supported by quantitative verification metrics.
 """
-print(findings_intro)
-
-print("\nKey Findings:")
-for idx, finding in enumerate(report_writer_output['executive_summary']['key_findings'], 1):
-    print(f"{idx}. {finding}")
-
-print("\n\nCross-Cutting Research Themes:")
-themes = report_writer_output['synthesis']['cross_cutting_themes']
-for idx, theme in enumerate(themes, 1):
-    print(f"{idx}. {theme.title()}")
 
-print("\n\nTrend Analysis:")
-for trend in report_writer_output['synthesis']['trend_analysis']:
-    print(f"• {trend}")
-
-print("\n\nMethodological Assessment:")
-print(f"Pipeline: {report_writer_output['executive_summary']['methodology']}")
-print(f"Total Papers Analyzed: {report_writer_output['report_metadata']['total_papers']}")
-print(f"Verification Rate: 100%")
-print(f"Average Semantic Relevance: 0.185")
-
-# ===== VISUALIZATIONS OF KEY FINDINGS =====
-print("\n" + "=" * 100)
-print("VISUAL ANALYSIS OF KEY FINDINGS")
-print("=" * 100)
-
-# Visualization 1: Paper Quality Metrics Comparison
-quality_fig = plt.figure(figsize=(12, 6), facecolor=BACKGROUND)
-ax1 = quality_fig.add_subplot(111, facecolor=BACKGROUND)
-
-paper_ids = [f"Paper {p['paper_id']}" for p in report_writer_output['paper_reports']]
-relevance_scores = [p['relevance_score'] for p in report_writer_output['paper_reports']]
-topic_overlaps = [p['quality_metrics']['topic_overlap'] for p in report_writer_output['paper_reports']]
-
-x_pos = range(len(paper_ids))
-width = 0.35
-
-bars1 = ax1.bar([x - width/2 for x in x_pos], relevance_scores, width, 
-                color=ZERVE_BLUE, label='Semantic Relevance', alpha=0.9)
-bars2 = ax1.bar([x + width/2 for x in x_pos], topic_overlaps, width, 
-                color=ZERVE_GREEN, label='Topic Overlap', alpha=0.9)
-
-ax1.set_xlabel('Research Papers', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax1.set_ylabel('Score', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax1.set_title('Research Paper Quality Metrics Comparison', fontsize=14, color=PRIMARY_TEXT, 
-              fontweight='bold', pad=20)
-ax1.set_xticks(x_pos)
-ax1.set_xticklabels(paper_ids, color=PRIMARY_TEXT, fontsize=10)
-ax1.tick_params(axis='y', labelcolor=PRIMARY_TEXT)
-ax1.spines['top'].set_visible(False)
-ax1.spines['right'].set_visible(False)
-ax1.spines['left'].set_color(SECONDARY_TEXT)
-ax1.spines['bottom'].set_color(SECONDARY_TEXT)
-ax1.legend(frameon=False, labelcolor=PRIMARY_TEXT, fontsize=10)
-ax1.grid(axis='y', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
-
-for bar in bars1:
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-            f'{height:.3f}', ha='center', va='bottom', 
-            color=PRIMARY_TEXT, fontsize=9)
-
-for bar in bars2:
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-            f'{height:.2f}', ha='center', va='bottom', 
-            color=PRIMARY_TEXT, fontsize=9)
-
-plt.tight_layout()
-print("\n✓ Visualization 1: Paper Quality Metrics Comparison")
-
-# Visualization 2: Research Theme Distribution
-theme_fig = plt.figure(figsize=(14, 7), facecolor=BACKGROUND)
-ax2 = theme_fig.add_subplot(111, facecolor=BACKGROUND)
-
-themes_sorted = report_writer_output['synthesis']['cross_cutting_themes']
-theme_names = [t.replace('_', ' ').title() for t in themes_sorted]
-theme_count = len(themes_sorted)
-theme_frequencies = [1] * theme_count  # All appear once in our dataset
-
-colors_theme = [ZERVE_BLUE, ZERVE_ORANGE, ZERVE_GREEN, ZERVE_CORAL, ZERVE_LAVENDER, 
-                ZERVE_DARK_BLUE, ZERVE_BLUE, ZERVE_ORANGE, ZERVE_GREEN][:theme_count]
-
-bars_theme = ax2.barh(theme_names, theme_frequencies, color=colors_theme, alpha=0.9)
-
-ax2.set_xlabel('Frequency Across Papers', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax2.set_ylabel('Research Themes', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax2.set_title('Distribution of Research Themes Across Analyzed Papers', fontsize=14, 
-              color=PRIMARY_TEXT, fontweight='bold', pad=20)
-ax2.tick_params(axis='both', labelcolor=PRIMARY_TEXT, labelsize=10)
-ax2.spines['top'].set_visible(False)
-ax2.spines['right'].set_visible(False)
-ax2.spines['left'].set_color(SECONDARY_TEXT)
-ax2.spines['bottom'].set_color(SECONDARY_TEXT)
-ax2.grid(axis='x', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
-
-for bar in bars_theme:
-    width_val = bar.get_width()
-    ax2.text(width_val, bar.get_y() + bar.get_height()/2.,
-            f' {int(width_val)}', ha='left', va='center', 
-            color=PRIMARY_TEXT, fontsize=10, fontweight='bold')
-
-plt.tight_layout()
-print("✓ Visualization 2: Research Theme Distribution")
-
-# Visualization 3: Verification Status Overview
-verification_fig = plt.figure(figsize=(10, 6), facecolor=BACKGROUND)
-ax3 = verification_fig.add_subplot(111, facecolor=BACKGROUND)
-
-verification_categories = ['Fully Verified', 'Partially Verified', 'Not Verified']
-verification_counts = [3, 0, 0]  # All 3 papers fully verified
-colors_verification = [SUCCESS, HIGHLIGHT, WARNING]
-
-bars_verify = ax3.bar(verification_categories, verification_counts, 
-                      color=colors_verification, alpha=0.9, width=0.6)
-
-ax3.set_ylabel('Number of Papers', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax3.set_title('Research Paper Verification Status Distribution', fontsize=14, 
-              color=PRIMARY_TEXT, fontweight='bold', pad=20)
-ax3.set_ylim(0, 4)
-ax3.tick_params(axis='both', labelcolor=PRIMARY_TEXT, labelsize=10)
-ax3.spines['top'].set_visible(False)
-ax3.spines['right'].set_visible(False)
-ax3.spines['left'].set_color(SECONDARY_TEXT)
-ax3.spines['bottom'].set_color(SECONDARY_TEXT)
-ax3.grid(axis='y', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
-
-for bar in bars_verify:
-    height = bar.get_height()
-    if height > 0:
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}', ha='center', va='bottom', 
-                color=PRIMARY_TEXT, fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-print("✓ Visualization 3: Verification Status Overview")
-
-# Visualization 4: Multi-Agent Pipeline Performance
-pipeline_fig = plt.figure(figsize=(12, 6), facecolor=BACKGROUND)
-ax4 = pipeline_fig.add_subplot(111, facecolor=BACKGROUND)
-
-pipeline_stages = report_writer_output['report_metadata']['agent_pipeline']
-pipeline_performance = [100, 100, 100, 100, 100]  # All stages completed successfully
-colors_pipeline = [ZERVE_BLUE, ZERVE_ORANGE, ZERVE_GREEN, ZERVE_CORAL, ZERVE_LAVENDER]
-
-bars_pipeline = ax4.barh(pipeline_stages, pipeline_performance, 
-                         color=colors_pipeline, alpha=0.9)
-
-ax4.set_xlabel('Completion Rate (%)', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax4.set_ylabel('Agent Pipeline Stage', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
-ax4.set_title('Multi-Agent Analysis Pipeline Performance', fontsize=14, 
-              color=PRIMARY_TEXT, fontweight='bold', pad=20)
-ax4.set_xlim(0, 105)
-ax4.tick_params(axis='both', labelcolor=PRIMARY_TEXT, labelsize=10)
-ax4.spines['top'].set_visible(False)
-ax4.spines['right'].set_visible(False)
-ax4.spines['left'].set_color(SECONDARY_TEXT)
-ax4.spines['bottom'].set_color(SECONDARY_TEXT)
-ax4.grid(axis='x', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
-
-for bar in bars_pipeline:
-    width_val = bar.get_width()
-    ax4.text(width_val - 5, bar.get_y() + bar.get_height()/2.,
-            f'{int(width_val)}%', ha='right', va='center', 
-            color=PRIMARY_TEXT, fontsize=11, fontweight='bold')
-
-plt.tight_layout()
-print("✓ Visualization 4: Multi-Agent Pipeline Performance")
-
-# ===== CONCLUSION =====
-print("\n" + "=" * 100)
-print("CONCLUSION")
-print("=" * 100)
+def format_numeric_fact(fact):
+    value = f"{fact.value:g}-{fact.value_high:g}" if fact.value_high == fact.value_high else f"{fact.value:g}"
+    unit = fact.unit if fact.unit in ('', '%') else f" {fact.unit}"
+    return f"{fact.metric.title()}: {fact.qualifier} {value}{unit} (Paper {fact.paper_id}) — \"{fact.span}\""
 
 conclusion_text = """
 This comprehensive analysis demonstrates the efficacy of multi-agent analytical frameworks for systematic literature 
@@ -271,26 +82,7 @@ The multi-agent approach proves effective for scalable, systematic literature an
 insights across paper reading, summarization, fact-checking, and insight generation stages. This methodology 
 can be extended to larger corpora and diverse research domains.
 """
-print(conclusion_text)
-
-# ===== FUTURE SCOPE =====
-print("\n" + "=" * 100)
-print("FUTURE SCOPE & RECOMMENDATIONS")
-print("=" * 100)
 
-print("\nIdentified Research Gaps:")
-for idx, gap in enumerate(report_writer_output['synthesis']['research_gaps'], 1):
-    print(f"{idx}. {gap}")
-
-print("\n\nRecommended Future Directions:")
-for idx, direction in enumerate(report_writer_output['synthesis']['future_directions'], 1):
-    print(f"{idx}. {direction}")
-
-print("\n\nStrategic Recommendations:")
-for rec in report_writer_output['synthesis']['recommendations']:
-    print(f"• {rec}")
-
-print("\n\nMethodological Enhancements for Future Research:")
 enhancements = [
     "Expand corpus size to include international and interdisciplinary perspectives",
     "Implement temporal analysis to track evolution of AI methodologies over time",
@@ -298,18 +90,254 @@ enhancements = [
     "Develop automated bias detection mechanisms in AI healthcare research",
     "Create standardized evaluation frameworks for cross-study comparability"
 ]
-for idx, enhancement in enumerate(enhancements, 1):
-    print(f"{idx}. {enhancement}")
 
-# ===== REPORT METADATA =====
-print("\n" + "=" * 100)
-print("REPORT METADATA")
-print("=" * 100)
-print(f"Generation Date: {report_writer_output['report_metadata']['generation_date']}")
-print(f"Total Papers Analyzed: {report_writer_output['report_metadata']['total_papers']}")
-print(f"Verification Rate: 100%")
-print(f"Report Status: {'COMPLETE' if report_writer_output['report_complete'] else 'INCOMPLETE'}")
-print(f"Pipeline Stages: {' → '.join(report_writer_output['report_metadata']['agent_pipeline'])}")
+# Sections are streamed to disk as they are produced and echoed to the console
+with StreamingReportRenderer('research_report.md', 'AI in Healthcare: Multi-Agent Analysis') as report_renderer:
+    # Deadline-degraded runs say so up front
+    if report_writer_output.get('incomplete_sections'):
+        report_renderer.paragraph(
+            f"\nNote: this is a partial report; the run deadline cut short: "
+            f"{', '.join(report_writer_output['incomplete_sections'])}.\n"
+        )
+
+    # ===== ABSTRACT =====
+    report_renderer.section("Abstract")
+    report_renderer.paragraph(abstract_text)
+
+    # ===== LITERATURE REVIEW =====
+    report_renderer.section("Literature Review")
+    report_renderer.paragraph(lit_review_intro)
+
+    # Paper entries are generated one at a time; only the chart values are kept
+    paper_quality_rows = []
+    for idx, paper in enumerate(islice(iter_paper_reports(insight_generator_output, handoff_store),
+                                       report_writer_output['papers_reported']), 1):
+        report_renderer.subsection(f"{idx}. {paper['title']}", rule=True)
+        report_renderer.paragraph(f"Verification Status: {paper['verification_status']} | Relevance Score: {paper['relevance_score']:.4f}", indent='   ')
+        report_renderer.paragraph(f"Key Topics: {', '.join(paper['key_topics'])}", indent='   ')
+        report_renderer.paragraph("Summary:", indent='\n   ')
+        report_renderer.bullets((point.strip() for point in paper['summary_points']), indent='   ')
+        report_renderer.paragraph("Research Implications:", indent='\n   ')
+        report_renderer.bullets(paper['research_implications'], marker='→', indent='   ')
+        report_renderer.paragraph("Quality Metrics:", indent='\n   ')
+        report_renderer.bullets([
+            f"Topic Overlap: {paper['quality_metrics']['topic_overlap']*100:.0f}%",
+            f"Verification: {paper['quality_metrics']['verification']}",
+            f"Semantic Relevance: {paper['quality_metrics']['semantic_relevance']:.4f}"
+        ], marker='-', indent='   ')
+        paper_quality_rows.append((paper['paper_id'], paper['relevance_score'], paper['quality_metrics']['topic_overlap']))
+        report_renderer.flush()
+
+    # ===== FINDINGS =====
+    report_renderer.section("Findings")
+    report_renderer.paragraph(findings_intro)
+
+    report_renderer.subsection("Key Findings:")
+    report_renderer.bullets(report_writer_output['executive_summary']['key_findings'], ordered=True)
+
+    report_renderer.subsection("\nCross-Cutting Research Themes:")
+    themes = report_writer_output['synthesis']['cross_cutting_themes']
+    report_renderer.bullets((theme.title() for theme in themes), ordered=True)
+
+    report_renderer.subsection("\nTrend Analysis:")
+    report_renderer.bullets(report_writer_output['synthesis']['trend_analysis'])
+
+    report_renderer.subsection("\nQuantitative Evidence:")
+    report_renderer.bullets(format_numeric_fact(fact) for fact in numeric_fact_table.facts.itertuples())
+
+    report_renderer.subsection("\nMethodological Assessment:")
+    report_renderer.bullets([
+        f"Pipeline: {report_writer_output['executive_summary']['methodology']}",
+        f"Total Papers Analyzed: {report_writer_output['report_metadata']['total_papers']}",
+        f"Verification Rate: 100%",
+        f"Average Semantic Relevance: 0.185"
+    ], marker='')
+
+    # ===== VISUALIZATIONS OF KEY FINDINGS =====
+    report_renderer.section("Visual Analysis of Key Findings")
+
+    # Figures are optional under deadline pressure; the text sections always render
+    render_figures = not run_deadline.stage('visualizations').expired()
+    if render_figures:
+        # Visualization 1: Paper Quality Metrics Comparison
+        quality_fig = plt.figure(figsize=(12, 6), facecolor=BACKGROUND)
+        ax1 = quality_fig.add_subplot(111, facecolor=BACKGROUND)
+
+        paper_ids = [f"Paper {paper_id}" for paper_id, _, _ in paper_quality_rows]
+        relevance_scores = [relevance for _, relevance, _ in paper_quality_rows]
+        topic_overlaps = [overlap for _, _, overlap in paper_quality_rows]
+
+        x_pos = range(len(paper_ids))
+        width = 0.35
+
+        bars1 = ax1.bar([x - width/2 for x in x_pos], relevance_scores, width, 
+                        color=ZERVE_BLUE, label='Semantic Relevance', alpha=0.9)
+        bars2 = ax1.bar([x + width/2 for x in x_pos], topic_overlaps, width, 
+                        color=ZERVE_GREEN, label='Topic Overlap', alpha=0.9)
+
+        ax1.set_xlabel('Research Papers', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax1.set_ylabel('Score', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax1.set_title('Research Paper Quality Metrics Comparison', fontsize=14, color=PRIMARY_TEXT, 
+                      fontweight='bold', pad=20)
+        ax1.set_xticks(x_pos)
+        ax1.set_xticklabels(paper_ids, color=PRIMARY_TEXT, fontsize=10)
+        ax1.tick_params(axis='y', labelcolor=PRIMARY_TEXT)
+        ax1.spines['top'].set_visible(False)
+        ax1.spines['right'].set_visible(False)
+        ax1.spines['left'].set_color(SECONDARY_TEXT)
+        ax1.spines['bottom'].set_color(SECONDARY_TEXT)
+        ax1.legend(frameon=False, labelcolor=PRIMARY_TEXT, fontsize=10)
+        ax1.grid(axis='y', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
+
+        for bar in bars1:
+            height = bar.get_height()
+            ax1.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.3f}', ha='center', va='bottom', 
+                    color=PRIMARY_TEXT, fontsize=9)
+
+        for bar in bars2:
+            height = bar.get_height()
+            ax1.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.2f}', ha='center', va='bottom', 
+                    color=PRIMARY_TEXT, fontsize=9)
+
+        plt.tight_layout()
+        report_renderer.figure(quality_fig, 'paper_quality_metrics', 'Paper Quality Metrics Comparison')
+        print("\n✓ Visualization 1: Paper Quality Metrics Comparison")
+
+        # Visualization 2: Research Theme Distribution
+        theme_fig = plt.figure(figsize=(14, 7), facecolor=BACKGROUND)
+        ax2 = theme_fig.add_subplot(111, facecolor=BACKGROUND)
+
+        themes_sorted = report_writer_output['synthesis']['cross_cutting_themes']
+        theme_names = [t.replace('_', ' ').title() for t in themes_sorted]
+        theme_count = len(themes_sorted)
+        theme_frequencies = [1] * theme_count  # All appear once in our dataset
+
+        colors_theme = [ZERVE_BLUE, ZERVE_ORANGE, ZERVE_GREEN, ZERVE_CORAL, ZERVE_LAVENDER, 
+                        ZERVE_DARK_BLUE, ZERVE_BLUE, ZERVE_ORANGE, ZERVE_GREEN][:theme_count]
+
+        bars_theme = ax2.barh(theme_names, theme_frequencies, color=colors_theme, alpha=0.9)
+
+        ax2.set_xlabel('Frequency Across Papers', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax2.set_ylabel('Research Themes', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax2.set_title('Distribution of Research Themes Across Analyzed Papers', fontsize=14, 
+                      color=PRIMARY_TEXT, fontweight='bold', pad=20)
+        ax2.tick_params(axis='both', labelcolor=PRIMARY_TEXT, labelsize=10)
+        ax2.spines['top'].set_visible(False)
+        ax2.spines['right'].set_visible(False)
+        ax2.spines['left'].set_color(SECONDARY_TEXT)
+        ax2.spines['bottom'].set_color(SECONDARY_TEXT)
+        ax2.grid(axis='x', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
+
+        for bar in bars_theme:
+            width_val = bar.get_width()
+            ax2.text(width_val, bar.get_y() + bar.get_height()/2.,
+                    f' {int(width_val)}', ha='left', va='center', 
+                    color=PRIMARY_TEXT, fontsize=10, fontweight='bold')
+
+        plt.tight_layout()
+        report_renderer.figure(theme_fig, 'research_theme_distribution', 'Research Theme Distribution')
+        print("✓ Visualization 2: Research Theme Distribution")
+
+        # Visualization 3: Verification Status Overview
+        verification_fig = plt.figure(figsize=(10, 6), facecolor=BACKGROUND)
+        ax3 = verification_fig.add_subplot(111, facecolor=BACKGROUND)
+
+        verification_categories = ['Fully Verified', 'Partially Verified', 'Not Verified']
+        verification_counts = [3, 0, 0]  # All 3 papers fully verified
+        colors_verification = [SUCCESS, HIGHLIGHT, WARNING]
+
+        bars_verify = ax3.bar(verification_categories, verification_counts, 
+                              color=colors_verification, alpha=0.9, width=0.6)
+
+        ax3.set_ylabel('Number of Papers', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax3.set_title('Research Paper Verification Status Distribution', fontsize=14, 
+                      color=PRIMARY_TEXT, fontweight='bold', pad=20)
+        ax3.set_ylim(0, 4)
+        ax3.tick_params(axis='both', labelcolor=PRIMARY_TEXT, labelsize=10)
+        ax3.spines['top'].set_visible(False)
+        ax3.spines['right'].set_visible(False)
+        ax3.spines['left'].set_color(SECONDARY_TEXT)
+        ax3.spines['bottom'].set_color(SECONDARY_TEXT)
+        ax3.grid(axis='y', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
+
+        for bar in bars_verify:
+            height = bar.get_height()
+            if height > 0:
+                ax3.text(bar.get_x() + bar.get_width()/2., height,
+                        f'{int(height)}', ha='center', va='bottom', 
+                        color=PRIMARY_TEXT, fontsize=12, fontweight='bold')
+
+        plt.tight_layout()
+        report_renderer.figure(verification_fig, 'verification_status', 'Verification Status Overview')
+        print("✓ Visualization 3: Verification Status Overview")
+
+        # Visualization 4: Multi-Agent Pipeline Performance
+        pipeline_fig = plt.figure(figsize=(12, 6), facecolor=BACKGROUND)
+        ax4 = pipeline_fig.add_subplot(111, facecolor=BACKGROUND)
+
+        pipeline_stages = report_writer_output['report_metadata']['agent_pipeline']
+        pipeline_performance = [100, 100, 100, 100, 100]  # All stages completed successfully
+        colors_pipeline = [ZERVE_BLUE, ZERVE_ORANGE, ZERVE_GREEN, ZERVE_CORAL, ZERVE_LAVENDER]
+
+        bars_pipeline = ax4.barh(pipeline_stages, pipeline_performance, 
+                                 color=colors_pipeline, alpha=0.9)
+
+        ax4.set_xlabel('Completion Rate (%)', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax4.set_ylabel('Agent Pipeline Stage', fontsize=12, color=PRIMARY_TEXT, fontweight='bold')
+        ax4.set_title('Multi-Agent Analysis Pipeline Performance', fontsize=14, 
+                      color=PRIMARY_TEXT, fontweight='bold', pad=20)
+        ax4.set_xlim(0, 105)
+        ax4.tick_params(axis='both', labelcolor=PRIMARY_TEXT, labelsize=10)
+        ax4.spines['top'].set_visible(False)
+        ax4.spines['right'].set_visible(False)
+        ax4.spines['left'].set_color(SECONDARY_TEXT)
+        ax4.spines['bottom'].set_color(SECONDARY_TEXT)
+        ax4.grid(axis='x', alpha=0.2, color=SECONDARY_TEXT, linestyle='--')
+
+        for bar in bars_pipeline:
+            width_val = bar.get_width()
+            ax4.text(width_val - 5, bar.get_y() + bar.get_height()/2.,
+                    f'{int(width_val)}%', ha='right', va='center', 
+                    color=PRIMARY_TEXT, fontsize=11, fontweight='bold')
+
+        plt.tight_layout()
+        report_renderer.figure(pipeline_fig, 'pipeline_performance', 'Multi-Agent Pipeline Performance')
+        print("✓ Visualization 4: Multi-Agent Pipeline Performance")
+    else:
+        mark_incomplete(report_writer_output, run_deadline.stage('visualizations'), sections=['visualizations'])
+        report_renderer.paragraph("\nFigures were skipped because the run deadline was reached.\n")
+
+    # ===== CONCLUSION =====
+    report_renderer.section("Conclusion")
+
+    report_renderer.paragraph(conclusion_text)
+
+    # ===== FUTURE SCOPE =====
+    report_renderer.section("Future Scope & Recommendations")
+
+    report_renderer.subsection("Identified Research Gaps:")
+    report_renderer.bullets(report_writer_output['synthesis']['research_gaps'], ordered=True)
+
+    report_renderer.subsection("\nRecommended Future Directions:")
+    report_renderer.bullets(report_writer_output['synthesis']['future_directions'], ordered=True)
+
+    report_renderer.subsection("\nStrategic Recommendations:")
+    report_renderer.bullets(report_writer_output['synthesis']['recommendations'])
+
+    report_renderer.subsection("\nMethodological Enhancements for Future Research:")
+    report_renderer.bullets(enhancements, ordered=True)
+
+    # ===== REPORT METADATA =====
+    report_renderer.section("Report Metadata")
+    report_renderer.bullets([
+        f"Generation Date: {report_writer_output['report_metadata']['generation_date']}",
+        f"Total Papers Analyzed: {report_writer_output['report_metadata']['total_papers']}",
+        f"Verification Rate: 100%",
+        f"Report Status: {'COMPLETE' if report_writer_output['report_complete'] else 'INCOMPLETE'}",
+        f"Pipeline Stages: {' → '.join(report_writer_output['report_metadata']['agent_pipeline'])}"
+    ], marker='')
 
 print("\n" + "=" * 100)
 print("✅ COMPREHENSIVE RESEARCH REPORT COMPLETE")
@@ -318,7 +346,12 @@ print("\nThis report includes:")
 print("• Abstract: Research overview and key findings summary")
 print("• Literature Review: Detailed analysis of 3 research papers")
 print("• Findings: Cross-cutting themes, trends, and methodological assessment")
-print("• Visualizations: 4 professional charts displaying key insights")
+print(f"• Visualizations: {len(report_renderer.figures)} professional charts displaying key insights")
 print("• Conclusion: Synthesis of results and methodological validation")
 print("• Future Scope: Research gaps, recommendations, and strategic directions")
+print(f"\n💾 Report written to: {report_renderer.path}")
+print(f"   Figures saved: {len(report_renderer.figures)} in {report_renderer.figure_dir}")
+
+print("\n⏱️  Stage timings (wall, CPU and memory peak per span):")
+stage_tracer.print_summary()
 print("=" * 100)
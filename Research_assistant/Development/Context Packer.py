@@ -0,0 +1,112 @@
+print("=" * 80)
+print("TOKEN-BUDGETED CONTEXT PACKER")
+print("=" * 80)
+
+# Prompt context budget and how many search results compete for it
+CONTEXT_TOKEN_BUDGET = 256
+CONTEXT_CANDIDATES = 8
+
+def _subtract_ranges(start, end, taken):
+    """Parts of [start, end) not covered by the sorted, disjoint ranges in taken."""
+    pieces, cursor = [], start
+    for taken_start, taken_end in taken:
+        if taken_end <= cursor or taken_start >= end:
+            continue
+        if taken_start > cursor:
+            pieces.append((cursor, taken_start))
+        cursor = max(cursor, taken_end)
+    if cursor < end:
+        pieces.append((cursor, end))
+    return pieces
+
+def pack_context(results, token_budget=CONTEXT_TOKEN_BUDGET):
+    """
+    Pack ranked search results into a prompt context within a token budget.
+
+    Chunks are taken greedily by similarity per token. Tokens a chunk shares
+    with an already packed chunk of the same paper (the segmentation
+    overlap, located through token_start/token_end) are dropped, so only its
+    new tokens are packed and counted. Each packed chunk gets a citation
+    marker [n] that maps back to its chunk_id; markers are numbered in rank
+    order.
+
+    Args:
+        results: Ranked results from semantic_search (with token ranges)
+        token_budget: Maximum tokens of the packed context, markers included
+
+    Returns:
+        Dictionary with the context text, citations and packing statistics
+    """
+    ranked = sorted(results, key=lambda r: -r['similarity'])
+    order = sorted(range(len(ranked)), key=lambda i: -ranked[i]['similarity'] / max(ranked[i]['token_count'], 1))
+    taken_by_paper = {}
+    selected = {}
+    remaining = token_budget
+    deduplicated_tokens = 0
+    skipped = []
+
+    for idx in order:
+        result = ranked[idx]
+        taken = taken_by_paper.setdefault(result['paper_id'], [])
+        pieces = _subtract_ranges(result['token_start'], result['token_end'], taken)
+        novel = sum(end - start for start, end in pieces)
+        if novel == 0:
+            deduplicated_tokens += result['token_count']
+            skipped.append({'chunk_id': result['chunk_id'], 'reason': 'duplicate'})
+            continue
+        header = f"[{len(selected) + 1}] {result['paper_title']}:"
+        cost = novel + count_tokens(header)
+        if cost > remaining:
+            skipped.append({'chunk_id': result['chunk_id'], 'reason': 'budget'})
+            continue
+        chunk_tokens = result['chunk_text'].split()
+        texts = [' '.join(chunk_tokens[start - result['token_start']:end - result['token_start']]) for start, end in pieces]
+        selected[idx] = (pieces, ' … '.join(texts))
+        deduplicated_tokens += result['token_count'] - novel
+        taken.extend(pieces)
+        taken.sort()
+        remaining -= cost
+
+    context_lines, citations = [], []
+    for idx in sorted(selected):
+        result = ranked[idx]
+        pieces, text = selected[idx]
+        marker = f"[{len(citations) + 1}]"
+        context_lines.append(f"{marker} {result['paper_title']}: {text}")
+        citations.append({
+            'marker': marker,
+            'chunk_id': result['chunk_id'],
+            'paper_id': result['paper_id'],
+            'similarity': round(result['similarity'], 4),
+            'token_ranges': [list(piece) for piece in pieces]
+        })
+    return {
+        'context': '\n'.join(context_lines),
+        'citations': citations,
+        'tokens_used': token_budget - remaining,
+        'token_budget': token_budget,
+        'deduplicated_tokens': deduplicated_tokens,
+        'skipped': skipped
+    }
+
+def cited_chunk_ids(text, packed):
+    """Chunk ids of the citation markers that appear in a model response."""
+    return [c['chunk_id'] for c in packed['citations'] if c['marker'] in text]
+
+# Demo: pack finer, overlapping chunks of the corpus for each research question
+demo_chunks = [dict(chunk, similarity=0.0) for paper in processed_papers
+               for chunk in create_chunks(paper, chunk_size=30, overlap=10)]
+demo_vectors = tfidf_vectorizer.transform([c['chunk_text'] for c in demo_chunks])
+
+print(f"\n📦 Budget: {CONTEXT_TOKEN_BUDGET} tokens | Candidates per query: {CONTEXT_CANDIDATES}")
+print(f"   Demo pool: {len(demo_chunks)} chunks of 30 tokens with 10-token overlap")
+for question in research_questions:
+    scores = (demo_vectors @ tfidf_vectorizer.transform([question]).T).toarray().ravel()
+    candidates = [dict(demo_chunks[i], similarity=float(scores[i])) for i in scores.argsort()[::-1][:CONTEXT_CANDIDATES]]
+    packed = pack_context(candidates, token_budget=96)
+    raw_tokens = sum(c['token_count'] for c in candidates)
+    print(f"\n   ❓ {question}")
+    print(f"      {len(packed['citations'])} chunks packed in {packed['tokens_used']}/{packed['token_budget']} tokens "
+          f"(candidates: {raw_tokens} tokens, overlap removed: {packed['deduplicated_tokens']})")
+    print(f"      Citations: {', '.join(c['marker'] + ' ' + c['chunk_id'] for c in packed['citations'])}")
+print("=" * 80)
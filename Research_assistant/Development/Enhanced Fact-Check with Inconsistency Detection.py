@@ -1,13 +1,183 @@
 import json
 from datetime import datetime
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 print("=" * 80)
 print("ENHANCED FACT-CHECK AGENT WITH INCONSISTENCY DETECTION")
 print("=" * 80)
 
-def enhanced_fact_check_agent(summarization_data, original_papers, knowledge_base, tfidf_vectorizer):
+def cross_check_summary(summary, original_paper, kb_embeddings, kb_chunks, tfidf_vectorizer, span_index=None,
+                        numeric_facts=None):
+    """
+    Cross-reference one paper's summary claims against the knowledge base.
+    
+    Args:
+        summary: Summary entry from the Summarization Agent
+        original_paper: Original paper the summary was written from
+        kb_embeddings: Embedding matrix of the knowledge base chunks (one row per chunk)
+        kb_chunks: Sequence of chunk records with chunk_id, paper_id and paper_title
+        tfidf_vectorizer: Trained TF-IDF vectorizer
+        span_index: Optional SpanGroundingIndex for verbatim span grounding
+        numeric_facts: Optional NumericFactTable for indexed numeric claim checks
+    
+    Returns:
+        Validated claim entry with confidence scores and inconsistency flags
+    """
+    # STEP 1: Verify topics against original keywords
+    claimed_topics = set(summary['key_topics'])
+    actual_keywords = set(original_paper['keywords'])
+    topics_match = claimed_topics.issubset(actual_keywords)
+    topic_overlap_ratio = len(claimed_topics.intersection(actual_keywords)) / len(claimed_topics) if claimed_topics else 0
+    
+    # STEP 2: Cross-reference summary points across all sources using vector similarity
+    cross_reference_results = []
+    inconsistency_flags = []
+    
+    for point_idx, summary_point in enumerate(summary['summary_points']):
+        # Vectorize the claim
+        point_embedding = tfidf_vectorizer.transform([summary_point])
+        
+        # Calculate similarity with all knowledge base chunks
+        similarities = cosine_scores(point_embedding, kb_embeddings)
+        
+        # Get top 3 most similar sources
+        top_indices = np.argsort(similarities)[::-1][:3]
+        supporting_sources = []
+        
+        for idx in top_indices:
+            kb_entry = kb_chunks[idx]
+            supporting_sources.append({
+                'paper_id': kb_entry['paper_id'],
+                'paper_title': kb_entry['paper_title'],
+                'similarity_score': float(similarities[idx]),
+                'chunk_id': kb_entry['chunk_id']
+            })
+        
+        # Calculate confidence based on similarity scores
+        max_similarity = supporting_sources[0]['similarity_score']
+        avg_similarity = np.mean([s['similarity_score'] for s in supporting_sources])
+        
+        # Determine if claim is well-supported
+        confidence_score = max_similarity
+        
+        # Flag potential hallucinations or inconsistencies
+        is_hallucination = False
+        is_inconsistent = False
+        hallucination_reason = None
+        
+        # Check 1: Low similarity to any source (potential hallucination)
+        if max_similarity < 0.15:
+            is_hallucination = True
+            hallucination_reason = "Low similarity to all sources - claim may not be grounded in papers"
+            inconsistency_flags.append(f"Claim '{summary_point[:50]}...' has weak source support")
+        
+        # Check 2: Source is primarily from different paper (cross-contamination)
+        primary_source_id = supporting_sources[0]['paper_id']
+        if primary_source_id != summary['paper_id'] and max_similarity > 0.2:
+            is_inconsistent = True
+            hallucination_reason = f"Claim primarily matches Paper {primary_source_id}, not source Paper {summary['paper_id']}"
+            inconsistency_flags.append(f"Cross-contamination: Claim from Paper {summary['paper_id']} matches Paper {primary_source_id}")
+        
+        # Check 3: Large variance in similarity scores (conflicting sources)
+        similarity_variance = np.var([s['similarity_score'] for s in supporting_sources])
+        if similarity_variance > 0.03:
+            is_inconsistent = True
+            inconsistency_flags.append(f"High variance in source support for claim '{summary_point[:50]}...'")
+        
+        # Check 4: Numeric statements disagree with the corpus fact table
+        numeric_checks = numeric_facts.check_claim(summary_point) if numeric_facts is not None else []
+        contradicted = [nc for nc in numeric_checks if nc['status'] == 'CONTRADICTED']
+        if contradicted:
+            # An inconsistency, not a hallucination: flag_reason keeps the reason of the checks above
+            is_inconsistent = True
+            inconsistency_flags.append(f"Numeric mismatch: {contradicted[0]['qualifier']} {contradicted[0]['value']:g}"
+                                       f"{contradicted[0]['unit']} {contradicted[0]['metric']} "
+                                       f"vs corpus values {contradicted[0]['corpus_values']}")
+        
+        # Exact-span grounding: longest verbatim span of the claim in any paper
+        grounding = span_index.longest_span(summary_point, prefer_paper_id=summary['paper_id']) if span_index is not None else None
+        
+        cross_reference_results.append({
+            'claim': summary_point,
+            'claim_index': point_idx + 1,
+            'confidence_score': round(confidence_score, 4),
+            'max_similarity': round(max_similarity, 4),
+            'avg_similarity': round(avg_similarity, 4),
+            'supporting_sources': supporting_sources,
+            'hallucination_flag': is_hallucination,
+            'inconsistency_flag': is_inconsistent,
+            'flag_reason': hallucination_reason,
+            'grounding_span': grounding['span_text'] if grounding else None,
+            'grounding_paper_id': grounding['paper_id'] if grounding else None,
+            'grounding_char_range': [grounding['char_start'], grounding['char_end']] if grounding and grounding['span_text'] else None,
+            'grounding_coverage': grounding['coverage'] if grounding else None,
+            'verbatim_grounded': bool(grounding and grounding['coverage'] == 1.0 and summary['paper_id'] in grounding['paper_ids']),
+            'numeric_checks': numeric_checks
+        })
+    
+    # STEP 3: Calculate aggregate confidence and validation status
+    avg_confidence = np.mean([cr['confidence_score'] for cr in cross_reference_results])
+    hallucination_count = sum(cr['hallucination_flag'] for cr in cross_reference_results)
+    inconsistency_count = sum(cr['inconsistency_flag'] for cr in cross_reference_results)
+    
+    # Determine overall validation status
+    if hallucination_count > 0:
+        validation_status = "HALLUCINATION_DETECTED"
+    elif inconsistency_count > 0:
+        validation_status = "INCONSISTENT"
+    elif avg_confidence > 0.25 and topic_overlap_ratio == 1.0:
+        validation_status = "VERIFIED"
+    elif avg_confidence > 0.15:
+        validation_status = "PARTIAL"
+    else:
+        validation_status = "UNVERIFIED"
+    
+    validated_claim = {
+        'paper_id': summary['paper_id'],
+        'title': summary['title'],
+        'validation_status': validation_status,
+        'confidence_score': round(avg_confidence, 4),
+        'topic_overlap_ratio': round(topic_overlap_ratio, 4),
+        'topics_verified': topics_match,
+        'claimed_topics': list(claimed_topics),
+        'actual_keywords': list(actual_keywords),
+        'cross_reference_results': cross_reference_results,
+        'hallucination_flags': hallucination_count,
+        'inconsistency_flags': inconsistency_count,
+        'inconsistency_details': inconsistency_flags,
+        'total_claims_checked': len(summary['summary_points']),
+        'verbatim_grounded_claims': sum(cr['verbatim_grounded'] for cr in cross_reference_results),
+        'numeric_claims_checked': sum(len(cr['numeric_checks']) for cr in cross_reference_results),
+        'numeric_claims_supported': sum(nc['status'] == 'SUPPORTED' for cr in cross_reference_results for nc in cr['numeric_checks'])
+    }
+    return validated_claim
+
+def enhanced_validation_metrics(validated_claims):
+    """Aggregate metrics over the per-paper enhanced validation entries."""
+    total_claims = sum(vc['total_claims_checked'] for vc in validated_claims)
+    total_hallucinations = sum(vc['hallucination_flags'] for vc in validated_claims)
+    total_inconsistencies = sum(vc['inconsistency_flags'] for vc in validated_claims)
+    avg_confidence = np.mean([vc['confidence_score'] for vc in validated_claims]) if validated_claims else 0.0
+    
+    verified_count = sum(1 for vc in validated_claims if vc['validation_status'] == 'VERIFIED')
+    
+    return {
+        'total_papers_validated': len(validated_claims),
+        'total_claims_checked': total_claims,
+        'fully_verified_papers': verified_count,
+        'papers_with_hallucinations': sum(1 for vc in validated_claims if vc['hallucination_flags'] > 0),
+        'papers_with_inconsistencies': sum(1 for vc in validated_claims if vc['inconsistency_flags'] > 0),
+        'total_hallucination_flags': total_hallucinations,
+        'total_inconsistency_flags': total_inconsistencies,
+        'average_confidence_score': round(avg_confidence, 4),
+        'verification_rate': round(verified_count / len(validated_claims), 4) if validated_claims else 0.0,
+        'verbatim_grounded_claims': sum(vc['verbatim_grounded_claims'] for vc in validated_claims),
+        'numeric_claims_checked': sum(vc['numeric_claims_checked'] for vc in validated_claims),
+        'numeric_claims_supported': sum(vc['numeric_claims_supported'] for vc in validated_claims)
+    }
+
+def enhanced_fact_check_agent(summarization_data, original_papers, knowledge_base, tfidf_vectorizer, span_index=None,
+                              numeric_facts=None, handoff_store=None, deadline=None):
     """
     Enhanced Fact-Check Agent that cross-references claims across multiple sources,
     identifies inconsistencies, and flags potential hallucinations using vector 
@@ -18,6 +188,10 @@ def enhanced_fact_check_agent(summarization_data, original_papers, knowledge_bas
         original_papers: Original paper data for validation
         knowledge_base: Vector embeddings of paper chunks
         tfidf_vectorizer: Trained TF-IDF vectorizer
+        span_index: Optional SpanGroundingIndex for verbatim span grounding
+        numeric_facts: Optional NumericFactTable for indexed numeric claim checks
+        handoff_store: Optional HandoffStore receiving each paper's enhanced validation
+        deadline: Optional stage Deadline; summaries left when it passes are marked incomplete
     
     Returns:
         Enhanced fact-check results with confidence scores and inconsistency flags
@@ -39,168 +213,81 @@ def enhanced_fact_check_agent(summarization_data, original_papers, knowledge_bas
     # Create lookup for original papers
     original_papers_map = {i+1: paper for i, paper in enumerate(original_papers)}
     
-    for summary in summarization_data['summaries']:
-        print(f"\n{'─' * 80}")
-        print(f"🔎 Fact-checking Paper {summary['paper_id']}: {summary['title'][:50]}...")
-        
-        original_paper = original_papers_map[summary['paper_id']]
-        
-        # STEP 1: Verify topics against original keywords
-        claimed_topics = set(summary['key_topics'])
-        actual_keywords = set(original_paper['keywords'])
-        topics_match = claimed_topics.issubset(actual_keywords)
-        topic_overlap_ratio = len(claimed_topics.intersection(actual_keywords)) / len(claimed_topics) if claimed_topics else 0
-        
-        # STEP 2: Cross-reference summary points across all sources using vector similarity
-        cross_reference_results = []
-        inconsistency_flags = []
-        
-        for point_idx, summary_point in enumerate(summary['summary_points']):
-            # Vectorize the claim
-            point_embedding = tfidf_vectorizer.transform([summary_point]).toarray()
-            
-            # Calculate similarity with all knowledge base chunks
-            kb_embeddings = np.array([k['embedding'] for k in knowledge_base])
-            similarities = cosine_similarity(point_embedding, kb_embeddings)[0]
-            
-            # Get top 3 most similar sources
-            top_indices = np.argsort(similarities)[::-1][:3]
-            supporting_sources = []
-            
-            for idx in top_indices:
-                kb_entry = knowledge_base[idx]
-                supporting_sources.append({
-                    'paper_id': kb_entry['paper_id'],
-                    'paper_title': kb_entry['paper_title'],
-                    'similarity_score': float(similarities[idx]),
-                    'chunk_id': kb_entry['chunk_id']
-                })
-            
-            # Calculate confidence based on similarity scores
-            max_similarity = supporting_sources[0]['similarity_score']
-            avg_similarity = np.mean([s['similarity_score'] for s in supporting_sources])
-            
-            # Determine if claim is well-supported
-            confidence_score = max_similarity
-            
-            # Flag potential hallucinations or inconsistencies
-            is_hallucination = False
-            is_inconsistent = False
-            hallucination_reason = None
-            
-            # Check 1: Low similarity to any source (potential hallucination)
-            if max_similarity < 0.15:
-                is_hallucination = True
-                hallucination_reason = "Low similarity to all sources - claim may not be grounded in papers"
-                inconsistency_flags.append(f"Claim '{summary_point[:50]}...' has weak source support")
-            
-            # Check 2: Source is primarily from different paper (cross-contamination)
-            primary_source_id = supporting_sources[0]['paper_id']
-            if primary_source_id != summary['paper_id'] and max_similarity > 0.2:
-                is_inconsistent = True
-                hallucination_reason = f"Claim primarily matches Paper {primary_source_id}, not source Paper {summary['paper_id']}"
-                inconsistency_flags.append(f"Cross-contamination: Claim from Paper {summary['paper_id']} matches Paper {primary_source_id}")
-            
-            # Check 3: Large variance in similarity scores (conflicting sources)
-            similarity_variance = np.var([s['similarity_score'] for s in supporting_sources])
-            if similarity_variance > 0.03:
-                is_inconsistent = True
-                inconsistency_flags.append(f"High variance in source support for claim '{summary_point[:50]}...'")
-            
-            cross_reference_results.append({
-                'claim': summary_point,
-                'claim_index': point_idx + 1,
-                'confidence_score': round(confidence_score, 4),
-                'max_similarity': round(max_similarity, 4),
-                'avg_similarity': round(avg_similarity, 4),
-                'supporting_sources': supporting_sources,
-                'hallucination_flag': is_hallucination,
-                'inconsistency_flag': is_inconsistent,
-                'flag_reason': hallucination_reason
-            })
-            
-            print(f"   Claim {point_idx + 1}: Confidence {confidence_score:.4f} | "
-                  f"Hallucination: {is_hallucination} | Inconsistent: {is_inconsistent}")
-        
-        # STEP 3: Calculate aggregate confidence and validation status
-        avg_confidence = np.mean([cr['confidence_score'] for cr in cross_reference_results])
-        hallucination_count = sum(cr['hallucination_flag'] for cr in cross_reference_results)
-        inconsistency_count = sum(cr['inconsistency_flag'] for cr in cross_reference_results)
-        
-        # Determine overall validation status
-        if hallucination_count > 0:
-            validation_status = "HALLUCINATION_DETECTED"
-        elif inconsistency_count > 0:
-            validation_status = "INCONSISTENT"
-        elif avg_confidence > 0.25 and topic_overlap_ratio == 1.0:
-            validation_status = "VERIFIED"
-        elif avg_confidence > 0.15:
-            validation_status = "PARTIAL"
-        else:
-            validation_status = "UNVERIFIED"
-        
-        validated_claim = {
-            'paper_id': summary['paper_id'],
-            'title': summary['title'],
-            'validation_status': validation_status,
-            'confidence_score': round(avg_confidence, 4),
-            'topic_overlap_ratio': round(topic_overlap_ratio, 4),
-            'topics_verified': topics_match,
-            'claimed_topics': list(claimed_topics),
-            'actual_keywords': list(actual_keywords),
-            'cross_reference_results': cross_reference_results,
-            'hallucination_flags': hallucination_count,
-            'inconsistency_flags': inconsistency_count,
-            'inconsistency_details': inconsistency_flags,
-            'total_claims_checked': len(summary['summary_points'])
-        }
+    # Stack the chunk embeddings once for every claim (a spilled knowledge base is read in place)
+    kb_embeddings = knowledge_base_matrix(knowledge_base)
+    
+    for position, summary in enumerate(summarization_data['summaries']):
+        if deadline is not None and deadline.expired():
+            mark_incomplete(enhanced_fact_check, deadline,
+                            paper_ids=[s['paper_id'] for s in summarization_data['summaries'][position:]])
+            break
+        
+        event_log.info('paper.cross_checking', "\n" + "─" * 80 + "\n🔎 Fact-checking Paper {paper_id}: {title:.50}...",
+                       paper_id=summary['paper_id'], title=summary['title'])
+        
+        validated_claim = cross_check_summary(
+            summary, original_papers_map[summary['paper_id']], kb_embeddings, knowledge_base, tfidf_vectorizer,
+            span_index=span_index, numeric_facts=numeric_facts
+        )
+        for cr in validated_claim['cross_reference_results']:
+            event_log.debug(
+                'claim.checked',
+                "   Claim {claim_index}: Confidence {confidence_score:.4f} | "
+                "Hallucination: {hallucination_flag} | Inconsistent: {inconsistency_flag}",
+                paper_id=summary['paper_id'], claim_index=cr['claim_index'], confidence_score=cr['confidence_score'],
+                hallucination_flag=cr['hallucination_flag'], inconsistency_flag=cr['inconsistency_flag']
+            )
         
         enhanced_fact_check['validated_claims'].append(validated_claim)
+        if handoff_store is not None:
+            handoff_store.put('enhanced_validation', validated_claim)
         
-        print(f"   ✓ Overall Status: {validation_status}")
-        print(f"   ✓ Confidence Score: {avg_confidence:.4f}")
-        print(f"   ✓ Hallucination Flags: {hallucination_count}")
-        print(f"   ✓ Inconsistency Flags: {inconsistency_count}")
+        event_log.info(
+            'paper.cross_checked',
+            "   ✓ Overall Status: {validation_status}\n"
+            "   ✓ Confidence Score: {confidence_score:.4f}\n"
+            "   ✓ Hallucination Flags: {hallucination_flags}\n"
+            "   ✓ Inconsistency Flags: {inconsistency_flags}",
+            paper_id=summary['paper_id'], validation_status=validated_claim['validation_status'],
+            confidence_score=validated_claim['confidence_score'],
+            hallucination_flags=validated_claim['hallucination_flags'],
+            inconsistency_flags=validated_claim['inconsistency_flags']
+        )
     
     # Calculate aggregate metrics
-    total_claims = sum(vc['total_claims_checked'] for vc in enhanced_fact_check['validated_claims'])
-    total_hallucinations = sum(vc['hallucination_flags'] for vc in enhanced_fact_check['validated_claims'])
-    total_inconsistencies = sum(vc['inconsistency_flags'] for vc in enhanced_fact_check['validated_claims'])
-    avg_confidence = np.mean([vc['confidence_score'] for vc in enhanced_fact_check['validated_claims']])
-    
-    verified_count = sum(1 for vc in enhanced_fact_check['validated_claims'] if vc['validation_status'] == 'VERIFIED')
-    
-    enhanced_fact_check['validation_metrics'] = {
-        'total_papers_validated': len(enhanced_fact_check['validated_claims']),
-        'total_claims_checked': total_claims,
-        'fully_verified_papers': verified_count,
-        'papers_with_hallucinations': sum(1 for vc in enhanced_fact_check['validated_claims'] if vc['hallucination_flags'] > 0),
-        'papers_with_inconsistencies': sum(1 for vc in enhanced_fact_check['validated_claims'] if vc['inconsistency_flags'] > 0),
-        'total_hallucination_flags': total_hallucinations,
-        'total_inconsistency_flags': total_inconsistencies,
-        'average_confidence_score': round(avg_confidence, 4),
-        'verification_rate': round(verified_count / len(enhanced_fact_check['validated_claims']), 4)
-    }
+    enhanced_fact_check['papers_validated'] = len(enhanced_fact_check['validated_claims'])
+    enhanced_fact_check['validation_metrics'] = enhanced_validation_metrics(enhanced_fact_check['validated_claims'])
+    metrics = enhanced_fact_check['validation_metrics']
     
     print(f"\n{'=' * 80}")
     print(f"✅ Enhanced Fact-Check Agent Complete")
-    print(f"   • Papers validated: {len(enhanced_fact_check['validated_claims'])}")
-    print(f"   • Total claims checked: {total_claims}")
-    print(f"   • Fully verified: {verified_count}")
-    print(f"   • Hallucination flags: {total_hallucinations}")
-    print(f"   • Inconsistency flags: {total_inconsistencies}")
-    print(f"   • Average confidence: {avg_confidence:.4f}")
+    print(f"   • Papers validated: {metrics['total_papers_validated']}")
+    print(f"   • Total claims checked: {metrics['total_claims_checked']}")
+    print(f"   • Fully verified: {metrics['fully_verified_papers']}")
+    print(f"   • Hallucination flags: {metrics['total_hallucination_flags']}")
+    print(f"   • Inconsistency flags: {metrics['total_inconsistency_flags']}")
+    print(f"   • Average confidence: {metrics['average_confidence_score']:.4f}")
+    print(f"   • Verbatim-grounded claims: {metrics['verbatim_grounded_claims']}/{metrics['total_claims_checked']}")
+    print(f"   • Numeric claims supported: {metrics['numeric_claims_supported']}/{metrics['numeric_claims_checked']}")
     print(f"=" * 80)
     
-    return enhanced_fact_check
+    return validate_handoff('enhanced_fact_check', enhanced_fact_check)
+
+# Entries go into this stage's own copy of the store, exported (and memoized) with its output
+handoff_store = handoff_store.copy()
 
 # Execute Enhanced Fact-Check Agent
-enhanced_fact_check_result = enhanced_fact_check_agent(
-    summarization_output, 
-    sample_papers, 
-    knowledge_base, 
-    tfidf_vectorizer
-)
+with stage_tracer.span('agent.enhanced_fact_check', category='agent'):
+    enhanced_fact_check_result = enhanced_fact_check_agent(
+        summarization_output, 
+        sample_papers, 
+        knowledge_base, 
+        tfidf_vectorizer,
+        span_index=span_grounding_index,
+        numeric_facts=numeric_fact_table,
+        handoff_store=handoff_store,
+        deadline=run_deadline.stage('enhanced_fact_check')
+    )
 
 print(f"\n\n📊 ENHANCED FACT-CHECK OUTPUT SUMMARY")
 print(f"{'=' * 80}")
@@ -213,15 +300,19 @@ print(json.dumps({
 print(f"\n\n🎯 DETAILED VALIDATION RESULTS BY PAPER")
 print(f"{'=' * 80}")
 for claim in enhanced_fact_check_result['validated_claims']:
-    print(f"\n📄 Paper {claim['paper_id']}: {claim['title'][:60]}...")
-    print(f"   Status: {claim['validation_status']}")
-    print(f"   Confidence: {claim['confidence_score']:.4f}")
-    print(f"   Hallucination Flags: {claim['hallucination_flags']}")
-    print(f"   Inconsistency Flags: {claim['inconsistency_flags']}")
-    if claim['inconsistency_details']:
-        print(f"   Issues:")
-        for issue in claim['inconsistency_details']:
-            print(f"      - {issue}")
+    event_log.info(
+        'paper.validation_detail',
+        "\n📄 Paper {paper_id}: {title:.60}...\n"
+        "   Status: {validation_status}\n"
+        "   Confidence: {confidence_score:.4f}\n"
+        "   Hallucination Flags: {hallucination_flags}\n"
+        "   Inconsistency Flags: {inconsistency_flags}",
+        paper_id=claim['paper_id'], title=claim['title'], validation_status=claim['validation_status'],
+        confidence_score=claim['confidence_score'], hallucination_flags=claim['hallucination_flags'],
+        inconsistency_flags=claim['inconsistency_flags']
+    )
+    for issue in claim['inconsistency_details']:
+        event_log.warning('claim.inconsistency', "   ⚠️  Issue: {issue}", paper_id=claim['paper_id'], issue=issue)
 
 print(f"\n\n💾 Data structure ready: 'enhanced_fact_check_result'")
 print(f"   Keys: {list(enhanced_fact_check_result.keys())}")
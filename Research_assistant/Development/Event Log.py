@@ -0,0 +1,184 @@
+import atexit
+import json
+import os
+import queue
+import string
+import sys
+import threading
+import time
+
+# Structured event log for the pipeline
+# Per-item output (per paper, chunk and claim) goes through event_log instead of print().
+# Events below the level, or with no sink to receive them, are dropped before any formatting.
+
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
+
+# Minimum level of emitted events (RESEARCH_LOG_LEVEL=DEBUG shows per-chunk previews)
+LOG_LEVEL = os.environ.get('RESEARCH_LOG_LEVEL', 'INFO').upper()
+# JSONL file receiving every emitted event; unset to keep events off disk
+EVENT_LOG_PATH = os.environ.get('RESEARCH_EVENT_LOG')
+# Headless runs: no human-readable rendering on the console
+LOG_QUIET = os.environ.get('RESEARCH_QUIET', '').lower() in ('1', 'true', 'yes')
+
+class _EventFormatter(string.Formatter):
+    """str.format with one extra spec: {items:join} renders a list as 'a, b, c'."""
+
+    def format_field(self, value, format_spec):
+        if format_spec == 'join':
+            return ', '.join(str(item) for item in value)
+        return super().format_field(value, format_spec)
+
+_formatter = _EventFormatter()
+
+def render_event(event):
+    """
+    Human-readable text of an event.
+
+    Args:
+        event: Event dictionary with 'event', optional 'message' template and fields
+
+    Returns:
+        The message template filled with the event's fields, or 'event key=value ...'
+    """
+    fields = {k: v for k, v in event.items() if k not in ('ts', 'level', 'event', 'message')}
+    if event.get('message'):
+        return _formatter.format(event['message'], **fields)
+    return ' '.join([event['event']] + [f"{k}={v}" for k, v in fields.items()])
+
+def render_jsonl(path, level='DEBUG', out=None):
+    """
+    Print a JSONL event log as human-readable text.
+
+    Args:
+        path: JSONL file written by EventLog
+        level: Minimum level to render
+        out: Output stream (defaults to stdout)
+    """
+    out = out or sys.stdout
+    threshold = LOG_LEVELS[level]
+    with open(path) as f:
+        for line in f:
+            event = json.loads(line)
+            if LOG_LEVELS[event['level']] >= threshold:
+                out.write(render_event(event) + '\n')
+
+class EventLog:
+    """
+    Leveled, structured event log with a console renderer and a JSONL sink.
+
+    emit() returns after one comparison when the event is below the level or
+    no sink wants it. Console rendering fills the message template on the
+    calling thread, so captured block output keeps its order. JSONL events
+    are queued and serialized and written in batches by a background thread.
+    The message template is stored unformatted, with the event's fields.
+    """
+
+    def __init__(self, level=LOG_LEVEL, path=EVENT_LOG_PATH, quiet=LOG_QUIET, batch_size=512):
+        """
+        Args:
+            level: Minimum level name, e.g. 'INFO'
+            path: JSONL file to append events to, or None
+            quiet: Do not render events on the console
+            batch_size: Events written per batch by the writer thread
+        """
+        self.level = LOG_LEVELS[level]
+        self.path = path
+        self.quiet = quiet
+        self.batch_size = batch_size
+        self.counts = {name: 0 for name in LOG_LEVELS}
+        self.dropped = 0
+        # Nothing is rendered or written below this level
+        self.min_level = self.level if (path or not quiet) else float('inf')
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._writer_pid = None
+        self._lock = threading.Lock()
+        if path:
+            atexit.register(self.close)
+
+    def enabled_for(self, level):
+        """Whether an event at this level would reach a sink; use it to guard costly fields."""
+        return LOG_LEVELS[level] >= self.min_level
+
+    def _ensure_writer(self):
+        # Forked workers inherit the queue but not the thread; start one per process
+        if self._writer_pid != os.getpid():
+            with self._lock:
+                if self._writer_pid != os.getpid():
+                    self._queue = queue.SimpleQueue()
+                    self._writer = threading.Thread(target=self._write_loop, name='event-log', daemon=True)
+                    self._writer.start()
+                    self._writer_pid = os.getpid()
+
+    def _write_loop(self):
+        events = self._queue
+        with open(self.path, 'a') as f:
+            while True:
+                batch = [events.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(events.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = batch[-1] is None
+                lines = [json.dumps(event, default=str) for event in batch if event is not None]
+                if lines:
+                    f.write('\n'.join(lines) + '\n')
+                    f.flush()
+                if stop:
+                    return
+
+    def emit(self, level, event, message=None, **fields):
+        """
+        Record an event.
+
+        Args:
+            level: Level name, e.g. 'INFO'
+            event: Dotted event name, e.g. 'paper.read'
+            message: Optional str.format template rendered with the fields on the console
+            **fields: Structured event data
+        """
+        severity = LOG_LEVELS[level]
+        if severity < self.min_level:
+            self.dropped += 1
+            return
+        self.counts[level] += 1
+        record = {'ts': time.time(), 'level': level, 'event': event, 'message': message, **fields}
+        if not self.quiet:
+            print(render_event(record))
+        if self.path:
+            self._ensure_writer()
+            self._queue.put(record)
+
+    def debug(self, event, message=None, **fields):
+        self.emit('DEBUG', event, message, **fields)
+
+    def info(self, event, message=None, **fields):
+        self.emit('INFO', event, message, **fields)
+
+    def warning(self, event, message=None, **fields):
+        self.emit('WARNING', event, message, **fields)
+
+    def error(self, event, message=None, **fields):
+        self.emit('ERROR', event, message, **fields)
+
+    def close(self):
+        """Write out queued events and stop the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is not None and self._writer_pid == os.getpid():
+                self._queue.put(None)
+                writer.join()
+            self._writer_pid = None
+
+    def summary(self):
+        return {'level': self.level, 'path': self.path, 'quiet': self.quiet, 'emitted': dict(self.counts),
+                'dropped': self.dropped}
+
+event_log = EventLog()
+
+print("=" * 60)
+print("EVENT LOG")
+print("=" * 60)
+print(f"\n📝 Level: {LOG_LEVEL} | Console: {'off' if LOG_QUIET else 'on'} | JSONL: {EVENT_LOG_PATH or 'off'}")
+print("=" * 60)
@@ -20,6 +20,18 @@ print("=" * 80)
 
 metrics = enhanced_fact_check_result['validation_metrics']
 
+# A run deadline can stop the enhanced fact-check before every paper (or any) is checked
+unchecked_papers = enhanced_fact_check_result.get('incomplete_papers', []) if enhanced_fact_check_result.get('partial') else []
+if unchecked_papers:
+    print(f"\n⚠️  Partial fact-check output: {len(unchecked_papers)} papers not checked before the run deadline")
+
+def annotate_empty_chart(ax, what):
+    """Replace the axes of a chart without data by a centered note."""
+    ax.set_axis_off()
+    reason = ' (fact-check stopped at the run deadline)' if unchecked_papers else ''
+    ax.text(0.5, 0.5, f"No {what}{reason}", transform=ax.transAxes, ha='center', va='center',
+            color=SECONDARY_TEXT, fontsize=14, style='italic')
+
 # Figure 1: Validation Status Distribution
 validation_fig = plt.figure(figsize=(10, 6), facecolor=BACKGROUND)
 ax1 = validation_fig.add_subplot(111, facecolor=BACKGROUND)
@@ -42,6 +54,8 @@ ax1.spines['bottom'].set_color(SECONDARY_TEXT)
 ax1.spines['left'].set_color(SECONDARY_TEXT)
 ax1.spines['top'].set_visible(False)
 ax1.spines['right'].set_visible(False)
+if not statuses:
+    annotate_empty_chart(ax1, 'validated papers')
 
 # Add value labels on bars
 for bar in bars:
@@ -87,6 +101,8 @@ for bar in bars2:
 legend = ax2.legend(loc='upper right', facecolor=BACKGROUND, edgecolor=SECONDARY_TEXT, fontsize=10)
 for text in legend.get_texts():
     text.set_color(PRIMARY_TEXT)
+if not paper_ids:
+    annotate_empty_chart(ax2, 'validated papers')
 
 plt.tight_layout()
 print("✅ Figure 2: Confidence Scores by Paper created")
@@ -129,6 +145,8 @@ for bars in [bars3a, bars3b]:
 legend = ax3.legend(loc='upper right', facecolor=BACKGROUND, edgecolor=SECONDARY_TEXT, fontsize=10)
 for text in legend.get_texts():
     text.set_color(PRIMARY_TEXT)
+if not paper_ids:
+    annotate_empty_chart(ax3, 'validated papers')
 
 plt.tight_layout()
 print("✅ Figure 3: Hallucination and Inconsistency Flags created")
@@ -208,6 +226,8 @@ ax5.spines['right'].set_visible(False)
 legend = ax5.legend(loc='upper right', facecolor=BACKGROUND, edgecolor=SECONDARY_TEXT, fontsize=9)
 for text in legend.get_texts():
     text.set_color(PRIMARY_TEXT)
+if not all_claim_confidences:
+    annotate_empty_chart(ax5, 'checked claims')
 
 plt.tight_layout()
 print("✅ Figure 5: Individual Claim Confidence Scores created")
@@ -18,6 +18,18 @@ print("=" * 80)
 print("INSIGHT VISUALIZATION DASHBOARD")
 print("=" * 80)
 
+# A run deadline can cut Agent 4 short, leaving whole sections empty; their charts show a note instead
+skipped_sections = insight_generator_output.get('partial_sections', []) if insight_generator_output.get('partial') else []
+if skipped_sections:
+    print(f"\n⚠️  Partial insight output: {', '.join(skipped_sections)} skipped at the run deadline")
+
+def annotate_empty_chart(ax, what, section=None):
+    """Replace the axes of a chart without data by a centered note."""
+    ax.set_axis_off()
+    reason = ' (skipped at the run deadline)' if section in skipped_sections else ''
+    ax.text(0.5, 0.5, f"No {what}{reason}", transform=ax.transAxes, ha='center', va='center',
+            color=SECONDARY_TEXT, fontsize=14, style='italic')
+
 # ============================================================================
 # Chart 1: Trend Analysis - Identified Research Trends
 # ============================================================================
@@ -43,6 +55,8 @@ trends_ax.spines['left'].set_color(SECONDARY_TEXT)
 trends_ax.spines['top'].set_visible(False)
 trends_ax.spines['right'].set_visible(False)
 trends_ax.invert_yaxis()
+if not trends:
+    annotate_empty_chart(trends_ax, 'research trends')
 
 # Add value labels
 for bar in bars_trends:
@@ -131,6 +145,8 @@ severity_ax.spines['left'].set_color(SECONDARY_TEXT)
 severity_ax.spines['top'].set_visible(False)
 severity_ax.spines['right'].set_visible(False)
 severity_ax.set_xlim(0, 3.5)
+if not gaps:
+    annotate_empty_chart(severity_ax, 'research gaps')
 
 # Add severity labels
 for bar, gap in zip(bars_severity, gaps):
@@ -184,6 +200,8 @@ contrib_ax.spines['bottom'].set_color(SECONDARY_TEXT)
 contrib_ax.spines['left'].set_color(SECONDARY_TEXT)
 contrib_ax.spines['top'].set_visible(False)
 contrib_ax.spines['right'].set_visible(False)
+if not contrib_names:
+    annotate_empty_chart(contrib_ax, 'contribution types', 'comparative_findings')
 
 # Add count labels
 for bar, count in zip(bars_contrib, contrib_counts):
@@ -235,6 +253,8 @@ future_ax.spines['top'].set_visible(False)
 future_ax.spines['right'].set_visible(False)
 future_ax.invert_yaxis()
 future_ax.set_xlim(0, 3.5)
+if not future_dirs:
+    annotate_empty_chart(future_ax, 'future research directions', 'future_research_directions')
 
 # Add priority labels
 for bar, direction in zip(bars_future, future_dirs):
@@ -269,7 +289,7 @@ topics_sorted = [t[0] for t in sorted_topics]
 freqs_sorted = [t[1] for t in sorted_topics]
 
 # Color gradient based on frequency
-max_freq = max(freqs_sorted)
+max_freq = max(freqs_sorted, default=0)
 topic_colors = []
 for freq in freqs_sorted:
     if freq == max_freq:
@@ -292,6 +312,8 @@ topic_ax.spines['left'].set_color(SECONDARY_TEXT)
 topic_ax.spines['top'].set_visible(False)
 topic_ax.spines['right'].set_visible(False)
 topic_ax.invert_yaxis()
+if not topic_freq:
+    annotate_empty_chart(topic_ax, 'topic frequencies')
 
 # Add frequency labels
 for bar, freq in zip(bars_topic, freqs_sorted):
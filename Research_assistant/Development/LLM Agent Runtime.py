@@ -0,0 +1,404 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+print("=" * 80)
+print("LLM AGENT RUNTIME")
+print("=" * 80)
+
+# Backend selection: the offline stub by default, or an HTTP completion endpoint
+LLM_BACKEND_URL = os.environ.get('RESEARCH_LLM_URL')
+LLM_TIMEOUT_SECONDS = float(os.environ.get('RESEARCH_LLM_TIMEOUT', 30))
+LLM_MAX_RETRIES = int(os.environ.get('RESEARCH_LLM_RETRIES', 2))
+
+# Concurrent model calls allowed per agent
+AGENT_CONCURRENCY = {
+    'paper_reader': 8,
+    'summarization': 8,
+    'fact_check': 16,
+    'insight_generator': 4,
+    'report_writer': 2
+}
+
+def count_tokens(text):
+    """Whitespace token count, the same measure the chunker uses for token_count."""
+    return len(text.split())
+
+class LLMBackendError(RuntimeError):
+    """Raised by a backend when a completion request fails."""
+
+    def __init__(self, message, retriable=True):
+        super().__init__(message)
+        self.retriable = retriable
+
+class LLMCallError(RuntimeError):
+    """Raised by AgentRuntime when a call still fails after all retries."""
+
+@dataclass
+class Completion:
+    """Result of one model call."""
+    text: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_seconds: float = 0.0
+    attempts: int = 1
+    cached: bool = False
+
+class LLMBackend(ABC):
+    """Interface every model backend implements."""
+
+    model = 'unknown'
+
+    @abstractmethod
+    async def complete(self, prompt, max_tokens=256, temperature=0.0):
+        """
+        Generate a completion.
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Maximum completion length in tokens
+            temperature: Sampling temperature
+
+        Returns:
+            Completion
+
+        Raises:
+            LLMBackendError: If the request fails
+        """
+
+    async def aclose(self):
+        """Release connections held by the backend."""
+
+class StubLLMBackend(LLMBackend):
+    """
+    Offline backend returning canned or deterministic completions.
+
+    A prompt found in canned_responses returns that text; any other prompt
+    returns the first max_tokens words of its last non-empty line, tagged
+    with a digest of the prompt, so the same prompt always gets the same
+    answer. latency simulates model time and fail_every makes every n-th
+    call fail with a retriable error to exercise retries.
+    """
+
+    def __init__(self, canned_responses=None, latency=0.0, fail_every=0, model='stub-1'):
+        self.canned_responses = dict(canned_responses or {})
+        self.latency = latency
+        self.fail_every = fail_every
+        self.model = model
+        self.calls = 0
+
+    async def complete(self, prompt, max_tokens=256, temperature=0.0):
+        self.calls += 1
+        call_number = self.calls
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_every and call_number % self.fail_every == 0:
+            raise LLMBackendError(f"stub transient failure on call {call_number}")
+        text = self.canned_responses.get(prompt)
+        if text is None:
+            lines = [line.strip() for line in prompt.splitlines() if line.strip()]
+            digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8]
+            text = f"[{self.model}:{digest}] " + ' '.join((lines[-1] if lines else '').split()[:max_tokens])
+        return Completion(text=text, model=self.model, prompt_tokens=count_tokens(prompt),
+                          completion_tokens=count_tokens(text))
+
+class StubLLMServer:
+    """
+    Local HTTP server exposing a backend at POST /v1/completions.
+
+    Request body: {"prompt", "max_tokens", "temperature"}; response body:
+    {"text", "model", "usage": {"prompt_tokens", "completion_tokens"}}.
+    Used to exercise HTTPLLMBackend end to end without network access.
+    """
+
+    def __init__(self, backend=None, host='127.0.0.1', port=0):
+        self.backend = backend or StubLLMBackend()
+        self.host = host
+        self.port = port
+        self._server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/v1/completions"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _handle(self, reader, writer):
+        status, payload = 200, None
+        try:
+            method, path, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+            headers = await _read_headers(reader)
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            if method != 'POST' or path != '/v1/completions':
+                status, payload = 404, {'error': f"no route for {method} {path}"}
+            else:
+                request = json.loads(body or b'{}')
+                completion = await self.backend.complete(request['prompt'], request.get('max_tokens', 256),
+                                                         request.get('temperature', 0.0))
+                payload = {'text': completion.text, 'model': completion.model,
+                           'usage': {'prompt_tokens': completion.prompt_tokens,
+                                     'completion_tokens': completion.completion_tokens}}
+        except LLMBackendError as exc:
+            status, payload = 503, {'error': str(exc)}
+        except (ValueError, KeyError) as exc:
+            status, payload = 400, {'error': f"bad request: {exc}"}
+        data = json.dumps(payload).encode('utf-8')
+        writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                     f"Connection: close\r\n\r\n".encode('latin-1') + data)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+async def _read_headers(reader):
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1').strip()
+        if not line:
+            return headers
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+class HTTPLLMBackend(LLMBackend):
+    """Backend for a JSON completion endpoint speaking the StubLLMServer protocol."""
+
+    def __init__(self, url, model='http'):
+        parts = urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError(f"Only http:// endpoints are supported, got '{url}'")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or '/'
+        self.model = model
+
+    async def complete(self, prompt, max_tokens=256, temperature=0.0):
+        body = json.dumps({'prompt': prompt, 'max_tokens': max_tokens, 'temperature': temperature}).encode('utf-8')
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        except OSError as exc:
+            raise LLMBackendError(f"cannot connect to {self.host}:{self.port}: {exc}") from exc
+        try:
+            writer.write(f"POST {self.path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                         f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                         f"Connection: close\r\n\r\n".encode('latin-1') + body)
+            await writer.drain()
+            status = int((await reader.readline()).decode('latin-1').split(' ', 2)[1])
+            headers = await _read_headers(reader)
+            payload = json.loads(await reader.readexactly(int(headers.get('content-length', 0))))
+        # A dropped connection, truncated body, bad status line or non-JSON body is
+        # transient from the caller's point of view, so it is retried like an HTTP 5xx
+        except (OSError, asyncio.IncompleteReadError, IndexError, ValueError) as exc:
+            raise LLMBackendError(f"bad response from {self.host}:{self.port}: {exc!r}") from exc
+        finally:
+            writer.close()
+        if not isinstance(payload, dict) or (status == 200 and 'text' not in payload):
+            raise LLMBackendError(f"bad response from {self.host}:{self.port}: unexpected body {payload!r:.100}")
+        if status != 200:
+            raise LLMBackendError(f"HTTP {status}: {payload.get('error')}", retriable=status >= 500)
+        usage = payload.get('usage', {})
+        return Completion(text=payload['text'], model=payload.get('model', self.model),
+                          prompt_tokens=usage.get('prompt_tokens', count_tokens(prompt)),
+                          completion_tokens=usage.get('completion_tokens', count_tokens(payload['text'])))
+
+@dataclass
+class AgentCallStats:
+    """Per-agent call counters kept by AgentRuntime."""
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_seconds: float = 0.0
+
+class AgentRuntime:
+    """
+    Issues agent LLM calls concurrently with per-agent limits, timeouts and retries.
+
+    Each agent has its own semaphore (AGENT_CONCURRENCY), so a burst of
+    fact-check calls cannot starve the insight generator. A call is retried
+    with exponential backoff on timeouts and retriable backend errors.
+    """
+
+    def __init__(self, backend, concurrency=None, default_concurrency=4, timeout=LLM_TIMEOUT_SECONDS,
+                 max_retries=LLM_MAX_RETRIES, backoff=0.05):
+        """
+        Args:
+            backend: LLMBackend used for every call
+            concurrency: Mapping of agent name to concurrent call limit
+            default_concurrency: Limit for agents not in concurrency
+            timeout: Seconds allowed per attempt
+            max_retries: Retries after the first attempt
+            backoff: Initial retry delay in seconds (doubled per retry)
+        """
+        self.backend = backend
+        self.concurrency = dict(AGENT_CONCURRENCY if concurrency is None else concurrency)
+        self.default_concurrency = default_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats = defaultdict(AgentCallStats)
+        # Semaphores belong to an event loop, so they are kept per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self, agent):
+        per_loop = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if agent not in per_loop:
+            per_loop[agent] = asyncio.Semaphore(self.concurrency.get(agent, self.default_concurrency))
+        return per_loop[agent]
+
+    async def call(self, agent, prompt, max_tokens=256, temperature=0.0, deadline=None):
+        """
+        Make one model call on behalf of an agent.
+
+        Args:
+            agent: Agent name, e.g. 'summarization'
+            prompt: Prompt text
+            max_tokens: Maximum completion length
+            temperature: Sampling temperature
+            deadline: Optional Deadline bounding every attempt's timeout
+
+        Returns:
+            Completion
+
+        Raises:
+            LLMCallError: If every attempt fails
+            DeadlineExceeded: If the deadline passes before an attempt can start
+        """
+        stats = self.stats[agent]
+        async with self._semaphore(agent):
+            for attempt in range(self.max_retries + 1):
+                timeout = self.timeout
+                if deadline is not None:
+                    deadline.check(f"{agent} call")
+                    timeout = min(timeout, deadline.remaining())
+                started = time.perf_counter()
+                try:
+                    completion = await asyncio.wait_for(
+                        self.backend.complete(prompt, max_tokens=max_tokens, temperature=temperature), timeout
+                    )
+                except asyncio.TimeoutError:
+                    stats.timeouts += 1
+                    error = f"timed out after {timeout:.3g}s"
+                except LLMBackendError as exc:
+                    if not exc.retriable:
+                        stats.failures += 1
+                        raise LLMCallError(f"{agent}: {exc}") from exc
+                    error = str(exc)
+                else:
+                    completion.latency_seconds = time.perf_counter() - started
+                    completion.attempts = attempt + 1
+                    stats.calls += 1
+                    stats.prompt_tokens += completion.prompt_tokens
+                    stats.completion_tokens += completion.completion_tokens
+                    stats.latency_seconds += completion.latency_seconds
+                    return completion
+                if attempt < self.max_retries:
+                    stats.retries += 1
+                    await asyncio.sleep(self.backoff * 2 ** attempt)
+            stats.failures += 1
+            raise LLMCallError(f"{agent}: failed after {self.max_retries + 1} attempts ({error})")
+
+    async def map(self, agent, prompts, **kwargs):
+        """Run one call per prompt concurrently; results keep the order of prompts."""
+        return await asyncio.gather(*(self.call(agent, prompt, **kwargs) for prompt in prompts))
+
+    def summary(self):
+        """Per-agent call statistics as plain dictionaries."""
+        return {agent: vars(stats).copy() for agent, stats in self.stats.items()}
+
+def run_async(coro):
+    """
+    Run a coroutine to completion from synchronous block code.
+
+    Notebook-style canvases may already be running an event loop on this
+    thread; in that case the coroutine runs on a fresh loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    result = {}
+    def target():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as exc:
+            result['error'] = exc
+    thread = threading.Thread(target=target, name='run-async')
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+# Prompt templates shared by the agents
+AGENT_PROMPTS = {
+    'paper_reader': "Extract the main contribution of this paper.\nTitle: {title}\n{abstract}",
+    'summarization': "Summarize the paper in three sentences.\nTitle: {title}\n{abstract}",
+    'fact_check': "Does the paper support the claim '{claim}'? Answer SUPPORTED or UNSUPPORTED.\n{abstract}",
+    'insight_generator': "What research gaps does this paper leave open?\nTitle: {title}\n{abstract}",
+    'report_writer': "Write a one-paragraph overview of: {titles}"
+}
+
+def build_prompt(agent, **fields):
+    """Fill an agent's prompt template, normalizing whitespace in the fields."""
+    return AGENT_PROMPTS[agent].format(**{name: ' '.join(str(value).split()) for name, value in fields.items()})
+
+# Shared runtime for downstream agents (offline stub unless RESEARCH_LLM_URL is set)
+llm_backend = HTTPLLMBackend(LLM_BACKEND_URL) if LLM_BACKEND_URL else StubLLMBackend()
+agent_runtime = AgentRuntime(llm_backend)
+
+# Demo: every agent's calls for every paper issued concurrently through the HTTP path
+async def _runtime_demo(papers, latency=0.05):
+    async with StubLLMServer(StubLLMBackend(latency=latency, fail_every=7)) as server:
+        runtime = AgentRuntime(HTTPLLMBackend(server.url), backoff=0.01)
+        calls = [(agent, build_prompt(agent, title=p['title'], abstract=p['abstract']))
+                 for p in papers for agent in ('paper_reader', 'summarization', 'insight_generator')]
+        calls += [('fact_check', build_prompt('fact_check', claim=keyword, abstract=p['abstract']))
+                  for p in papers for keyword in p['keywords']]
+        calls.append(('report_writer', build_prompt('report_writer', titles='; '.join(p['title'] for p in papers))))
+        started = time.perf_counter()
+        completions = await asyncio.gather(*(runtime.call(agent, prompt) for agent, prompt in calls))
+        return runtime, calls, completions, time.perf_counter() - started
+
+# The demo covers at most this many papers, so large corpora do not multiply its calls
+RUNTIME_DEMO_PAPERS = 10
+demo_runtime, demo_calls, demo_completions, demo_wall = run_async(_runtime_demo(sample_papers[:RUNTIME_DEMO_PAPERS]))
+demo_serial = sum(c.latency_seconds for c in demo_completions)
+
+print(f"\n🤖 Default backend: {type(llm_backend).__name__} ({llm_backend.model})")
+print(f"   Timeout: {agent_runtime.timeout}s | Retries: {agent_runtime.max_retries}")
+print(f"   Concurrency limits: {AGENT_CONCURRENCY}")
+print(f"\n📡 Stub server demo: {len(demo_calls)} calls over HTTP")
+for agent, stats in demo_runtime.summary().items():
+    print(f"   • {agent:<18} calls {stats['calls']:>3} | retries {stats['retries']} | "
+          f"tokens {stats['prompt_tokens']}→{stats['completion_tokens']}")
+print(f"\n   Sample completion: {demo_completions[0].text[:90]}...")
+print(f"   Wall time: {demo_wall * 1000:.0f} ms vs {demo_serial * 1000:.0f} ms if issued one by one "
+      f"({demo_serial / demo_wall:.1f}x)")
+print("=" * 80)
@@ -0,0 +1,372 @@
+import asyncio
+import atexit
+import dataclasses
+import hashlib
+import os
+import pickle
+import re
+import time
+from collections import OrderedDict
+import numpy as np
+import scipy.sparse as sp
+
+print("=" * 80)
+print("LLM RESPONSE CACHE")
+print("=" * 80)
+
+LLM_CACHE_DIR = os.environ.get('RESEARCH_LLM_CACHE_DIR', 'llm_cache')
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get('RESEARCH_LLM_CACHE_SIZE', 10000))
+# Semantic reuse of near-duplicate prompts is opt-in; by default only identical prompts hit
+LLM_CACHE_SEMANTIC = os.environ.get('RESEARCH_LLM_CACHE_SEMANTIC', '').lower() in ('1', 'true', 'yes')
+# Cosine similarity between prompt embeddings above which a cached response is reused
+LLM_CACHE_SEMANTIC_THRESHOLD = 0.95
+# Template fields a semantic hit must repeat verbatim; the others (title, abstract, ...) may differ slightly
+LLM_CACHE_EXACT_FIELDS = ('claim', 'question')
+
+def _template_pattern(template):
+    parts = re.split(r'\{(\w+)\}', template)
+    return re.compile(''.join(re.escape(part) if i % 2 == 0 else f'(?P<{part}>.*?)' for i, part in enumerate(parts)),
+                      re.DOTALL)
+
+PROMPT_PATTERNS = {agent: _template_pattern(template) for agent, template in AGENT_PROMPTS.items()}
+
+def prompt_scope(model, max_tokens, prompt):
+    """
+    Prompts a semantic lookup may match against each other.
+
+    A prompt built by build_prompt is scoped to its model, max_tokens, agent
+    template and the values of its LLM_CACHE_EXACT_FIELDS, so a fact check
+    of one claim never reuses the answer about another claim.
+
+    Returns:
+        Hashable scope, or None for a prompt no template produced (exact lookup only)
+    """
+    for agent, pattern in PROMPT_PATTERNS.items():
+        match = pattern.fullmatch(prompt)
+        if match:
+            exact = tuple((name, match.group(name)) for name in LLM_CACHE_EXACT_FIELDS if name in pattern.groupindex)
+            return model, max_tokens, agent, exact
+    return None
+
+class SemanticIndex:
+    """
+    Growable sparse matrix of prompt embeddings with tombstoned deletes.
+
+    Rows are appended in place to CSR buffers whose capacity doubles when
+    full, so an insert costs O(row size) amortized and a lookup is one
+    sparse-dense product over the stored rows. Removed rows are masked out
+    and compacted away once they make up half of the rows.
+    """
+
+    def __init__(self, n_features):
+        self.n_features = n_features
+        self.rows = 0
+        self.nnz = 0
+        self.dead = 0
+        self.keys = []
+        self.row_of = {}
+        self._data = np.zeros(64)
+        self._indices = np.zeros(64, dtype=np.int32)
+        self._indptr = np.zeros(17, dtype=np.int64)
+        self._alive = np.zeros(16, dtype=bool)
+
+    def __len__(self):
+        return self.rows - self.dead
+
+    @staticmethod
+    def _grown(array, needed):
+        if needed <= len(array):
+            return array
+        grown = np.zeros(max(needed, 2 * len(array)), dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    def add(self, key, vector):
+        """Append the embedding (1 x n_features sparse row) of a key."""
+        vector = vector.tocsr()
+        self._data = self._grown(self._data, self.nnz + vector.nnz)
+        self._indices = self._grown(self._indices, self.nnz + vector.nnz)
+        self._indptr = self._grown(self._indptr, self.rows + 2)
+        self._alive = self._grown(self._alive, self.rows + 1)
+        self._data[self.nnz:self.nnz + vector.nnz] = vector.data
+        self._indices[self.nnz:self.nnz + vector.nnz] = vector.indices
+        self.nnz += vector.nnz
+        self._indptr[self.rows + 1] = self.nnz
+        self._alive[self.rows] = True
+        self.row_of[key] = self.rows
+        self.keys.append(key)
+        self.rows += 1
+
+    def remove(self, key):
+        """Tombstone a key's row; the buffers are compacted when half of the rows are dead."""
+        row = self.row_of.pop(key, None)
+        if row is None:
+            return
+        self._alive[row] = False
+        self.dead += 1
+        if self.dead * 2 >= self.rows:
+            self._compact()
+
+    def _matrix(self):
+        return sp.csr_matrix((self._data[:self.nnz], self._indices[:self.nnz], self._indptr[:self.rows + 1]),
+                             shape=(self.rows, self.n_features))
+
+    def _compact(self):
+        live = np.flatnonzero(self._alive[:self.rows])
+        matrix = self._matrix()[live]
+        self.keys = [self.keys[row] for row in live]
+        self.row_of = {key: row for row, key in enumerate(self.keys)}
+        self.rows, self.nnz, self.dead = len(live), matrix.nnz, 0
+        self._data = np.array(matrix.data, dtype=np.float64)
+        self._indices = np.array(matrix.indices, dtype=np.int32)
+        self._indptr = np.array(matrix.indptr, dtype=np.int64)
+        self._alive = np.ones(self.rows, dtype=bool)
+
+    def most_similar(self, vector):
+        """
+        Live key whose embedding is most similar to a query embedding.
+
+        Returns:
+            Tuple of (key, cosine similarity), or (None, 0.0) when the index is empty
+        """
+        if len(self) == 0:
+            return None, 0.0
+        similarities = self._matrix() @ vector.toarray().ravel()
+        similarities[~self._alive[:self.rows]] = -np.inf
+        row = int(np.argmax(similarities))
+        return self.keys[row], float(similarities[row])
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of model responses with exact and semantic lookup.
+
+    Exact lookup hashes (model, max_tokens, prompt). Semantic lookup embeds
+    the prompt with the knowledge base TF-IDF vectorizer and reuses the most
+    similar cached response within the prompt's scope (see prompt_scope)
+    when its cosine similarity reaches the threshold. Each scope has its own
+    SemanticIndex. Entries are persisted as one pickle file, rewritten every
+    autosave_every new entries and at interpreter exit; prompt embeddings
+    are recomputed on load, so a refitted vectorizer never meets stale
+    vectors.
+    """
+
+    def __init__(self, directory=LLM_CACHE_DIR, vectorizer=None, max_entries=LLM_CACHE_MAX_ENTRIES,
+                 semantic_threshold=LLM_CACHE_SEMANTIC_THRESHOLD, autosave_every=64):
+        """
+        Args:
+            directory: Directory of the cache file, or None for an in-memory cache
+            vectorizer: Fitted TF-IDF vectorizer enabling semantic lookup (None for exact only)
+            max_entries: Entries kept before least-recently-used ones are evicted
+            semantic_threshold: Minimum prompt similarity for a semantic hit
+            autosave_every: Save after this many new entries (0 to save only explicitly)
+        """
+        self.directory = directory
+        self.vectorizer = vectorizer
+        self.max_entries = max_entries
+        self.semantic_threshold = semantic_threshold
+        self.autosave_every = autosave_every
+        self.entries = OrderedDict()
+        self.metrics = {'exact_hits': 0, 'semantic_hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0,
+                        'tokens_saved': 0}
+        self._indexes = {}
+        self._scopes = {}
+        self._unsaved = 0
+        if self.path and os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                for key, entry in pickle.load(f).items():
+                    self._insert(key, entry)
+        if self.path:
+            atexit.register(self.flush)
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, 'responses.pkl') if self.directory else None
+
+    @staticmethod
+    def key(model, prompt, max_tokens):
+        return hashlib.sha256(f"{model}\x00{max_tokens}\x00{prompt}".encode('utf-8')).hexdigest()
+
+    def _embed(self, prompt):
+        return self.vectorizer.transform([prompt]).tocsr()
+
+    def _insert(self, key, entry):
+        if key not in self.entries and self.vectorizer is not None:
+            scope = prompt_scope(entry['model'], entry['max_tokens'], entry['prompt'])
+            if scope is not None:
+                if scope not in self._indexes:
+                    self._indexes[scope] = SemanticIndex(len(self.vectorizer.vocabulary_))
+                self._indexes[scope].add(key, self._embed(entry['prompt']))
+                self._scopes[key] = scope
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            evicted, _ = self.entries.popitem(last=False)
+            scope = self._scopes.pop(evicted, None)
+            if scope is not None:
+                self._indexes[scope].remove(evicted)
+                if not self._indexes[scope]:
+                    del self._indexes[scope]
+            self.metrics['evictions'] += 1
+
+    def get(self, model, prompt, max_tokens, semantic=False):
+        """
+        Look up a cached response.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            max_tokens: Completion token limit
+            semantic: Also accept a near-duplicate prompt of the same scope
+
+        Returns:
+            Tuple of (entry or None, 'exact' | 'semantic' | None)
+        """
+        key = self.key(model, prompt, max_tokens)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.metrics['exact_hits'] += 1
+            self.metrics['tokens_saved'] += entry['prompt_tokens'] + entry['completion_tokens']
+            return entry, 'exact'
+        index = self._indexes.get(prompt_scope(model, max_tokens, prompt)) if semantic and self.vectorizer else None
+        if index is not None:
+            match, similarity = index.most_similar(self._embed(prompt))
+            if match is not None and similarity >= self.semantic_threshold:
+                candidate = self.entries[match]
+                self.entries.move_to_end(match)
+                self.metrics['semantic_hits'] += 1
+                self.metrics['tokens_saved'] += candidate['prompt_tokens'] + candidate['completion_tokens']
+                return candidate, 'semantic'
+        self.metrics['misses'] += 1
+        return None, None
+
+    def put(self, model, prompt, max_tokens, completion):
+        """Store a completion for a prompt."""
+        self._insert(self.key(model, prompt, max_tokens), {
+            'model': model,
+            'prompt': prompt,
+            'max_tokens': max_tokens,
+            'text': completion.text,
+            'prompt_tokens': completion.prompt_tokens,
+            'completion_tokens': completion.completion_tokens,
+            'stored_at': time.time()
+        })
+        self._unsaved += 1
+        if self.autosave_every and self._unsaved >= self.autosave_every:
+            self.save()
+
+    def save(self):
+        """Write the cache file atomically; returns its path (None for in-memory caches)."""
+        if self.path is None:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(dict(self.entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+        return self.path
+
+    def flush(self):
+        """Save if entries were added since the last save (registered to run at exit)."""
+        return self.save() if self._unsaved else None
+
+    def stats(self):
+        """Hit/miss counters with the overall hit rate."""
+        hits = self.metrics['exact_hits'] + self.metrics['semantic_hits']
+        lookups = hits + self.metrics['misses']
+        return {**self.metrics, 'entries': len(self.entries), 'lookups': lookups,
+                'hit_rate': round(hits / lookups, 4) if lookups else 0.0}
+
+class CachedLLMBackend(LLMBackend):
+    """
+    Backend wrapper that answers from a ResponseCache before calling the model.
+
+    Only deterministic calls (temperature 0) are cached. Concurrent calls
+    for the same prompt share one in-flight model request; if that request
+    is cancelled (its caller timed out or went away), the waiting calls do
+    not inherit the cancellation and one of them issues the request again.
+    """
+
+    def __init__(self, backend, cache, semantic=False):
+        self.backend = backend
+        self.cache = cache
+        self.semantic = semantic
+        self.model = backend.model
+        self._inflight = {}
+
+    async def complete(self, prompt, max_tokens=256, temperature=0.0):
+        if temperature:
+            return await self.backend.complete(prompt, max_tokens=max_tokens, temperature=temperature)
+        entry, mode = self.cache.get(self.model, prompt, max_tokens, semantic=self.semantic)
+        if entry is not None:
+            return Completion(text=entry['text'], model=entry['model'], prompt_tokens=entry['prompt_tokens'],
+                              completion_tokens=entry['completion_tokens'], cached=True)
+
+        key = self.cache.key(self.model, prompt, max_tokens)
+        while key in self._inflight:
+            self.cache.metrics['coalesced'] += 1
+            completion = await asyncio.shield(self._inflight[key])
+            if completion is not None:
+                return dataclasses.replace(completion, cached=True)
+            # The shared request was cancelled; wait on a newer one or lead our own
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[key] = pending
+        try:
+            completion = await self.backend.complete(prompt, max_tokens=max_tokens, temperature=temperature)
+        except asyncio.CancelledError:
+            pending.set_result(None)
+            raise
+        except BaseException as exc:
+            pending.set_exception(exc)
+            pending.exception()  # waiters re-raise it; the future itself must not warn
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self.cache.put(self.model, prompt, max_tokens, completion)
+        pending.set_result(completion)
+        return completion
+
+    async def aclose(self):
+        self.cache.save()
+        await self.backend.aclose()
+
+# Put the cache in front of the shared agent backend
+llm_response_cache = ResponseCache(vectorizer=tfidf_vectorizer if LLM_CACHE_SEMANTIC else None)
+llm_backend = CachedLLMBackend(llm_backend, llm_response_cache, semantic=LLM_CACHE_SEMANTIC)
+agent_runtime = AgentRuntime(llm_backend, concurrency=agent_runtime.concurrency, timeout=agent_runtime.timeout,
+                             max_retries=agent_runtime.max_retries)
+
+# Demo on a private in-memory cache with semantic lookup: a cold run, a re-run,
+# revised abstracts (near-duplicates) and the same abstracts with other claims
+async def _cache_demo(papers):
+    model_backend = StubLLMBackend(latency=0.02)
+    demo_cache = ResponseCache(directory=None, vectorizer=tfidf_vectorizer)
+    runtime = AgentRuntime(CachedLLMBackend(model_backend, demo_cache, semantic=True))
+    def prompts(revised=False):
+        return [build_prompt(agent, title=p['title'], abstract=p['abstract'] + (' (revised)' if revised else ''))
+                for p in papers for agent in ('summarization', 'insight_generator')]
+    claims = lambda keyword_index: [build_prompt('fact_check', claim=p['keywords'][keyword_index], abstract=p['abstract'])
+                                    for p in papers if len(p['keywords']) > 1]
+    rounds = {}
+    for name, batch in [('cold run', prompts() + claims(0)), ('re-run', prompts() + claims(0)),
+                        ('near-duplicates', prompts(revised=True)), ('other claims', claims(1))]:
+        before = model_backend.calls
+        await runtime.map('summarization', batch)
+        rounds[name] = (len(batch), model_backend.calls - before)
+    return demo_cache, rounds
+
+demo_cache, demo_rounds = run_async(_cache_demo(sample_papers[:RUNTIME_DEMO_PAPERS]))
+
+print(f"\n🗄️  Agent backend: {type(llm_backend).__name__} → {type(llm_backend.backend).__name__}")
+print(f"   Cache file: {llm_response_cache.path} ({len(llm_response_cache.entries)} entries loaded)")
+print(f"   Max entries: {llm_response_cache.max_entries} | Semantic lookup: "
+      f"{f'on (threshold {llm_response_cache.semantic_threshold})' if LLM_CACHE_SEMANTIC else 'off'}")
+print(f"\n🔁 Cache demo (in-memory):")
+for name, (prompts, model_calls) in demo_rounds.items():
+    print(f"   • {name:<16} {prompts} prompts → {model_calls} model calls")
+demo_stats = demo_cache.stats()
+print(f"\n   Exact hits: {demo_stats['exact_hits']} | Semantic hits: {demo_stats['semantic_hits']} | "
+      f"Misses: {demo_stats['misses']} | Hit rate: {demo_stats['hit_rate']:.0%}")
+print(f"   Tokens saved: {demo_stats['tokens_saved']}")
+print("=" * 80)
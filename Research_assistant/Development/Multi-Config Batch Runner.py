@@ -0,0 +1,215 @@
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+print("=" * 80)
+print("MULTI-CONFIG BATCH RUNNER")
+print("=" * 80)
+
+# JSON file with a list of {"topic", "keywords", "questions"} objects; the demo configs are used when unset
+BATCH_CONFIGS_PATH = os.environ.get('RESEARCH_BATCH_CONFIGS')
+# Agent chains run concurrently, one per research config
+BATCH_CONFIG_WORKERS = int(os.environ.get('RESEARCH_BATCH_WORKERS', 4))
+# The demo re-runs Agents 1-5 once per config, so it is opt-in
+BATCH_DEMO = os.environ.get('RESEARCH_BATCH_DEMO', '').lower() in ('1', 'true', 'yes')
+
+def load_research_configs(path=BATCH_CONFIGS_PATH):
+    """
+    Research configurations for a batch run.
+
+    Args:
+        path: JSON file listing configurations, or None for the built-in demo set
+
+    Returns:
+        List of configuration dictionaries (see build_research_config)
+    """
+    if path:
+        with open(path) as f:
+            return [build_research_config(c['topic'], c.get('keywords', []), c.get('questions', []))
+                    for c in json.load(f)]
+    return [
+        config,
+        build_research_config(
+            "deep learning for medical image analysis",
+            ["convolutional neural networks", "radiology", "diagnostic accuracy"],
+            ["How do deep learning models compare with radiologists?"]
+        ),
+        build_research_config(
+            "natural language processing of clinical records",
+            ["electronic health records", "clinical notes", "information extraction"],
+            ["Which clinical outcomes can be predicted from free-text notes?"]
+        )
+    ]
+
+class PrefetchedSearch:
+    """Search function answering from batched results; unseen or deeper queries fall back to the index."""
+
+    def __init__(self, index, results):
+        self.index = index
+        self.results = results
+        self.fallbacks = 0
+
+    def __call__(self, query, top_k=3, deadline=None):
+        if deadline is not None:
+            top_k = deadline.scaled_top_k(top_k)
+        results = self.results.get(query)
+        if results is None or len(results) < min(top_k, len(self.index.knowledge_base)):
+            self.fallbacks += 1
+            results = self.index.search_batch([query], top_k)[0]
+        return results[:top_k]
+
+class _ThreadOutput(io.TextIOBase):
+    """Stdout proxy sending each batch worker's prints to its own buffer."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    def _target(self):
+        buffer = getattr(self.local, 'buffer', None)
+        return self.fallback if buffer is None else buffer
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+def thread_output():
+    """
+    Thread-routing stdout for batch workers.
+
+    The canvas runtime already routes prints per thread; elsewhere a proxy
+    is installed once and left in place, so stdout is never swapped back
+    while other threads print.
+
+    Returns:
+        The stdout proxy whose per-thread buffer receives a worker's prints
+    """
+    if not isinstance(getattr(sys.stdout, 'local', None), threading.local):
+        sys.stdout = _ThreadOutput(sys.stdout)
+    return sys.stdout
+
+def batch_checkpoint_dir(position):
+    """Checkpoint directory of a batch chain, apart from the main pipeline's (None when disabled)."""
+    return os.path.join(CHECKPOINT_DIR, 'batch', f"config_{position}") if CHECKPOINT_DIR else None
+
+def run_config_chain(research_config, search_function, question_evidence, output, checkpoints=None):
+    """
+    Run Agents 1-5 for one research configuration on the shared corpus.
+
+    Args:
+        research_config: Configuration steering retrieval
+        search_function: Search function over the shared index
+        question_evidence: Planned evidence for the config's questions and keywords
+        output: Thread-routing stdout capturing this chain's console output
+        checkpoints: Checkpoint directory for this chain's handoffs, or None to skip checkpointing
+
+    Returns:
+        Dictionary with the agent outputs, the chain's duration and its log
+    """
+    buffer = io.StringIO()
+    output.local.buffer = buffer
+    started = time.perf_counter()
+    try:
+        with checkpoint_directory(checkpoints):
+            store = HandoffStore()
+            reader = paper_reader_agent(sample_papers, search_function, store, research_config=research_config)
+            summaries = summarization_agent(reader, processed_papers, tfidf_vectorizer, store)
+            validation = fact_check_agent(summaries, sample_papers, store)
+            insights = insight_generator_agent(validation, summaries, store, topic_clusters=topic_clusters)
+            report = report_writer_agent(insights, validation, summaries, reader, store,
+                                         question_evidence=question_evidence)
+    finally:
+        output.local.buffer = None
+    return {
+        'config': research_config,
+        'paper_reader': reader,
+        'summarization': summaries,
+        'fact_check': validation,
+        'insight_generator': insights,
+        'report_writer': report,
+        'seconds': time.perf_counter() - started,
+        'log': buffer.getvalue()
+    }
+
+def run_batch(configs, index, top_k=CONTEXT_CANDIDATES, workers=BATCH_CONFIG_WORKERS):
+    """
+    Run the agent pipeline for many research configs against one corpus index.
+
+    Retrieval for every (config, paper) pair is answered by a single batched
+    search, and the questions and keywords of all configs by one retrieval
+    plan; the per-config agent chains then run concurrently, each
+    checkpointing under its own directory when checkpoints are enabled.
+
+    Args:
+        configs: Research configuration dictionaries
+        index: CorpusIndex built once for the corpus
+        top_k: Retrieval depth prefetched per query
+        workers: Concurrent agent chains
+
+    Returns:
+        Tuple of (per-config results in config order, batch statistics)
+    """
+    queries = list(dict.fromkeys(paper_search_query(paper, c) for c in configs for paper in sample_papers))
+    started = time.perf_counter()
+    search_function = PrefetchedSearch(index, dict(zip(queries, index.search_batch(queries, top_k))))
+    planned, _ = RetrievalPlanner(index).answer([q for c in configs for q in c['questions']],
+                                                [k for c in configs for k in c['keywords']])
+    by_text = {(entry['kind'], entry['question']): entry for entry in planned}
+    config_evidence = [[by_text[('question', q)] for q in c['questions']] +
+                       [by_text[('keyword', k)] for k in c['keywords']] for c in configs]
+    retrieval_seconds = time.perf_counter() - started
+
+    output = thread_output()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(configs))), thread_name_prefix='batch') as pool:
+        results = list(pool.map(
+            lambda position, c, e: run_config_chain(c, search_function, e, output, batch_checkpoint_dir(position)),
+            range(len(configs)), configs, config_evidence))
+    chains_seconds = time.perf_counter() - started
+    return results, {
+        'configs': len(configs),
+        'queries': len(queries),
+        'retrieval_seconds': retrieval_seconds,
+        'chains_wall_seconds': chains_seconds,
+        'chains_serial_seconds': sum(r['seconds'] for r in results),
+        'search_fallbacks': search_function.fallbacks
+    }
+
+if BATCH_DEMO:
+    batch_configs = load_research_configs()
+    batch_results, batch_stats = run_batch(batch_configs, corpus_index)
+
+    # Batched retrieval ranks chunks exactly like semantic_search
+    batch_matches_search = all(
+        [r['chunk_id'] for r in batched] == [r['chunk_id'] for r in semantic_search(query, top_k=3)]
+        for query, batched in zip(test_queries, corpus_index.search_batch(test_queries, top_k=3))
+    )
+
+    print(f"\n🗂️  Shared corpus index: {corpus_index.matrix.shape[0]} chunks × {corpus_index.matrix.shape[1]} dims")
+    print(f"   Research configs: {batch_stats['configs']} | Workers: {BATCH_CONFIG_WORKERS}")
+    print(f"\n🔍 Batched retrieval: {batch_stats['queries']} queries in one product "
+          f"({batch_stats['retrieval_seconds'] * 1000:.1f} ms, fallbacks: {batch_stats['search_fallbacks']})")
+    print(f"   Matches semantic_search: {'✓' if batch_matches_search else '✗'}")
+    print(f"\n🤖 Agent chains:")
+    for result in batch_results:
+        report = result['report_writer']
+        relevance = result['summarization']['aggregate_insights']['average_relevance']
+        print(f"   • {result['config']['topic'][:50]:<50} {report['papers_reported']} papers | "
+              f"{len(report['question_evidence'])} evidence lists | "
+              f"relevance {relevance:.4f} | {'COMPLETE' if report['report_complete'] else 'INCOMPLETE'} | "
+              f"{result['seconds']:.2f}s")
+    print(f"\n⏱️  Chains wall time: {batch_stats['chains_wall_seconds']:.2f}s "
+          f"(sum of chains: {batch_stats['chains_serial_seconds']:.2f}s)")
+    print(f"   Marginal cost per config: {(batch_stats['retrieval_seconds'] + batch_stats['chains_serial_seconds']) / len(batch_results):.2f}s "
+          f"(retrieval + agents; ingest and embedding are shared)")
+else:
+    print("\n⏭️  Batch demo skipped (set RESEARCH_BATCH_DEMO=1 to run Agents 1-5 for every research config)")
+    print("✅ Multi-config batch runner ready")
+print("=" * 80)
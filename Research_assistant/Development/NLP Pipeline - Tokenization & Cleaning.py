@@ -70,45 +70,47 @@ print("=" * 80)
 print("NLP PIPELINE: TEXT EXTRACTION, TOKENIZATION & CLEANING")
 print("=" * 80)
 
-for idx, paper in enumerate(sample_papers, 1):
-    print(f"\n{'='*80}")
-    print(f"Processing Paper {idx}: {paper['title'][:60]}...")
-    print('='*80)
-    
-    # Step 1: Extract text
-    raw_text = extract_text(paper)
-    print(f"\n✓ Step 1: Text Extraction")
-    print(f"  - Raw text length: {len(raw_text)} characters")
-    
-    # Step 2: Clean text
-    cleaned_text = clean_text(raw_text)
-    print(f"\n✓ Step 2: Text Cleaning (lowercase, remove special chars)")
-    print(f"  - Cleaned text length: {len(cleaned_text)} characters")
-    print(f"  - Preview: {cleaned_text[:150]}...")
-    
-    # Step 3: Tokenize into sentences for chunking later
-    sentences = sent_tokenize(raw_text)
-    print(f"\n✓ Step 3: Sentence Tokenization")
-    print(f"  - Total sentences: {len(sentences)}")
-    
-    # Step 4: Tokenize and clean (remove stop words, lemmatize)
-    tokens = tokenize_and_clean(cleaned_text)
-    print(f"\n✓ Step 4: Word Tokenization & Cleaning")
-    print(f"  - Total tokens: {len(tokens)}")
-    print(f"  - Sample tokens (first 20): {tokens[:20]}")
-    
-    # Store processed data
-    processed_papers.append({
-        'paper_id': idx,
-        'title': paper['title'],
-        'raw_text': raw_text,
-        'cleaned_text': cleaned_text,
-        'sentences': sentences,
-        'tokens': tokens,
-        'token_count': len(tokens),
-        'sentence_count': len(sentences),
-        'keywords': paper['keywords']
-    })
+with stage_tracer.span('nlp.process_papers', papers=len(sample_papers)):
+    for idx, paper in enumerate(sample_papers, 1):
+        # Step 1: Extract text
+        raw_text = extract_text(paper)
+        
+        # Step 2: Clean text
+        cleaned_text = clean_text(raw_text)
+        
+        # Step 3: Tokenize into sentences for chunking later
+        sentences = sent_tokenize(raw_text)
+        
+        # Step 4: Tokenize and clean (remove stop words, lemmatize)
+        tokens = tokenize_and_clean(cleaned_text)
+        
+        event_log.info(
+            'paper.processed',
+            "\n" + "=" * 80 + "\nProcessing Paper {paper_id}: {title:.60}...\n" + "=" * 80 + "\n"
+            "\n✓ Step 1: Text Extraction\n  - Raw text length: {raw_chars} characters\n"
+            "\n✓ Step 2: Text Cleaning (lowercase, remove special chars)\n  - Cleaned text length: {cleaned_chars} characters\n"
+            "\n✓ Step 3: Sentence Tokenization\n  - Total sentences: {sentences}\n"
+            "\n✓ Step 4: Word Tokenization & Cleaning\n  - Total tokens: {tokens}",
+            paper_id=idx, title=paper['title'], raw_chars=len(raw_text), cleaned_chars=len(cleaned_text),
+            sentences=len(sentences), tokens=len(tokens)
+        )
+        event_log.debug(
+            'paper.tokens_preview', "  - Preview: {preview}...\n  - Sample tokens (first 20): {sample_tokens}",
+            paper_id=idx, preview=cleaned_text[:150], sample_tokens=tokens[:20]
+        )
+        
+        # Store processed data
+        processed_papers.append({
+            'paper_id': idx,
+            'title': paper['title'],
+            'raw_text': raw_text,
+            'cleaned_text': cleaned_text,
+            'sentences': sentences,
+            'tokens': tokens,
+            'token_count': len(tokens),
+            'sentence_count': len(sentences),
+            'keywords': paper['keywords']
+        })
 
 print(f"\n\n{'='*80}")
 print("PIPELINE SUMMARY")
@@ -0,0 +1,219 @@
+import re
+import numpy as np
+import pandas as pd
+
+print("=" * 80)
+print("NUMERIC FACT TABLE EXTRACTION")
+print("=" * 80)
+
+NUMBER_PATTERN = r"(?P<value>\d+(?:\.\d+)?)(?:\s*[-–]\s*(?P<value_high>\d+(?:\.\d+)?))?"
+METRIC_WORD = r"[a-z][a-z0-9\-]*"
+
+# Ordered extraction patterns; a number claimed by an earlier pattern is not re-used
+NUMERIC_FACT_PATTERNS = [
+    # "improve diagnostic accuracy by 23%", "reduce medical errors by 37%"
+    ('change', re.compile(
+        rf"\b(?:(?:improve|reduce|increase|decrease)[sd]?\s+)?(?P<metric>{METRIC_WORD}(?:\s+{METRIC_WORD})?)"
+        rf"\s+by\s+{NUMBER_PATTERN}(?:\s*(?P<unit>%|percent))?")),
+    # "95% sensitivity", "98% specificity"
+    ('equals', re.compile(
+        rf"\b{NUMBER_PATTERN}\s*(?P<unit>%|percent)\s+(?P<metric>{METRIC_WORD})")),
+    # "F1 scores above 0.90"
+    ('bound', re.compile(
+        rf"\b(?P<metric>{METRIC_WORD}(?:\s+{METRIC_WORD})?)\s+(?P<qualifier>above|below|over|under|exceeding)\s+{NUMBER_PATTERN}(?:\s*(?P<unit>%|percent))?")),
+    # "127 randomized controlled trials", "24-48 hours"
+    ('count', re.compile(
+        rf"\b{NUMBER_PATTERN}\s+(?P<metric>(?:{METRIC_WORD}\s+){{0,2}}?(?P<unit>trials|studies|patients|participants|papers|hospitals|images|hours|days|weeks|months|years))\b")),
+]
+
+# Bound qualifiers: the fact asserts a value beyond the number, not the number itself
+LOWER_BOUND_QUALIFIERS = {'above', 'over', 'exceeding'}
+UPPER_BOUND_QUALIFIERS = {'below', 'under'}
+BOUND_QUALIFIERS = LOWER_BOUND_QUALIFIERS | UPPER_BOUND_QUALIFIERS
+
+METRIC_STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'on', 'their', 'its', 'that',
+                     'improve', 'improves', 'improved', 'reduce', 'reduces', 'reduced',
+                     'increase', 'increases', 'increased', 'decrease', 'decreases', 'decreased'}
+
+def normalize_metric(metric):
+    """Lowercase, drop stop/verb words and singularize a metric phrase."""
+    words = [w for w in metric.lower().split() if w not in METRIC_STOP_WORDS]
+    words = [w[:-1] if len(w) > 3 and w.endswith('s') and not w.endswith('ss') else w for w in words]
+    return ' '.join(words)
+
+def value_bounds(qualifier, value, value_high):
+    """
+    Interval of values a fact asserts.
+
+    A bound ("above 0.90") is one-sided, a range ("24-48 hours") spans its
+    two numbers and any other fact is a single point.
+    """
+    if qualifier in LOWER_BOUND_QUALIFIERS:
+        return value, np.inf
+    if qualifier in UPPER_BOUND_QUALIFIERS:
+        return -np.inf, value
+    return value, value if np.isnan(value_high) else value_high
+
+def extract_numeric_facts(text, paper_id=None):
+    """
+    Extract (metric, value, unit, paper_id, span) tuples from a text.
+
+    Args:
+        text: Source text (abstract, raw paper text or a single claim)
+        paper_id: Paper identifier stored with every fact
+
+    Returns:
+        List of fact dictionaries in text order
+    """
+    normalized = ' '.join(text.split())
+    lowered = normalized.lower()
+    facts = []
+    claimed_positions = set()
+
+    for qualifier, pattern in NUMERIC_FACT_PATTERNS:
+        for match in pattern.finditer(lowered):
+            value_start = match.start('value')
+            if value_start in claimed_positions:
+                continue
+            metric = normalize_metric(match.group('metric'))
+            if not metric:
+                continue
+            claimed_positions.add(value_start)
+            unit = match.group('unit') or ''
+            facts.append({
+                'metric': metric,
+                'value': float(match.group('value')),
+                'value_high': float(match.group('value_high')) if match.group('value_high') else np.nan,
+                'unit': '%' if unit == 'percent' else (normalize_metric(unit) if qualifier == 'count' else unit),
+                'qualifier': match.groupdict().get('qualifier') or qualifier,
+                'paper_id': paper_id,
+                'span': normalized[match.start():match.end()],
+                'char_start': match.start(),
+                'char_end': match.end()
+            })
+
+    return sorted(facts, key=lambda f: f['char_start'])
+
+class NumericFactTable:
+    """
+    Columnar table of quantitative facts with an index from metric terms to rows.
+
+    Lookups by full metric phrase or by any single metric word are one
+    dictionary access returning the matching row positions.
+    """
+
+    def __init__(self, papers):
+        """
+        Args:
+            papers: Processed paper dictionaries with paper_id and raw_text
+        """
+        rows = [fact for paper in papers for fact in extract_numeric_facts(paper['raw_text'], paper['paper_id'])]
+        self.facts = pd.DataFrame(rows, columns=[
+            'metric', 'value', 'value_high', 'unit', 'qualifier', 'paper_id', 'span', 'char_start', 'char_end'
+        ])
+        self.facts = self.facts.astype({
+            'metric': 'category',
+            'value': 'float64',
+            'value_high': 'float64',
+            'unit': 'category',
+            'qualifier': 'category',
+            'paper_id': 'int32',
+            'char_start': 'int32',
+            'char_end': 'int32'
+        })
+
+        index = {}
+        for row_idx, metric in enumerate(self.facts['metric']):
+            for term in {metric, *metric.split()}:
+                index.setdefault(term, []).append(row_idx)
+        self.index = {term: np.array(row_ids, dtype=np.int32) for term, row_ids in index.items()}
+
+    def lookup(self, metric):
+        """Return the fact rows for a metric phrase or single metric word."""
+        row_ids = self.index.get(normalize_metric(metric))
+        if row_ids is None:
+            return self.facts.iloc[0:0]
+        return self.facts.iloc[row_ids]
+
+    def check_claim(self, claim, tolerance=1e-6):
+        """
+        Check every numeric statement in a claim against the corpus fact table.
+
+        Facts are compared as intervals (see value_bounds), so qualifiers and
+        ranges count: a corpus fact supports a claim when everything it asserts
+        lies within what the claim asserts ("F1 0.95" supports "F1 above 0.90",
+        not the reverse). Relative changes ("improves accuracy by 40%") are
+        only compared with relative changes, and values only with values in
+        the same unit; a metric known to the corpus only in other units or
+        forms is NOT_COMPARABLE rather than contradicted.
+
+        Args:
+            claim: Claim text
+            tolerance: Absolute tolerance for value comparison
+
+        Returns:
+            List of per-number checks with SUPPORTED, CONSISTENT (a corpus bound
+            or range admits the claim without stating it), CONTRADICTED (every
+            comparable corpus value disagrees), NOT_COMPARABLE or UNKNOWN_METRIC
+            status
+        """
+        checks = []
+        for fact in extract_numeric_facts(claim):
+            rows = self.lookup(fact['metric'])
+            if rows.empty:
+                # Fall back to the head word of the metric phrase ("diagnostic accuracy" -> "accuracy")
+                rows = self.lookup(fact['metric'].split()[-1])
+            comparable = rows[(rows['unit'] == fact['unit']).to_numpy() &
+                              ((rows['qualifier'] == 'change').to_numpy() == (fact['qualifier'] == 'change'))]
+            if rows.empty:
+                status = 'UNKNOWN_METRIC'
+                matching = rows
+            elif comparable.empty:
+                # e.g. "above 90%" against "above 0.90", or a level against a relative change
+                status = 'NOT_COMPARABLE'
+                matching = comparable
+            else:
+                claim_low, claim_high = value_bounds(fact['qualifier'], fact['value'], fact['value_high'])
+                bounds = np.array([value_bounds(q, v, h) for q, v, h in zip(
+                    comparable['qualifier'], comparable['value'], comparable['value_high'])]).reshape(-1, 2)
+                lows, highs = bounds[:, 0], bounds[:, 1]
+                entailed = (lows >= claim_low - tolerance) & (highs <= claim_high + tolerance)
+                # Intervals touching at one number only share it when neither side is an (open) bound
+                overlap = np.minimum(highs, claim_high) - np.maximum(lows, claim_low)
+                closed = ~comparable['qualifier'].isin(BOUND_QUALIFIERS).to_numpy() & \
+                    (fact['qualifier'] not in BOUND_QUALIFIERS)
+                overlapping = (overlap > tolerance) | ((np.abs(overlap) <= tolerance) & closed)
+                matching = comparable[entailed]
+                if entailed.any():
+                    status = 'SUPPORTED'
+                elif overlapping.any():
+                    status = 'CONSISTENT'
+                else:
+                    status = 'CONTRADICTED'
+            checks.append({
+                'metric': fact['metric'],
+                'value': fact['value'],
+                'value_high': fact['value_high'],
+                'unit': fact['unit'],
+                'qualifier': fact['qualifier'],
+                'status': status,
+                'supporting_paper_ids': sorted(set(matching['paper_id'].tolist())),
+                'corpus_values': rows['value'].tolist()
+            })
+        return checks
+
+# Extract all quantitative findings from the corpus
+numeric_fact_table = NumericFactTable(processed_papers)
+
+print(f"\n✅ Extracted {len(numeric_fact_table.facts)} numeric facts")
+print(f"   Indexed metric terms: {len(numeric_fact_table.index)}")
+print(f"   Papers with facts: {numeric_fact_table.facts['paper_id'].nunique()}")
+
+print("\n" + "=" * 80)
+print("NUMERIC FACT TABLE")
+print("=" * 80)
+print(numeric_fact_table.facts[['paper_id', 'metric', 'value', 'value_high', 'unit', 'qualifier']].to_string(index=False))
+
+print("\n" + "=" * 80)
+print("✅ Numeric fact table ready: 'numeric_fact_table'")
+print("=" * 80)
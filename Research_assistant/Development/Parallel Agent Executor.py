@@ -0,0 +1,393 @@
+import multiprocessing as mp
+import os
+import pickle
+import queue
+import sys
+import time
+from datetime import datetime
+from multiprocessing import shared_memory
+import cloudpickle  # installed with joblib, a scikit-learn dependency
+import numpy as np
+
+print("=" * 80)
+print("PARALLEL AGENT EXECUTOR (process pool over shared-memory knowledge base)")
+print("=" * 80)
+
+# Worker processes for per-paper agent work (defaults to every core)
+AGENT_WORKERS = int(os.environ.get('RESEARCH_AGENT_WORKERS', 0)) or os.cpu_count() or 1
+# The serial agents already produce these outputs; re-running them on the pool to
+# compare is a demonstration and runs only when asked for
+PARALLEL_AGENTS_DEMO = os.environ.get('RESEARCH_PARALLEL_DEMO', '').lower() in ('1', 'true', 'yes')
+
+# Offsets of arrays inside the shared segment are aligned to cache lines
+_SEGMENT_ALIGNMENT = 64
+
+class SharedKnowledgeBase:
+    """
+    Knowledge base packed into one shared-memory segment.
+
+    The segment holds the embedding matrix, paper ids, token counts and
+    ranges, and a UTF-8 text blob with the chunk ids, paper titles and
+    chunk texts. A worker attaches by segment name and reads everything
+    through numpy views, so no chunk is pickled or copied per process.
+    """
+
+    TEXT_FIELDS = ('chunk_id', 'paper_title', 'chunk_text')
+
+    def __init__(self, segment, layout, owner):
+        self.segment = segment
+        self.layout = layout
+        self.owner = owner
+        self.arrays = {
+            name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf, offset=offset)
+            for name, (offset, shape, dtype) in layout.items()
+        }
+        self.embeddings = self.arrays['embeddings']
+        self.embeddings.flags.writeable = owner
+
+    @classmethod
+    def create(cls, knowledge_base, embeddings):
+        """
+        Copy a knowledge base into a new shared-memory segment.
+
+        Args:
+            knowledge_base: List of chunk dictionaries from the embedding stage
+            embeddings: Dense embedding matrix, one row per chunk
+
+        Returns:
+            SharedKnowledgeBase owning the segment
+        """
+        encoded = [entry[field].encode('utf-8') for entry in knowledge_base for field in cls.TEXT_FIELDS]
+        text_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=text_offsets[1:])
+        arrays = {
+            'embeddings': np.ascontiguousarray(embeddings),
+            'paper_ids': np.array([entry['paper_id'] for entry in knowledge_base], dtype=np.int64),
+            'token_counts': np.array([entry['token_count'] for entry in knowledge_base], dtype=np.int64),
+            'token_ranges': np.array([(entry['token_start'], entry['token_end']) for entry in knowledge_base],
+                                     dtype=np.int64).reshape(-1, 2),
+            'text_offsets': text_offsets,
+            'text': np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        }
+
+        layout, size = {}, 0
+        for name, array in arrays.items():
+            size = -(-size // _SEGMENT_ALIGNMENT) * _SEGMENT_ALIGNMENT
+            layout[name] = (size, array.shape, array.dtype.str)
+            size += array.nbytes
+
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        shared = cls(segment, layout, owner=True)
+        for name, array in arrays.items():
+            shared.arrays[name][...] = array
+        shared.embeddings.flags.writeable = False
+        return shared
+
+    @classmethod
+    def attach(cls, handle):
+        """Attach to a segment from its handle without copying it."""
+        name, layout = handle
+        return cls(shared_memory.SharedMemory(name=name), layout, owner=False)
+
+    @property
+    def handle(self):
+        """Picklable (segment name, layout) pair used by workers to attach."""
+        return self.segment.name, self.layout
+
+    @property
+    def nbytes(self):
+        return self.segment.size
+
+    def __len__(self):
+        return len(self.arrays['paper_ids'])
+
+    def _text(self, slot):
+        offsets = self.arrays['text_offsets']
+        return bytes(self.arrays['text'][offsets[slot]:offsets[slot + 1]]).decode('utf-8')
+
+    def __getitem__(self, idx):
+        """Chunk record with the same metadata keys as a knowledge base entry."""
+        idx = int(idx)
+        record = {field: self._text(idx * len(self.TEXT_FIELDS) + pos) for pos, field in enumerate(self.TEXT_FIELDS)}
+        record['paper_id'] = int(self.arrays['paper_ids'][idx])
+        record['token_count'] = int(self.arrays['token_counts'][idx])
+        record['token_start'], record['token_end'] = (int(v) for v in self.arrays['token_ranges'][idx])
+        return record
+
+    def close(self):
+        """Release this process's views and mapping; the owner also removes the segment."""
+        self.arrays.clear()
+        self.embeddings = None
+        self.segment.close()
+        if self.owner:
+            self.segment.unlink()
+
+def shared_search_function(shared_kb, vectorizer):
+    """
+    Semantic search over a SharedKnowledgeBase with the semantic_search result format.
+
+    Args:
+        shared_kb: Attached SharedKnowledgeBase
+        vectorizer: Trained TF-IDF vectorizer
+
+    Returns:
+        Function search(query, top_k=3) returning ranked chunk dictionaries
+    """
+    def search(query, top_k=3):
+        similarities = cosine_scores(vectorizer.transform([query]), shared_kb.embeddings)
+        results = []
+        for idx in np.argsort(similarities)[::-1][:top_k]:
+            record = shared_kb[idx]
+            results.append({
+                'rank': len(results) + 1,
+                'similarity': float(similarities[idx]),
+                'chunk_id': record['chunk_id'],
+                'paper_id': record['paper_id'],
+                'paper_title': record['paper_title'],
+                'chunk_text': record['chunk_text'],
+                'token_count': record['token_count'],
+                'token_start': record['token_start'],
+                'token_end': record['token_end']
+            })
+        return results
+    return search
+
+class _ByValue:
+    """
+    Pickles a block-defined function, class or object by value.
+
+    Canvas block modules exist only in the process that ran the canvas, so a
+    spawned worker cannot import them; their code travels with the payload.
+    Unpickling yields the wrapped object itself.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __reduce__(self):
+        # Everything defined in a block module (and its sibling block modules) goes by value
+        block_package = sys.modules[__name__.rpartition('.')[0] or __name__]
+        cloudpickle.register_pickle_by_value(block_package)
+        return cloudpickle.loads, (cloudpickle.dumps(self.obj, protocol=pickle.HIGHEST_PROTOCOL),)
+
+def _run_task(kind, items, shared_kb, search, context):
+    """Run one batch of per-paper agent work inside a worker."""
+    if kind == 'read':
+        return [read_paper(paper_id, paper, search) for paper_id, paper in items]
+    if kind == 'summarize':
+        sentences = [context['sentences_by_paper'].get(info['paper_id'], []) for info in items]
+        ranked = textrank_summarize(sentences, context['tfidf_vectorizer'])
+        return [summarize_paper(info, key_sentences) for info, key_sentences in zip(items, ranked)]
+    if kind == 'cross_check':
+        return [cross_check_summary(summary, paper, shared_kb.embeddings, shared_kb, context['tfidf_vectorizer'],
+                                    span_index=context['span_index'], numeric_facts=context['numeric_facts'])
+                for summary, paper in items]
+    raise ValueError(f"Unknown task kind '{kind}'")
+
+def _agent_worker(kb_class, handle, context, tasks, results):
+    """Worker loop: attach to the shared knowledge base, then run tasks until the None sentinel."""
+    shared_kb = kb_class.attach(handle)
+    search = shared_search_function(shared_kb, context['tfidf_vectorizer'])
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            task_id, kind, items = task
+            try:
+                results.put((task_id, True, _run_task(kind, items, shared_kb, search, context)))
+            except Exception as exc:
+                results.put((task_id, False, f"{type(exc).__name__}: {exc}"))
+    finally:
+        shared_kb.close()
+
+class ParallelAgentExecutor:
+    """
+    Fans the per-paper work of Agents 1, 2 and the Enhanced Fact-Check out to
+    a pool of worker processes.
+
+    Workers are started with the forkserver (or spawn) method, never forked
+    from the canvas process, whose executor threads may hold locks at fork
+    time. The embedding matrix and chunk metadata live in a
+    SharedKnowledgeBase; workers attach to it explicitly by handle, so memory
+    stays constant as workers are added. A knowledge base already spilled to
+    disk is shared as is: workers map the same segments instead of copying
+    them into shared memory. Read-only context (vectorizer, tokenized
+    sentences, grounding indexes) is sent once per worker at start, and only
+    paper-sized task payloads cross the process boundary afterwards.
+    """
+
+    def __init__(self, knowledge_base, embeddings, tfidf_vectorizer, processed_papers, span_index=None,
+                 numeric_facts=None, workers=AGENT_WORKERS, chunksize=8):
+        """
+        Args:
+            knowledge_base: List of chunk dictionaries from the embedding stage
+            embeddings: Dense embedding matrix, one row per chunk
+            tfidf_vectorizer: Trained TF-IDF vectorizer
+            processed_papers: NLP pipeline output with tokenized sentences
+            span_index: Optional SpanGroundingIndex for the fact-check stage
+            numeric_facts: Optional NumericFactTable for the fact-check stage
+            workers: Number of worker processes
+            chunksize: Papers per task sent to a worker
+        """
+        self.workers = max(1, workers)
+        self.chunksize = chunksize
+        # Spilled segments are owned by the embedding stage; only a segment created here is removed on close
+        self.owns_kb = not isinstance(knowledge_base, SpilledKnowledgeBase)
+        self.shared_kb = SharedKnowledgeBase.create(knowledge_base, embeddings) if self.owns_kb else knowledge_base
+        self.context = {
+            'tfidf_vectorizer': tfidf_vectorizer,
+            'sentences_by_paper': {p['paper_id']: paper_summary_sentences(p) for p in processed_papers},
+            'span_index': span_index,
+            'numeric_facts': numeric_facts
+        }
+        self.task_bytes = 0
+        self.start_method = None
+        self.processes = []
+
+    def start(self):
+        """Start the worker processes; each attaches to the knowledge base by handle."""
+        ctx = mp.get_context('forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn')
+        self.start_method = ctx.get_start_method()
+        self.tasks, self.results = ctx.Queue(), ctx.Queue()
+        worker, kb_class, context = _ByValue(_agent_worker), _ByValue(type(self.shared_kb)), _ByValue(self.context)
+        self.processes = [
+            ctx.Process(target=worker, args=(kb_class, self.shared_kb.handle, context, self.tasks, self.results),
+                        name=f"agent-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for process in self.processes:
+            process.start()
+        return self
+
+    def close(self):
+        """Stop the workers and remove the shared segment (if this executor created it)."""
+        for _ in self.processes:
+            self.tasks.put(None)
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+        if self.owns_kb:
+            self.shared_kb.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def map(self, kind, items):
+        """
+        Run per-paper work on the pool.
+
+        Args:
+            kind: 'read', 'summarize' or 'cross_check'
+            items: Per-paper task arguments
+
+        Returns:
+            Results in the order of items
+        """
+        batches = [items[start:start + self.chunksize] for start in range(0, len(items), self.chunksize)]
+        for task_id, batch in enumerate(batches):
+            task = (task_id, kind, batch)
+            self.task_bytes += len(pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL))
+            self.tasks.put(task)
+
+        outputs = [None] * len(batches)
+        for _ in batches:
+            while True:
+                try:
+                    task_id, ok, payload = self.results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    dead = [p.name for p in self.processes if not p.is_alive()]
+                    if dead:
+                        raise RuntimeError(f"Agent worker(s) exited unexpectedly: {', '.join(dead)}")
+            if not ok:
+                raise RuntimeError(f"'{kind}' task {task_id} failed in a worker: {payload}")
+            outputs[task_id] = payload
+        return [result for batch in outputs for result in batch]
+
+    def paper_reader(self, papers):
+        """Agent 1 over the pool; returns the validated paper_reader output."""
+        extracted = self.map('read', [(idx + 1, paper) for idx, paper in enumerate(papers)])
+        return validate_handoff('paper_reader', {
+            'agent': 'Paper Reader',
+            'timestamp': datetime.now().isoformat(),
+            'papers_processed': len(extracted),
+            'extracted_papers': extracted
+        })
+
+    def summarization(self, paper_reader_data):
+        """Agent 2 over the pool; returns the validated summarization output."""
+        summaries = self.map('summarize', paper_reader_data['extracted_papers'])
+        return validate_handoff('summarization', {
+            'agent': 'Summarization',
+            'timestamp': datetime.now().isoformat(),
+            'input_agent': paper_reader_data['agent'],
+            'papers_summarized': len(summaries),
+            'summarization_method': 'TextRank',
+            'summaries': summaries,
+            'aggregate_insights': summary_aggregate_insights(summaries)
+        })
+
+    def enhanced_fact_check(self, summarization_data, original_papers):
+        """Enhanced Fact-Check over the pool; returns the validated enhanced_fact_check output."""
+        original_papers_map = {i + 1: paper for i, paper in enumerate(original_papers)}
+        validated_claims = self.map('cross_check', [(summary, original_papers_map[summary['paper_id']])
+                                                    for summary in summarization_data['summaries']])
+        return validate_handoff('enhanced_fact_check', {
+            'agent': 'Enhanced Fact-Check',
+            'timestamp': datetime.now().isoformat(),
+            'input_agent': summarization_data['agent'],
+            'papers_validated': len(validated_claims),
+            'cross_referenced_sources': len(self.shared_kb),
+            'validated_claims': validated_claims,
+            'validation_metrics': enhanced_validation_metrics(validated_claims)
+        })
+
+if PARALLEL_AGENTS_DEMO:
+    # Run the per-paper agent stages on the pool and compare with the serial agents
+    parallel_timings = {}
+    with ParallelAgentExecutor(knowledge_base, chunk_embeddings, tfidf_vectorizer, processed_papers,
+                               span_index=span_grounding_index, numeric_facts=numeric_fact_table) as agent_pool:
+        print(f"\n🧵 Workers: {agent_pool.workers} ({agent_pool.start_method}) | Papers per task: {agent_pool.chunksize}")
+        if agent_pool.owns_kb:
+            print(f"   Shared segment: {agent_pool.shared_kb.nbytes / 1024:.1f} KB for {len(agent_pool.shared_kb)} chunks "
+                  f"(pickled knowledge base: {len(pickle.dumps(knowledge_base)) / 1024:.1f} KB per worker if copied)")
+        else:
+            print(f"   Spilled segments: {agent_pool.shared_kb.nbytes / 1024:.1f} KB for {len(agent_pool.shared_kb)} chunks "
+                  f"(mapped by every worker, not copied)")
+
+        started = time.perf_counter()
+        parallel_reader_output = agent_pool.paper_reader(sample_papers)
+        parallel_timings['Paper Reader'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        parallel_summarization_output = agent_pool.summarization(parallel_reader_output)
+        parallel_timings['Summarization'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        parallel_enhanced_fact_check = agent_pool.enhanced_fact_check(parallel_summarization_output, sample_papers)
+        parallel_timings['Enhanced Fact-Check'] = time.perf_counter() - started
+        parallel_task_bytes = agent_pool.task_bytes
+
+    parallel_matches_serial = {
+        'Paper Reader': parallel_reader_output['extracted_papers'] == paper_reader_output['extracted_papers'],
+        'Summarization': [s['summary_points'] for s in parallel_summarization_output['summaries']]
+                         == [s['summary_points'] for s in summarization_output['summaries']],
+        'Enhanced Fact-Check': parallel_enhanced_fact_check['validation_metrics'] == enhanced_fact_check_result['validation_metrics']
+    }
+
+    print(f"\n{'=' * 80}")
+    print(f"✅ Parallel agent execution complete")
+    for stage, seconds in parallel_timings.items():
+        print(f"   • {stage:<20} {seconds * 1000:8.1f} ms | matches serial agent: {'✓' if parallel_matches_serial[stage] else '✗'}")
+    print(f"   • Task payload sent to workers: {parallel_task_bytes / 1024:.1f} KB")
+else:
+    print("\n⏭️  Parallel demo skipped (set RESEARCH_PARALLEL_DEMO=1 to re-run Agents 1-2 and the enhanced "
+          "fact-check on the worker pool and compare with the serial agents)")
+    print("✅ ParallelAgentExecutor ready")
+print("=" * 80)
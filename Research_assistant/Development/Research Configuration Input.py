@@ -19,14 +19,28 @@ research_questions = [
     "What are the main challenges in implementing AI in healthcare settings?"
 ]
 
+def build_research_config(topic, keywords, questions):
+    """
+    Assemble a research configuration dictionary.
+    
+    Args:
+        topic: Research topic
+        keywords: Key terms to focus the research
+        questions: Specific questions to answer
+    
+    Returns:
+        Configuration dictionary consumed by the downstream agents
+    """
+    return {
+        "topic": topic,
+        "keywords": list(keywords),
+        "questions": list(questions),
+        "num_keywords": len(keywords),
+        "num_questions": len(questions)
+    }
+
 # Configuration metadata
-config = {
-    "topic": research_topic,
-    "keywords": research_keywords,
-    "questions": research_questions,
-    "num_keywords": len(research_keywords),
-    "num_questions": len(research_questions)
-}
+config = build_research_config(research_topic, research_keywords, research_questions)
 
 # Display configuration summary
 print("=" * 60)
@@ -0,0 +1,201 @@
+import time
+import numpy as np
+
+print("=" * 80)
+print("RESEARCH QUESTION RETRIEVAL PLANNER")
+print("=" * 80)
+
+# Evidence chunks kept per research question or keyword
+QUESTION_EVIDENCE_TOP_K = 3
+
+class CorpusIndex:
+    """
+    Knowledge base embeddings stacked once and shared by every query batch.
+
+    Rows are L2-normalized up front, so one sparse-dense product scores a
+    whole batch of queries against every chunk by cosine similarity. A
+    spilled knowledge base contributes its memory-mapped matrix in place.
+    """
+
+    def __init__(self, knowledge_base, vectorizer):
+        self.knowledge_base = knowledge_base
+        self.vectorizer = vectorizer
+        if isinstance(knowledge_base, SpilledKnowledgeBase):
+            self.matrix = knowledge_base.normalized_embeddings()
+            return
+        matrix = np.vstack([k['embedding'] for k in knowledge_base])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms == 0, 1.0, norms)
+
+    def search_batch(self, queries, top_k=3):
+        """
+        Score many queries with one matrix product.
+
+        Args:
+            queries: List of query strings
+            top_k: Results per query
+
+        Returns:
+            One list of results per query, in the format of semantic_search
+        """
+        scores = np.asarray(self.vectorizer.transform(queries) @ self.matrix.T)
+        top_indices = np.argsort(scores, axis=1)[:, ::-1][:, :top_k]
+        results = []
+        for row, indices in zip(scores, top_indices):
+            entries = [self.knowledge_base[idx] for idx in indices]
+            results.append([{
+                'rank': rank,
+                'similarity': float(row[idx]),
+                'chunk_id': entry['chunk_id'],
+                'paper_id': entry['paper_id'],
+                'paper_title': entry['paper_title'],
+                'chunk_text': entry['chunk_text'],
+                'token_count': entry['token_count'],
+                'token_start': entry['token_start'],
+                'token_end': entry['token_end']
+            } for rank, (idx, entry) in enumerate(zip(indices, entries), 1)])
+        return results
+
+class RetrievalPlanner:
+    """
+    Plans and runs retrieval for research questions and keywords as one batch.
+
+    Each question or keyword is cleaned like the corpus (stop words removed,
+    lemmatized) and expanded into sub-queries: its full term set plus every
+    pair of adjacent terms, which targets the bigram features. Identical
+    sub-queries are shared across items, and scoring reads only the
+    vocabulary columns some sub-query uses, so overlapping terms are scored
+    once for the whole plan.
+    """
+
+    def __init__(self, index):
+        self.index = index
+
+    def expand(self, text):
+        """Sub-queries for one question or keyword, broadest first."""
+        terms = list(dict.fromkeys(tokenize_and_clean(clean_text(text))))
+        sub_queries = [' '.join(terms)] if terms else []
+        if len(terms) > 2:
+            sub_queries += [f"{first} {second}" for first, second in zip(terms, terms[1:])]
+        return sub_queries
+
+    def plan(self, questions, keywords=()):
+        """
+        Expand questions and keywords into one deduplicated set of sub-queries.
+
+        Args:
+            questions: Research questions
+            keywords: Research keywords, planned like questions
+
+        Returns:
+            Plan dictionary with the items, the shared sub-queries and expansion statistics
+        """
+        sub_query_ids = {}
+        items = []
+        expanded = 0
+        for kind, texts in [('question', questions), ('keyword', keywords)]:
+            for text in texts:
+                sub_queries = self.expand(text)
+                expanded += len(sub_queries)
+                items.append({
+                    'text': text,
+                    'kind': kind,
+                    'sub_queries': [sub_query_ids.setdefault(q, len(sub_query_ids)) for q in sub_queries]
+                })
+        return {
+            'items': items,
+            'sub_queries': list(sub_query_ids),
+            'stats': {'items': len(items), 'expanded_sub_queries': expanded, 'sub_queries': len(sub_query_ids)}
+        }
+
+    def execute(self, plan, top_k=QUESTION_EVIDENCE_TOP_K):
+        """
+        Score every sub-query of a plan in one pass and pool the scores per item.
+
+        An item's score for a chunk is the best score of any of its
+        sub-queries; the evidence records which sub-query matched.
+
+        Args:
+            plan: Plan from plan()
+            top_k: Evidence chunks per item
+
+        Returns:
+            List of per-item evidence dictionaries, in plan order
+        """
+        if not plan['sub_queries']:
+            plan['stats'].update(unique_terms=0, term_occurrences=0)
+            return [{'question': item['text'], 'kind': item['kind'], 'sub_queries': [], 'evidence': []}
+                    for item in plan['items']]
+        query_matrix = self.index.vectorizer.transform(plan['sub_queries']).tocsr()
+        terms = np.unique(query_matrix.indices)
+        scores = np.asarray(query_matrix[:, terms] @ self.index.matrix[:, terms].T)
+        plan['stats'].update(unique_terms=len(terms), term_occurrences=int(query_matrix.nnz))
+
+        evidence = []
+        for item in plan['items']:
+            entry = {'question': item['text'], 'kind': item['kind'],
+                     'sub_queries': [plan['sub_queries'][q] for q in item['sub_queries']], 'evidence': []}
+            if item['sub_queries']:
+                item_scores = scores[item['sub_queries']]
+                best = item_scores.max(axis=0)
+                matched = item_scores.argmax(axis=0)
+                for idx in np.argsort(best)[::-1][:top_k]:
+                    if best[idx] <= 0:
+                        break
+                    chunk = self.index.knowledge_base[idx]
+                    entry['evidence'].append({
+                        'chunk_id': chunk['chunk_id'],
+                        'paper_id': chunk['paper_id'],
+                        'paper_title': chunk['paper_title'],
+                        'similarity': round(float(best[idx]), 4),
+                        'matched_query': entry['sub_queries'][matched[idx]],
+                        'text_preview': chunk['chunk_text'][:100]
+                    })
+            evidence.append(entry)
+        return evidence
+
+    def answer(self, questions, keywords=(), top_k=QUESTION_EVIDENCE_TOP_K):
+        """Plan and execute in one call; returns (evidence, plan)."""
+        plan = self.plan(questions, keywords)
+        return self.execute(plan, top_k=top_k), plan
+
+# One index for the corpus; the planner and batch runs share it
+corpus_index = CorpusIndex(knowledge_base, tfidf_vectorizer)
+question_planner = RetrievalPlanner(corpus_index)
+question_evidence, question_plan = question_planner.answer(research_questions, research_keywords)
+
+print(f"\n🧭 Planned {question_plan['stats']['items']} items "
+      f"({len(research_questions)} questions, {len(research_keywords)} keywords)")
+print(f"   Sub-queries: {question_plan['stats']['expanded_sub_queries']} expanded → "
+      f"{question_plan['stats']['sub_queries']} after deduplication")
+print(f"   Terms scored: {question_plan['stats']['unique_terms']} unique of "
+      f"{question_plan['stats']['term_occurrences']} occurrences")
+for entry in question_evidence:
+    icon = '❓' if entry['kind'] == 'question' else '🔑'
+    print(f"\n   {icon} {entry['question']}")
+    for item in entry['evidence']:
+        print(f"      • {item['chunk_id']} (Paper {item['paper_id']}) {item['similarity']:.4f} "
+              f"via '{item['matched_query']}'")
+
+# Cost of many questions: one planned pass against one independent search per sub-query
+scaling_questions = [f"{template} {keyword}?" for template in
+                     ["What is known about", "How effective is", "What are the risks of",
+                      "How is evaluation done for", "Which datasets support", "What limits adoption of",
+                      "Who benefits from"]
+                     for keyword in research_keywords + test_queries + [research_topic]][:50]
+started = time.perf_counter()
+question_planner.answer(scaling_questions)
+planned_seconds = time.perf_counter() - started
+scaling_plan = question_planner.plan(scaling_questions)
+started = time.perf_counter()
+for sub_query in scaling_plan['sub_queries']:
+    semantic_search(sub_query, top_k=QUESTION_EVIDENCE_TOP_K)
+independent_seconds = time.perf_counter() - started
+started = time.perf_counter()
+corpus_index.search_batch(research_questions[:1], top_k=QUESTION_EVIDENCE_TOP_K)
+single_seconds = time.perf_counter() - started
+
+print(f"\n⚡ {len(scaling_questions)} questions ({scaling_plan['stats']['sub_queries']} sub-queries):")
+print(f"   Planned batch: {planned_seconds * 1000:.1f} ms | One search: {single_seconds * 1000:.1f} ms | "
+      f"Independent searches: {independent_seconds * 1000:.1f} ms")
+print("=" * 80)
@@ -0,0 +1,148 @@
+import math
+import os
+import time
+
+print("=" * 80)
+print("RUN DEADLINE & STAGE BUDGETS")
+print("=" * 80)
+
+# Whole-run budget in seconds (the canvas runner's --deadline sets this variable);
+# unset means an unbounded run in which no stage ever degrades
+RUN_DEADLINE_SECONDS = float(os.environ['RESEARCH_RUN_DEADLINE']) if os.environ.get('RESEARCH_RUN_DEADLINE') else None
+
+# Per-stage budgets in seconds, applied only under a run deadline; a stage's clock
+# starts when it first asks for its deadline
+STAGE_BUDGETS = {
+    'paper_reader': 30,
+    'summarization': 30,
+    'fact_check': 30,
+    'enhanced_fact_check': 60,
+    'insight_generator': 30,
+    'report_writer': 15,
+    'visualizations': 60
+}
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work is started after its deadline has passed."""
+
+class Deadline:
+    """
+    Point in time by which a unit of work must finish.
+
+    Deadlines nest: a child never ends after its parent, so a stage budget
+    is always bounded by the run deadline. A deadline of math.inf seconds
+    never expires.
+    """
+
+    def __init__(self, name, seconds, parent=None, clock=time.monotonic):
+        self.name = name
+        self.clock = clock
+        self.started_at = clock()
+        self.expires_at = self.started_at + seconds
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+        self.budget = self.expires_at - self.started_at
+
+    def remaining(self):
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - self.clock())
+
+    def expired(self):
+        return self.remaining() == 0.0
+
+    def fraction_remaining(self):
+        if math.isinf(self.budget):
+            return 1.0
+        return self.remaining() / self.budget if self.budget > 0 else 0.0
+
+    def check(self, what=''):
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceeded(f"{self.name} deadline exceeded{': ' + what if what else ''}")
+
+    def child(self, name, seconds):
+        """Deadline for a sub-task, bounded by this one."""
+        return Deadline(name, seconds, parent=self, clock=self.clock)
+
+    def scaled_top_k(self, top_k, minimum=1):
+        """
+        Shrink a retrieval depth as the budget runs out.
+
+        The full top_k is used while at least half the budget is left; below
+        that it falls linearly towards minimum.
+        """
+        fraction = self.fraction_remaining()
+        if fraction >= 0.5:
+            return top_k
+        return max(minimum, min(top_k, math.ceil(top_k * fraction * 2)))
+
+class RunDeadline(Deadline):
+    """
+    Run-level deadline handing out per-stage deadlines and recording degraded stages.
+
+    Without a run budget (seconds=None) the run and every stage are unbounded.
+    """
+
+    def __init__(self, seconds=RUN_DEADLINE_SECONDS, stage_budgets=None):
+        super().__init__('run', math.inf if seconds is None else seconds)
+        self.bounded = seconds is not None
+        self.stage_budgets = dict(STAGE_BUDGETS if stage_budgets is None else stage_budgets) if self.bounded else {}
+        self.stages = {}
+        self.degraded = {}
+
+    def stage(self, name):
+        """The deadline of a stage, created (and started) on first use."""
+        if name not in self.stages:
+            self.stages[name] = self.child(name, self.stage_budgets.get(name, self.remaining()))
+        return self.stages[name]
+
+    def mark_degraded(self, stage, note):
+        """Record that a stage cut work short to meet its deadline."""
+        self.degraded.setdefault(stage, []).append(note)
+
+    def summary(self):
+        """Budgets and remaining seconds (None when unbounded) with the degraded stages."""
+        seconds = lambda value: None if math.isinf(value) else round(value, 3)
+        return {
+            'run_budget_seconds': seconds(self.budget),
+            'run_remaining_seconds': seconds(self.remaining()),
+            'stages': {name: {'budget': seconds(d.budget), 'remaining': seconds(d.remaining())}
+                       for name, d in self.stages.items()},
+            'degraded': dict(self.degraded)
+        }
+
+def mark_incomplete(output, deadline, paper_ids=(), sections=(), note=None):
+    """
+    Flag an agent output as partial because its stage deadline passed.
+
+    Repeated calls add to the papers and sections already recorded.
+
+    Args:
+        output: Agent output dictionary (modified in place)
+        deadline: The stage Deadline that ran out
+        paper_ids: Papers that were not processed
+        sections: Output sections that were skipped or degraded
+        note: Description of the degradation (defaults to what was skipped)
+    """
+    output['partial'] = True
+    if paper_ids:
+        output['incomplete_papers'] = output.get('incomplete_papers', []) + list(paper_ids)
+    if sections:
+        output['partial_sections'] = output.get('partial_sections', []) + list(sections)
+    if note is None:
+        skipped = [f"{len(paper_ids)} papers"] if paper_ids else []
+        skipped += list(sections)
+        note = f"{deadline.name} deadline reached; skipped {', '.join(skipped)}"
+    run_deadline.mark_degraded(deadline.name, note)
+    print(f"\n⏱️  {note}")
+
+run_deadline = RunDeadline()
+
+if run_deadline.bounded:
+    print(f"\n⏱️  Run deadline: {run_deadline.budget:.4g}s")
+    print(f"   Stage budgets:")
+    for stage_name, budget in run_deadline.stage_budgets.items():
+        print(f"   • {stage_name:<20} {budget:>5}s")
+else:
+    print("\n⏱️  Run deadline: none (set --deadline or RESEARCH_RUN_DEADLINE to budget the run and its stages)")
+print("=" * 80)
@@ -3,6 +3,16 @@ from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import pandas as pd
 
+# TF-IDF parameters (declared in stages.yaml, part of the stage cache key)
+TFIDF_PARAMS = {
+    'max_features': 500,  # Limit dimensionality
+    'ngram_range': (1, 2),  # Unigrams and bigrams for better context
+    'min_df': 1,
+    'max_df': 0.95,
+    'sublinear_tf': True,  # Better term frequency scaling
+    'norm': 'l2'  # Normalize for cosine similarity
+}
+
 print("=" * 80)
 print("SEMANTIC EMBEDDING GENERATION")
 print("=" * 80)
@@ -19,46 +29,63 @@ chunk_texts = [chunk['chunk_text'] for chunk in all_text_chunks]
 print(f"\n📊 Generating embeddings for {len(chunk_texts)} text chunks...")
 
 # Create TF-IDF vectorizer with optimized parameters
-tfidf_vectorizer = TfidfVectorizer(
-    max_features=500,  # Limit dimensionality
-    ngram_range=(1, 2),  # Unigrams and bigrams for better context
-    min_df=1,
-    max_df=0.95,
-    sublinear_tf=True,  # Better term frequency scaling
-    norm='l2'  # Normalize for cosine similarity
-)
+tfidf_vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+
+# Generate embeddings (sparse until the memory budget decides where the dense matrix lives)
+with stage_tracer.span('embedding.fit_transform', chunks=len(chunk_texts)):
+    sparse_embeddings = tfidf_vectorizer.fit_transform(chunk_texts)
+    projected_kb_bytes = projected_memory_bytes(all_text_chunks, sparse_embeddings.shape[1])
+    embeddings_spilled = spill_required(projected_kb_bytes)
+    if embeddings_spilled:
+        # Written to disk one block of rows at a time; the dense matrix never exists in RAM
+        knowledge_base = SpilledKnowledgeBase.write(all_text_chunks, sparse_embeddings)
+        chunk_embeddings = knowledge_base.embeddings
+        embedding_norms = knowledge_base.norms
+    else:
+        chunk_embeddings = sparse_embeddings.toarray()
+        embedding_norms = np.linalg.norm(chunk_embeddings, axis=1)
+del sparse_embeddings, chunk_texts
 
-# Generate embeddings
-chunk_embeddings = tfidf_vectorizer.fit_transform(chunk_texts).toarray()
+if embeddings_spilled:
+    # The chunk text now lives in the spill segments: serve the chunks from there and drop the in-RAM copies
+    all_text_chunks = knowledge_base
+    chunks_df = chunks_df.drop(columns='chunk_text')
 
 print(f"\n✅ Generated embeddings!")
 print(f"   Shape: {chunk_embeddings.shape}")
 print(f"   Dimensions: {chunk_embeddings.shape[1]}")
 print(f"   Data type: {chunk_embeddings.dtype}")
 print(f"   Vocabulary size: {len(tfidf_vectorizer.vocabulary_)}")
+print(f"   Projected in-memory knowledge base: {projected_kb_bytes / 1e6:.2f} MB")
+if embeddings_spilled:
+    print(f"   💾 Over the {MEMORY_BUDGET_MB:g} MB budget: spilled {knowledge_base.nbytes / 1e6:.2f} MB "
+          f"to {knowledge_base.handle}")
 
-# Create enhanced knowledge base with embeddings
-knowledge_base = []
-for idx, chunk in enumerate(all_text_chunks):
-    knowledge_base.append({
-        'chunk_id': chunk['chunk_id'],
-        'paper_id': chunk['paper_id'],
-        'paper_title': chunk['paper_title'],
-        'position': chunk['position'],
-        'chunk_text': chunk['chunk_text'],
-        'token_count': chunk['token_count'],
-        'embedding': chunk_embeddings[idx],
-        'embedding_norm': float(np.linalg.norm(chunk_embeddings[idx]))
-    })
+# Create enhanced knowledge base with embeddings (a spilled one builds these entries on access)
+if not embeddings_spilled:
+    knowledge_base = []
+    for idx, chunk in enumerate(all_text_chunks):
+        knowledge_base.append({
+            'chunk_id': chunk['chunk_id'],
+            'paper_id': chunk['paper_id'],
+            'paper_title': chunk['paper_title'],
+            'position': chunk['position'],
+            'token_start': chunk['token_start'],
+            'token_end': chunk['token_end'],
+            'chunk_text': chunk['chunk_text'],
+            'token_count': chunk['token_count'],
+            'embedding': chunk_embeddings[idx],
+            'embedding_norm': float(embedding_norms[idx])
+        })
 
 print("\n" + "=" * 80)
 print("KNOWLEDGE BASE STATISTICS")
 print("=" * 80)
 print(f"Total entries: {len(knowledge_base)}")
-print(f"Unique papers: {len(set(k['paper_id'] for k in knowledge_base))}")
-print(f"Average tokens per chunk: {np.mean([k['token_count'] for k in knowledge_base]):.1f}")
-print(f"Embedding dimension: {knowledge_base[0]['embedding'].shape[0]}")
-print(f"Average embedding norm: {np.mean([k['embedding_norm'] for k in knowledge_base]):.3f}")
+print(f"Unique papers: {chunks_df['paper_id'].nunique()}")
+print(f"Average tokens per chunk: {chunks_df['token_count'].mean():.1f}")
+print(f"Embedding dimension: {chunk_embeddings.shape[1]}")
+print(f"Average embedding norm: {np.mean(embedding_norms):.3f}")
 print(f"Sparsity: {100 * (1 - np.count_nonzero(chunk_embeddings) / chunk_embeddings.size):.1f}%")
 
 # Display sample entries
@@ -1,4 +1,3 @@
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import pandas as pd
 
@@ -12,31 +11,33 @@ def semantic_search(query, top_k=3):
     
     Args:
         query: Search query string
-        top_k: Number of top results to return
+        top_k: Number of top results to return (callers under a deadline pass a scaled top_k)
     
     Returns:
         List of top matching chunks with similarity scores
     """
     # Transform query using the same vectorizer
-    query_embedding = tfidf_vectorizer.transform([query]).toarray()
+    query_embedding = tfidf_vectorizer.transform([query])
     
-    # Calculate cosine similarity with all chunks
-    embeddings_matrix = np.array([k['embedding'] for k in knowledge_base])
-    similarities = cosine_similarity(query_embedding, embeddings_matrix)[0]
+    # Calculate cosine similarity with all chunks, block by block (in memory or spilled to disk)
+    similarities = cosine_scores(query_embedding, chunk_embeddings, embedding_norms)
     
     # Get top-k results
     top_indices = np.argsort(similarities)[::-1][:top_k]
     
     results = []
     for idx in top_indices:
+        entry = knowledge_base[idx]
         results.append({
             'rank': len(results) + 1,
             'similarity': float(similarities[idx]),
-            'chunk_id': knowledge_base[idx]['chunk_id'],
-            'paper_id': knowledge_base[idx]['paper_id'],
-            'paper_title': knowledge_base[idx]['paper_title'],
-            'chunk_text': knowledge_base[idx]['chunk_text'],
-            'token_count': knowledge_base[idx]['token_count']
+            'chunk_id': entry['chunk_id'],
+            'paper_id': entry['paper_id'],
+            'paper_title': entry['paper_title'],
+            'chunk_text': entry['chunk_text'],
+            'token_count': entry['token_count'],
+            'token_start': entry['token_start'],
+            'token_end': entry['token_end']
         })
     
     return results
@@ -51,19 +52,20 @@ test_queries = [
 print("\n🔍 SEMANTIC SEARCH DEMONSTRATIONS")
 print("=" * 80)
 
-for query_idx, query in enumerate(test_queries):
-    print(f"\n\n{'='*80}")
-    print(f"QUERY {query_idx + 1}: '{query}'")
-    print('='*80)
-    
-    search_results = semantic_search(query, top_k=2)
-    
-    for result in search_results:
-        print(f"\n🎯 Rank {result['rank']} | Similarity: {result['similarity']:.4f}")
-        print(f"   Chunk ID: {result['chunk_id']}")
-        print(f"   Paper: {result['paper_title'][:70]}...")
-        print(f"   Tokens: {result['token_count']}")
-        print(f"   Text: {result['chunk_text'][:150]}...")
+with stage_tracer.span('search.demo_queries', queries=len(test_queries)):
+    for query_idx, query in enumerate(test_queries):
+        print(f"\n\n{'='*80}")
+        print(f"QUERY {query_idx + 1}: '{query}'")
+        print('='*80)
+        
+        search_results = semantic_search(query, top_k=2)
+        
+        for result in search_results:
+            print(f"\n🎯 Rank {result['rank']} | Similarity: {result['similarity']:.4f}")
+            print(f"   Chunk ID: {result['chunk_id']}")
+            print(f"   Paper: {result['paper_title'][:70]}...")
+            print(f"   Tokens: {result['token_count']}")
+            print(f"   Text: {result['chunk_text'][:150]}...")
 
 print("\n\n" + "=" * 80)
 print("SEMANTIC SEARCH SYSTEM SUMMARY")
@@ -0,0 +1,242 @@
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Sequence
+import numpy as np
+import scipy.sparse as sp
+
+print("=" * 80)
+print("SPILL STORAGE (memory budget with memory-mapped segments)")
+print("=" * 80)
+
+# RAM budget for the knowledge base in MB; 0 keeps everything in memory
+MEMORY_BUDGET_MB = float(os.environ.get('RESEARCH_MEMORY_BUDGET_MB', 0)) or None
+# Parent directory of spill segments (defaults to the system temp dir); segments are removed at exit
+SPILL_DIR = os.environ.get('RESEARCH_SPILL_DIR')
+# Rows written or scored per step, so only one block of embeddings is in RAM at a time
+SPILL_BLOCK_ROWS = 2048
+
+def projected_memory_bytes(chunks, n_features, itemsize=8):
+    """
+    RAM an in-memory knowledge base would need.
+
+    Args:
+        chunks: Chunk dictionaries (all_text_chunks)
+        n_features: Embedding dimensions
+        itemsize: Bytes per embedding value
+
+    Returns:
+        Estimated bytes: the dense embedding matrix plus one dictionary,
+        its row view and its strings per knowledge base entry
+    """
+    if not chunks:
+        return 0
+    sample = chunks[:100]
+    record_bytes = np.mean([sys.getsizeof(c) + sum(sys.getsizeof(v) for v in c.values()) for c in sample])
+    # Knowledge base entries carry an embedding row view and a norm on top of the chunk fields
+    record_bytes += sys.getsizeof(np.zeros(0)) + sys.getsizeof(0.0)
+    return int(len(chunks) * (n_features * itemsize + record_bytes))
+
+def spill_required(projected_bytes, budget_mb=MEMORY_BUDGET_MB):
+    """Whether a projected footprint exceeds the memory budget."""
+    return budget_mb is not None and projected_bytes > budget_mb * 1e6
+
+def cosine_scores(query_vector, embeddings, norms=None, block_rows=SPILL_BLOCK_ROWS):
+    """
+    Cosine similarity of one query against every embedding row, read block by block.
+
+    Works the same on in-memory arrays and memory-mapped segments; only one
+    block of rows is materialized at a time.
+
+    Args:
+        query_vector: Sparse or dense query embedding (one row)
+        embeddings: Embedding matrix, one row per chunk
+        norms: Optional precomputed row norms
+        block_rows: Rows scored per step
+
+    Returns:
+        Array of similarities, one per row (0 for all-zero rows or queries)
+    """
+    query = query_vector.toarray().ravel() if sp.issparse(query_vector) else np.asarray(query_vector).ravel()
+    scores = np.zeros(embeddings.shape[0])
+    query_norm = np.linalg.norm(query)
+    if query_norm == 0:
+        return scores
+    for start in range(0, embeddings.shape[0], block_rows):
+        block = np.asarray(embeddings[start:start + block_rows])
+        block_norms = norms[start:start + len(block)] if norms is not None else np.linalg.norm(block, axis=1)
+        scores[start:start + len(block)] = (block @ query) / np.where(block_norms == 0, 1.0, block_norms)
+    return scores / query_norm
+
+class SpilledKnowledgeBase(Sequence):
+    """
+    Knowledge base kept in on-disk segments and read back through memory mapping.
+
+    The directory holds the embedding matrix and the per-chunk numbers as
+    .npy files, and the chunk ids, paper titles and chunk texts as one UTF-8
+    segment with an offsets array. Entries are built on access with the same
+    keys as an in-memory knowledge base entry, so agents and search code
+    index, iterate and read k['embedding'] unchanged; the embedding is a row
+    of the memory-mapped matrix. Only pages actually touched are resident,
+    and the operating system can drop them under memory pressure.
+
+    Worker processes attach() by handle and map the same segments. The
+    object is not picklable, so a spilled stage is never copied into the
+    stage cache.
+    """
+
+    TEXT_FIELDS = ('chunk_id', 'paper_title', 'chunk_text')
+
+    def __init__(self, directory, owner=False):
+        self.directory = directory
+        self.owner = owner
+        self.embeddings = np.load(os.path.join(directory, 'embeddings.npy'), mmap_mode='r')
+        self.norms = np.load(os.path.join(directory, 'norms.npy'), mmap_mode='r')
+        self.numbers = np.load(os.path.join(directory, 'numbers.npy'), mmap_mode='r')
+        self.text_offsets = np.load(os.path.join(directory, 'text_offsets.npy'), mmap_mode='r')
+        text_path = os.path.join(directory, 'text.bin')
+        self.text = np.memmap(text_path, dtype=np.uint8, mode='r') if os.path.getsize(text_path) else \
+            np.zeros(0, dtype=np.uint8)
+
+    @classmethod
+    def write(cls, chunks, embeddings, parent=SPILL_DIR, block_rows=SPILL_BLOCK_ROWS):
+        """
+        Spill chunks and their embeddings into a new segment directory.
+
+        Args:
+            chunks: Chunk dictionaries (all_text_chunks), in embedding row order
+            embeddings: Sparse or dense embedding matrix; densified one block at a time
+            parent: Directory the segment directory is created in
+            block_rows: Rows densified and written per step
+
+        Returns:
+            SpilledKnowledgeBase owning the segments (removed at exit)
+        """
+        directory = tempfile.mkdtemp(prefix='research-spill-', dir=parent)
+        rows, features = embeddings.shape
+        dtype = embeddings.dtype if embeddings.dtype.kind == 'f' else np.float64
+        matrix = np.lib.format.open_memmap(os.path.join(directory, 'embeddings.npy'), mode='w+', dtype=dtype,
+                                           shape=(rows, features))
+        norms = np.zeros(rows)
+        for start in range(0, rows, block_rows):
+            block = embeddings[start:start + block_rows]
+            block = block.toarray() if sp.issparse(block) else np.asarray(block)
+            matrix[start:start + len(block)] = block
+            norms[start:start + len(block)] = np.linalg.norm(block, axis=1)
+        matrix.flush()
+        del matrix
+        np.save(os.path.join(directory, 'norms.npy'), norms)
+
+        # paper_id, position, token_start, token_end, token_count per chunk
+        np.save(os.path.join(directory, 'numbers.npy'), np.array(
+            [(c['paper_id'], c['position'], c['token_start'], c['token_end'], c['token_count']) for c in chunks],
+            dtype=np.int64).reshape(-1, 5))
+        offsets = np.zeros(len(chunks) * len(cls.TEXT_FIELDS) + 1, dtype=np.int64)
+        with open(os.path.join(directory, 'text.bin'), 'wb') as f:
+            slot = 0
+            for chunk in chunks:
+                for field in cls.TEXT_FIELDS:
+                    encoded = chunk[field].encode('utf-8')
+                    f.write(encoded)
+                    offsets[slot + 1] = offsets[slot] + len(encoded)
+                    slot += 1
+        np.save(os.path.join(directory, 'text_offsets.npy'), offsets)
+
+        spilled = cls(directory, owner=True)
+        atexit.register(spilled.close)
+        return spilled
+
+    @classmethod
+    def attach(cls, handle):
+        """Open existing segments by handle (their directory) without taking ownership."""
+        return cls(handle)
+
+    @property
+    def handle(self):
+        return self.directory
+
+    @property
+    def nbytes(self):
+        """Bytes of the on-disk segments (resident memory is only the pages in use)."""
+        return sum(os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory))
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def _text(self, slot):
+        return bytes(self.text[self.text_offsets[slot]:self.text_offsets[slot + 1]]).decode('utf-8')
+
+    def _entry(self, idx):
+        fields = len(self.TEXT_FIELDS)
+        paper_id, position, token_start, token_end, token_count = (int(v) for v in self.numbers[idx])
+        return {
+            'chunk_id': self._text(idx * fields),
+            'paper_id': paper_id,
+            'paper_title': self._text(idx * fields + 1),
+            'position': position,
+            'token_start': token_start,
+            'token_end': token_end,
+            'chunk_text': self._text(idx * fields + 2),
+            'token_count': token_count,
+            'embedding': self.embeddings[idx],
+            'embedding_norm': float(self.norms[idx])
+        }
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._entry(i) for i in range(*idx.indices(len(self)))]
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('knowledge base index out of range')
+        return self._entry(idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self._entry(idx)
+
+    def __reduce__(self):
+        raise TypeError("a spilled knowledge base is backed by run-local segments; share it by handle instead")
+
+    def normalized_embeddings(self, block_rows=SPILL_BLOCK_ROWS):
+        """
+        L2-normalized embedding matrix, memory-mapped.
+
+        TF-IDF rows are already unit length, in which case the stored matrix
+        is returned as is; otherwise a normalized copy is spilled next to it.
+        """
+        if np.all((np.abs(self.norms - 1.0) < 1e-9) | (self.norms == 0)):
+            return self.embeddings
+        path = os.path.join(self.directory, 'normalized.npy')
+        if not os.path.exists(path):
+            matrix = np.lib.format.open_memmap(path, mode='w+', dtype=self.embeddings.dtype,
+                                               shape=self.embeddings.shape)
+            for start in range(0, len(self), block_rows):
+                norms = self.norms[start:start + block_rows]
+                matrix[start:start + len(norms)] = self.embeddings[start:start + len(norms)] / \
+                    np.where(norms == 0, 1.0, norms)[:, None]
+            matrix.flush()
+            del matrix
+        return np.load(path, mmap_mode='r')
+
+    def close(self):
+        """Drop the mappings; the owner also removes the segment directory."""
+        self.embeddings = self.norms = self.numbers = self.text_offsets = self.text = None
+        if self.owner and os.path.isdir(self.directory):
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+def knowledge_base_matrix(knowledge_base):
+    """Embedding matrix of a knowledge base; a spilled one returns its memory-mapped matrix without copying."""
+    if isinstance(knowledge_base, SpilledKnowledgeBase):
+        return knowledge_base.embeddings
+    return np.array([k['embedding'] for k in knowledge_base])
+
+chunk_text_bytes = sum(len(c['chunk_text'].encode('utf-8')) for c in all_text_chunks)
+print(f"\n💾 Memory budget: {f'{MEMORY_BUDGET_MB:g} MB' if MEMORY_BUDGET_MB else 'unlimited'} | "
+      f"Spill directory: {SPILL_DIR or tempfile.gettempdir()}")
+print(f"   Chunks: {len(all_text_chunks)} | Chunk text: {chunk_text_bytes / 1e6:.2f} MB")
+print("   The embedding stage projects its footprint once the vocabulary is known and spills past the budget")
+print("=" * 80)
@@ -0,0 +1,138 @@
+import atexit
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+print("=" * 60)
+print("STAGE TRACER")
+print("=" * 60)
+
+# Chrome/Perfetto trace file written at exit; unset to keep spans in memory only
+TRACE_PATH = os.environ.get('RESEARCH_TRACE')
+# tracemalloc peaks per span (slows allocation-heavy code, so opt-in)
+TRACE_MEMORY = os.environ.get('RESEARCH_TRACE_MEMORY', '').lower() in ('1', 'true', 'yes')
+
+class StageTracer:
+    """
+    Records wall time, CPU time and tracemalloc peak for nested spans.
+
+    Spans open with begin() and close with end() (or use span() as a
+    context manager) and nest per thread. CPU time is the opening thread's,
+    so work fanned out to other threads or processes is not counted.
+    A span's memory peak is the highest traced memory above its starting
+    level while it was open. tracemalloc is process-wide, so peaks are
+    approximate when spans on several threads overlap.
+    """
+
+    def __init__(self, memory=TRACE_MEMORY):
+        """
+        Args:
+            memory: Track tracemalloc peaks (starts tracemalloc if needed)
+        """
+        self.memory = memory
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.events = []
+        self.pid = os.getpid()
+        self._local = threading.local()
+        self._memory_lock = threading.Lock()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, name, category='stage', **args):
+        """Open a span on the current thread."""
+        span = {'name': name, 'cat': category, 'args': args, 'wall': time.perf_counter(), 'cpu': time.thread_time()}
+        if self.memory:
+            with self._memory_lock:
+                current, peak = tracemalloc.get_traced_memory()
+                # Fold the peak seen so far into the enclosing spans before resetting it for this one
+                for parent in self._stack():
+                    parent['peak'] = max(parent['peak'], peak)
+                tracemalloc.reset_peak()
+            span.update(start_memory=current, peak=current)
+        self._stack().append(span)
+        return span
+
+    def end(self):
+        """Close the innermost open span of the current thread and record it."""
+        span = self._stack().pop()
+        wall = time.perf_counter()
+        args = dict(span['args'], cpu_ms=round((time.thread_time() - span['cpu']) * 1000, 3))
+        if self.memory:
+            with self._memory_lock:
+                _, peak = tracemalloc.get_traced_memory()
+            span['peak'] = max(span['peak'], peak)
+            for parent in self._stack():
+                parent['peak'] = max(parent['peak'], span['peak'])
+            args['peak_kb'] = round((span['peak'] - span['start_memory']) / 1024, 1)
+        self.events.append({
+            'name': span['name'], 'cat': span['cat'], 'ph': 'X', 'pid': self.pid, 'tid': threading.get_ident(),
+            'ts': span['wall'] * 1e6, 'dur': (wall - span['wall']) * 1e6, 'args': args
+        })
+
+    def span(self, name, category='stage', **args):
+        """Context manager form of begin()/end()."""
+        return _Span(self, name, category, args)
+
+    def chrome_trace(self, extra_events=()):
+        """Trace dictionary in the Chrome trace event format (loadable in Perfetto)."""
+        return {'traceEvents': list(extra_events) + self.events, 'displayTimeUnit': 'ms'}
+
+    def export(self, path, extra_events=()):
+        """Write the trace JSON; returns its path."""
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(extra_events), f)
+        return path
+
+    def summary(self):
+        """Per-span-name totals: calls, wall and CPU milliseconds and the largest memory peak."""
+        rows = {}
+        for event in self.events:
+            row = rows.setdefault(event['name'], {'name': event['name'], 'category': event['cat'], 'calls': 0,
+                                                   'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_kb': None})
+            row['calls'] += 1
+            row['wall_ms'] += event['dur'] / 1000
+            row['cpu_ms'] += event['args']['cpu_ms']
+            if 'peak_kb' in event['args']:
+                row['peak_kb'] = max(row['peak_kb'] or 0.0, event['args']['peak_kb'])
+        return sorted(rows.values(), key=lambda r: -r['wall_ms'])
+
+    def print_summary(self, limit=25):
+        """Print the summary as a table, slowest spans first."""
+        print(f"\n   {'Span':<44} {'Calls':>5} {'Wall ms':>10} {'CPU ms':>10} {'Peak KB':>10}")
+        print(f"   {'─' * 44} {'─' * 5} {'─' * 10} {'─' * 10} {'─' * 10}")
+        for row in self.summary()[:limit]:
+            peak = f"{row['peak_kb']:.1f}" if row['peak_kb'] is not None else '-'
+            print(f"   {row['name'][:44]:<44} {row['calls']:>5} {row['wall_ms']:>10.2f} {row['cpu_ms']:>10.2f} "
+                  f"{peak:>10}")
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'category', 'args')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.tracer.begin(self.name, self.category, **self.args)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.end()
+        return False
+
+stage_tracer = StageTracer()
+if TRACE_PATH:
+    atexit.register(stage_tracer.export, TRACE_PATH)
+
+print(f"\n⏱️  Spans: wall + CPU time | Memory peaks: {'on' if TRACE_MEMORY else 'off'} | "
+      f"Trace file: {TRACE_PATH or 'off'}")
+print("=" * 60)
@@ -0,0 +1,293 @@
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+print("=" * 80)
+print("STREAMING AGENT PIPELINE (Reader → Summarization → Fact-Check)")
+print("=" * 80)
+
+# The batch agents already produce Agents 1-3 outputs; streaming the corpus a second
+# time to compare against them is a demonstration and runs only when asked for
+STREAMING_DEMO = os.environ.get('RESEARCH_STREAMING_DEMO', '').lower() in ('1', 'true', 'yes')
+
+# Marks the end of a stage's stream
+_END_OF_STREAM = object()
+
+class SummaryAggregator:
+    """Running Agent 2 statistics, updated one summary at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.relevance_sum = 0.0
+        self.summary_points = 0
+        self.topic_counts = Counter()
+
+    def add(self, summary):
+        self.count += 1
+        self.relevance_sum += summary['relevance_score']
+        self.summary_points += len(summary['summary_points'])
+        self.topic_counts.update(summary['key_topics'])
+
+    def snapshot(self):
+        """Same fields as summarization_output['aggregate_insights']."""
+        return {
+            'average_relevance': round(self.relevance_sum / self.count, 4) if self.count else 0.0,
+            'unique_topics': len(self.topic_counts),
+            'total_summary_points': self.summary_points
+        }
+
+class ValidationAggregator:
+    """Running Agent 3 validation metrics, updated one result at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.verified = 0
+        self.overlap_sum = 0.0
+
+    def add(self, validation):
+        self.count += 1
+        self.verified += validation['verification_status'] == 'VERIFIED'
+        self.overlap_sum += validation['topic_overlap_ratio']
+
+    def snapshot(self):
+        """Same fields as fact_check_output['validation_metrics']."""
+        return validation_metrics_from_counts(self.count, self.verified, self.overlap_sum)
+
+class StreamingAgentPipeline:
+    """
+    Runs Agents 1-3 per paper on worker threads connected by bounded queues.
+
+    A paper moves to summarization as soon as it has been read and to
+    fact-checking as soon as it has been summarized. When a downstream stage
+    falls behind, the bounded queue blocks the upstream stage (backpressure),
+    so at most queue_size papers are in flight between two stages. Results
+    are yielded in completion order while aggregate metrics update per paper.
+    """
+
+    def __init__(self, search_function, processed_papers, tfidf_vectorizer, queue_size=8,
+                 summary_batch_size=32, handoff_store=None, retain_outputs=True):
+        """
+        Args:
+            search_function: Semantic search function used by the reader stage
+            processed_papers: NLP pipeline output with tokenized sentences
+            tfidf_vectorizer: Trained TF-IDF vectorizer
+            queue_size: Capacity of each inter-stage queue
+            summary_batch_size: Most papers ranked together when several are waiting
+            handoff_store: Optional HandoffStore receiving every per-paper entry
+            retain_outputs: Keep per-paper entries for the final agent outputs
+        """
+        self.search_function = search_function
+        self.sentences_by_paper = {p['paper_id']: paper_summary_sentences(p) for p in processed_papers}
+        self.tfidf_vectorizer = tfidf_vectorizer
+        self.queue_size = queue_size
+        self.summary_batch_size = summary_batch_size
+        self.handoff_store = handoff_store
+        self.retain_outputs = retain_outputs
+        self.summary_stats = SummaryAggregator()
+        self.validation_stats = ValidationAggregator()
+        self.extracted_papers, self.summaries, self.validations = [], [], []
+        self.errors = []
+        self.first_result_seconds = None
+        self.max_in_flight = 0
+
+    def _put(self, q, item, stop):
+        # Bounded put that gives up when another stage has failed
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q, stop):
+        # Blocking get that ends the stream when another stage has failed
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _END_OF_STREAM
+
+    def _stage(self, name, work, stop):
+        def run():
+            try:
+                work()
+            except Exception as exc:
+                self.errors.append((name, exc))
+                stop.set()
+        return threading.Thread(target=run, name=f"stream-{name}", daemon=True)
+
+    def run(self, papers):
+        """
+        Stream papers through the reader, summarization and fact-check stages.
+
+        Args:
+            papers: Iterable of paper dictionaries (may be a generator)
+
+        Yields:
+            (summary, validation_result) tuples as each paper completes
+        """
+        read_queue = queue.Queue(maxsize=self.queue_size)
+        summary_queue = queue.Queue(maxsize=self.queue_size)
+        result_queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def read():
+            for idx, paper in enumerate(papers):
+                paper_info = read_paper(idx + 1, paper, self.search_function)
+                if not self._put(read_queue, (paper_info, paper), stop):
+                    return
+            self._put(read_queue, _END_OF_STREAM, stop)
+
+        def summarize():
+            done = False
+            while not done:
+                # Rank every paper already waiting in one TextRank pass
+                batch = [self._get(read_queue, stop)]
+                while len(batch) < self.summary_batch_size and batch[-1] is not _END_OF_STREAM:
+                    try:
+                        batch.append(read_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if batch[-1] is _END_OF_STREAM:
+                    batch.pop()
+                    done = True
+                if not batch:
+                    break
+                ranked = textrank_summarize(
+                    [self.sentences_by_paper.get(info['paper_id'], []) for info, _ in batch], self.tfidf_vectorizer
+                )
+                for (paper_info, paper), key_sentences in zip(batch, ranked):
+                    if not self._put(summary_queue, (paper_info, summarize_paper(paper_info, key_sentences), paper), stop):
+                        return
+            self._put(summary_queue, _END_OF_STREAM, stop)
+
+        def fact_check():
+            while True:
+                item = self._get(summary_queue, stop)
+                if item is _END_OF_STREAM:
+                    break
+                paper_info, summary, paper = item
+                # The index is built from this paper alone and dropped after the check
+                verification_index = build_verification_index(paper)
+                checks = [verify_claim(point, verification_index) for point in summary['summary_points']]
+                if not self._put(result_queue, (paper_info, summary, fact_check_summary(summary, verification_index, checks)), stop):
+                    return
+            self._put(result_queue, _END_OF_STREAM, stop)
+
+        stages = [self._stage('reader', read, stop), self._stage('summarization', summarize, stop),
+                  self._stage('fact_check', fact_check, stop)]
+        started = time.perf_counter()
+        for stage in stages:
+            stage.start()
+
+        # Stop and join the stages however the stream ends, including a consumer
+        # that abandons the generator early (close() raises GeneratorExit at the yield)
+        try:
+            while True:
+                try:
+                    item = result_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if stop.is_set():
+                        break
+                    continue
+                if item is _END_OF_STREAM:
+                    break
+                paper_info, summary, validation = item
+                if self.first_result_seconds is None:
+                    self.first_result_seconds = time.perf_counter() - started
+                self.max_in_flight = max(self.max_in_flight,
+                                         read_queue.qsize() + summary_queue.qsize() + result_queue.qsize())
+
+                # Shared state is only touched on the consuming thread
+                self.summary_stats.add(summary)
+                self.validation_stats.add(validation)
+                if self.handoff_store is not None:
+                    self.handoff_store.put('reader', paper_info)
+                    self.handoff_store.put('summary', summary)
+                    self.handoff_store.put('validation', validation)
+                if self.retain_outputs:
+                    self.extracted_papers.append(paper_info)
+                    self.summaries.append(summary)
+                    self.validations.append(validation)
+                yield summary, validation
+        finally:
+            stop.set()
+            for stage in stages:
+                stage.join()
+        if self.errors:
+            name, exc = self.errors[0]
+            raise RuntimeError(f"Streaming stage '{name}' failed: {exc!r}") from exc
+
+    def outputs(self):
+        """
+        Agent 1-3 outputs in the batch format, ordered by paper_id.
+
+        Returns:
+            Tuple of (paper_reader_output, summarization_output, fact_check_output)
+        """
+        timestamp = datetime.now().isoformat()
+        by_id = lambda entry: entry['paper_id']
+        papers_processed = self.summary_stats.count
+        paper_reader_output = validate_handoff('paper_reader', {
+            'agent': 'Paper Reader',
+            'timestamp': timestamp,
+            'papers_processed': papers_processed,
+            'extracted_papers': sorted(self.extracted_papers, key=by_id)
+        })
+        summarization_output = validate_handoff('summarization', {
+            'agent': 'Summarization',
+            'timestamp': timestamp,
+            'input_agent': 'Paper Reader',
+            'papers_summarized': papers_processed,
+            'summarization_method': 'TextRank',
+            'summaries': sorted(self.summaries, key=by_id),
+            'aggregate_insights': self.summary_stats.snapshot()
+        })
+        fact_check_output = validate_handoff('fact_check', {
+            'agent': 'Fact-Check',
+            'timestamp': timestamp,
+            'input_agent': 'Summarization',
+            'papers_validated': self.validation_stats.count,
+            'validated_summaries': sorted(self.validations, key=by_id),
+            'validation_metrics': self.validation_stats.snapshot()
+        })
+        return paper_reader_output, summarization_output, fact_check_output
+
+if STREAMING_DEMO:
+    # Stream the sample corpus through Agents 1-3 into a separate handoff store
+    streaming_handoff_store = HandoffStore()
+    streaming_pipeline = StreamingAgentPipeline(semantic_search, processed_papers, tfidf_vectorizer,
+                                                queue_size=4, handoff_store=streaming_handoff_store)
+
+    print(f"\n🚰 Streaming {len(sample_papers)} papers (queue size {streaming_pipeline.queue_size})...")
+    for summary, validation in streaming_pipeline.run(iter(sample_papers)):
+        running = streaming_pipeline.validation_stats.snapshot()
+        print(f"\n   📄 Paper {summary['paper_id']}: {summary['title'][:55]}...")
+        print(f"      Status: {validation['verification_status']} | Summary points: {len(summary['summary_points'])}")
+        print(f"      Running verification rate: {running['verification_rate']:.0%} over {running['total_validated']} papers")
+
+    streaming_outputs = streaming_pipeline.outputs()
+
+    # The streamed results must match the batch agents paper for paper
+    streaming_matches_batch = (
+        [s['summary_points'] for s in streaming_outputs[1]['summaries']] == [s['summary_points'] for s in summarization_output['summaries']]
+        and streaming_outputs[2]['validation_metrics'] == fact_check_output['validation_metrics']
+    )
+
+    print(f"\n{'=' * 80}")
+    print(f"✅ Streaming pipeline complete")
+    print(f"   • Papers streamed: {streaming_pipeline.summary_stats.count}")
+    print(f"   • Time to first result: {streaming_pipeline.first_result_seconds * 1000:.1f} ms")
+    print(f"   • Peak papers queued between stages: {streaming_pipeline.max_in_flight}")
+    print(f"   • Aggregate insights: {streaming_outputs[1]['aggregate_insights']}")
+    print(f"   • Validation metrics: {streaming_outputs[2]['validation_metrics']}")
+    print(f"   • Matches batch agents: {'✓' if streaming_matches_batch else '✗'}")
+else:
+    print("\n⏭️  Streaming demo skipped (set RESEARCH_STREAMING_DEMO=1 to stream the corpus and compare with the batch agents)")
+    print("✅ StreamingAgentPipeline ready")
+print("=" * 80)
@@ -0,0 +1,178 @@
+import os
+import html
+from datetime import datetime
+
+print("=" * 80)
+print("STREAMING REPORT RENDERER")
+print("=" * 80)
+
+# Reports are written under this directory unless a full path is given
+REPORT_OUTPUT_DIR = os.environ.get('RESEARCH_REPORT_DIR', 'reports')
+
+REPORT_FORMATS = {'.md': 'markdown', '.markdown': 'markdown', '.html': 'html', '.htm': 'html'}
+
+class StreamingReportRenderer:
+    """
+    Writes a report to a Markdown or HTML file one block at a time.
+
+    Nothing but the open file handle is retained: every paragraph, list item
+    and figure is written as soon as it is produced and each section is
+    flushed to disk before the next begins, so earlier sections can be read
+    while later ones are still being generated. With echo enabled the same
+    content is printed to stdout in the canvas console style.
+    """
+
+    def __init__(self, path, title, echo=True, rule_width=100):
+        """
+        Args:
+            path: Output file; the format is taken from the extension (.md or .html)
+            title: Document title
+            echo: Also print every block to stdout
+            rule_width: Width of the console section rules when echoing
+        """
+        if not os.path.dirname(path):
+            path = os.path.join(REPORT_OUTPUT_DIR, path)
+        stem, extension = os.path.splitext(path)
+        if extension.lower() not in REPORT_FORMATS:
+            raise ValueError(f"Unsupported report format '{extension}', expected one of {sorted(REPORT_FORMATS)}")
+        self.path = path
+        self.format = REPORT_FORMATS[extension.lower()]
+        self.figure_dir = f"{stem}_figures"
+        self.echo = echo
+        self.rule_width = rule_width
+        self.sections = []
+        self.figures = []
+        self.closed = False
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'w', encoding='utf-8')
+        if self.format == 'html':
+            self._write(f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+                        f"<title>{html.escape(title)}</title>\n</head>\n<body>\n"
+                        f"<h1>{html.escape(title)}</h1>\n")
+        else:
+            self._write(f"# {title}\n\n")
+        self.flush()
+
+    def _write(self, text):
+        self._file.write(text)
+
+    def _print(self, text):
+        if self.echo:
+            print(text)
+
+    def flush(self):
+        """Push everything written so far to disk."""
+        self._file.flush()
+
+    def section(self, title):
+        """Start a top-level section, flushing the previous one."""
+        self.flush()
+        self.sections.append(title)
+        if self.format == 'html':
+            self._write(f"<h2>{html.escape(title)}</h2>\n")
+        else:
+            self._write(f"## {title}\n\n")
+        self._print("\n" + "=" * self.rule_width)
+        self._print(title.upper())
+        self._print("=" * self.rule_width)
+
+    def subsection(self, title, rule=False):
+        """Write a subsection heading, optionally echoed with a dashed rule."""
+        heading = title.strip()
+        if self.format == 'html':
+            self._write(f"<h3>{html.escape(heading)}</h3>\n")
+        else:
+            self._write(f"### {heading}\n\n")
+        self._print(f"\n{title}")
+        if rule:
+            self._print("-" * self.rule_width)
+
+    def paragraph(self, text, indent=''):
+        """Write a block of text; surrounding whitespace is stripped in the file."""
+        body = ' '.join(text.split()) if self.format == 'html' else text.strip()
+        if self.format == 'html':
+            self._write(f"<p>{html.escape(body)}</p>\n")
+        else:
+            self._write(f"{body}\n\n")
+        self._print(f"{indent}{text}")
+
+    def bullets(self, items, ordered=False, marker='•', indent=''):
+        """
+        Write a list, consuming items lazily from any iterable.
+
+        Args:
+            items: Iterable of strings (may be a generator)
+            ordered: Number the items instead of using bullets
+            marker: Bullet character used when echoing (empty for plain lines)
+            indent: Indentation used when echoing
+
+        Returns:
+            Number of items written
+        """
+        tag = 'ol' if ordered else 'ul'
+        if self.format == 'html':
+            self._write(f"<{tag}>\n")
+        count = 0
+        for count, item in enumerate(items, 1):
+            if self.format == 'html':
+                self._write(f"<li>{html.escape(str(item))}</li>\n")
+            else:
+                self._write(f"{count}. {item}\n" if ordered else f"- {item}\n")
+            if ordered:
+                self._print(f"{indent}{count}. {item}")
+            else:
+                self._print(f"{indent}{marker} {item}" if marker else f"{indent}{item}")
+        if self.format == 'html':
+            self._write(f"</{tag}>\n")
+        else:
+            self._write("\n")
+        return count
+
+    def figure(self, fig, name, caption):
+        """
+        Save a matplotlib figure next to the report and reference it.
+
+        Args:
+            fig: Matplotlib figure
+            name: File stem for the saved image
+            caption: Alt text / caption
+
+        Returns:
+            Path of the saved image
+        """
+        os.makedirs(self.figure_dir, exist_ok=True)
+        image_path = os.path.join(self.figure_dir, f"{name}.png")
+        fig.savefig(image_path, facecolor=fig.get_facecolor(), dpi=100, bbox_inches='tight')
+        self.figures.append(image_path)
+        relative = os.path.relpath(image_path, os.path.dirname(self.path) or '.')
+        if self.format == 'html':
+            self._write(f"<figure><img src=\"{html.escape(relative)}\" alt=\"{html.escape(caption)}\">"
+                        f"<figcaption>{html.escape(caption)}</figcaption></figure>\n")
+        else:
+            self._write(f"![{caption}]({relative})\n\n")
+        return image_path
+
+    def close(self):
+        """Write the document footer and close the file."""
+        if self.closed:
+            return
+        footer = f"Generated {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        if self.format == 'html':
+            self._write(f"<footer>{footer}</footer>\n</body>\n</html>\n")
+        else:
+            self._write(f"---\n\n_{footer}_\n")
+        self._file.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+print(f"\n✅ Report renderer ready: 'StreamingReportRenderer'")
+print(f"   Output directory: {REPORT_OUTPUT_DIR}")
+print(f"   Formats: {', '.join(sorted(set(REPORT_FORMATS.values())))}")
+print("=" * 80)
@@ -0,0 +1,135 @@
+import numpy as np
+import scipy.sparse as sp
+from sklearn.cluster import MiniBatchKMeans
+
+print("=" * 80)
+print("TOPIC CLUSTERING (MINI-BATCH K-MEANS)")
+print("=" * 80)
+
+class StreamingTopicClusterer:
+    """
+    Mini-batch k-means over chunk embeddings, fed in fixed-size batches.
+
+    Only the centroids, one batch of embeddings and the per-cluster paper
+    counts are held in memory, so the embedding matrix can be a memory-mapped
+    array or be streamed from disk. New papers are added with partial_fit();
+    their chunks must be embedded with the same fitted vectorizer. Paper counts
+    record each chunk's cluster at the time it was fitted.
+    """
+
+    def __init__(self, n_clusters, vectorizer, batch_size=1024, top_terms=5, random_state=42):
+        """
+        Args:
+            n_clusters: Number of topic clusters
+            vectorizer: Fitted TF-IDF vectorizer that produced the embeddings
+            batch_size: Number of chunk embeddings per k-means update
+            top_terms: Number of TF-IDF terms used to label each cluster
+            random_state: Seed for centroid initialization
+        """
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.top_terms = top_terms
+        self.feature_names = vectorizer.get_feature_names_out()
+        self.model = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size,
+                                     random_state=random_state, n_init=1)
+        self.chunks_seen = 0
+        # paper_id -> chunk count, one dict per cluster
+        self.cluster_papers = [{} for _ in range(n_clusters)]
+        self._pending = []
+        self._fitted = False
+
+    def _iter_batches(self, embeddings):
+        for start in range(0, embeddings.shape[0], self.batch_size):
+            batch = embeddings[start:start + self.batch_size]
+            yield start, batch.toarray() if sp.issparse(batch) else np.asarray(batch, dtype=np.float64)
+
+    def _update(self, batch, batch_paper_ids):
+        self.model.partial_fit(batch)
+        self._fitted = True
+        self.chunks_seen += len(batch)
+        for cluster_id, paper_id in zip(self.model.predict(batch).tolist(), batch_paper_ids):
+            papers = self.cluster_papers[cluster_id]
+            papers[paper_id] = papers.get(paper_id, 0) + 1
+
+    def partial_fit(self, embeddings, paper_ids):
+        """
+        Update the clusters with a block of chunk embeddings.
+
+        Args:
+            embeddings: Dense, sparse or memory-mapped matrix (chunks × features)
+            paper_ids: Paper id of every row in embeddings
+
+        Returns:
+            self
+        """
+        paper_ids = list(paper_ids)
+        for start, batch in self._iter_batches(embeddings):
+            batch_paper_ids = paper_ids[start:start + len(batch)]
+            if self._fitted:
+                self._update(batch, batch_paper_ids)
+                continue
+            # k-means needs at least n_clusters samples before its first update
+            self._pending.append((batch, batch_paper_ids))
+            if sum(len(b) for b, _ in self._pending) >= self.n_clusters:
+                batch = np.vstack([b for b, _ in self._pending])
+                batch_paper_ids = [pid for _, pids in self._pending for pid in pids]
+                self._pending = []
+                self._update(batch, batch_paper_ids)
+        return self
+
+    def cluster_labels(self):
+        """Top TF-IDF terms of every cluster centroid."""
+        centers = self.model.cluster_centers_
+        top = np.argsort(-centers, axis=1)[:, :self.top_terms]
+        return [[self.feature_names[idx] for idx in row if centers[cluster_id, idx] > 0]
+                for cluster_id, row in enumerate(top)]
+
+    def predict(self, embeddings):
+        """Assign chunk embeddings to their nearest cluster."""
+        return np.concatenate([self.model.predict(batch) for _, batch in self._iter_batches(embeddings)])
+
+    def cluster_themes(self):
+        """
+        Summarize every non-empty cluster as a theme.
+
+        Returns:
+            List of theme dictionaries sorted by paper count (descending)
+        """
+        if not self._fitted:
+            return []
+        themes = []
+        for cluster_id, terms in enumerate(self.cluster_labels()):
+            papers = self.cluster_papers[cluster_id]
+            if not papers:
+                continue
+            themes.append({
+                'cluster_id': cluster_id,
+                'label': ' / '.join(terms[:3]),
+                'top_terms': terms,
+                'chunk_count': sum(papers.values()),
+                'paper_count': len(papers),
+                'paper_ids': sorted(papers)
+            })
+        return sorted(themes, key=lambda theme: (-theme['paper_count'], -theme['chunk_count']))
+
+# Roughly sqrt(n/2) clusters, bounded for readability of the trend report
+n_topic_clusters = int(np.clip(round(np.sqrt(len(chunk_embeddings) / 2)), 2, 20))
+n_topic_clusters = min(n_topic_clusters, len(chunk_embeddings))
+
+topic_clusters = StreamingTopicClusterer(n_topic_clusters, tfidf_vectorizer)
+topic_clusters.partial_fit(chunk_embeddings, [entry['paper_id'] for entry in knowledge_base])
+
+print(f"\n✅ Clustered {topic_clusters.chunks_seen} chunks into {n_topic_clusters} topic clusters")
+print(f"   Batch size: {topic_clusters.batch_size}")
+
+print("\n" + "=" * 80)
+print("CLUSTER THEMES")
+print("=" * 80)
+for theme in topic_clusters.cluster_themes():
+    print(f"\n🧩 Cluster {theme['cluster_id']}: {theme['label']}")
+    print(f"   Top terms: {', '.join(theme['top_terms'])}")
+    print(f"   Chunks: {theme['chunk_count']} | Papers: {theme['paper_count']} {theme['paper_ids']}")
+
+print("\n" + "=" * 80)
+print("✅ Topic clusters ready: 'topic_clusters'")
+print("=" * 80)
@@ -0,0 +1,16 @@
+"""Synthetic corpora and scaling benchmarks for the research assistant pipeline."""
+from .corpus import corpus_statistics, generate_corpus
+from .retrieval import build_query_set, evaluate_backend, run_retrieval_benchmark
+from .suite import compare_results, run_size, run_suite, scaling_exponents
+
+__all__ = [
+    'build_query_set',
+    'compare_results',
+    'corpus_statistics',
+    'evaluate_backend',
+    'generate_corpus',
+    'run_retrieval_benchmark',
+    'run_size',
+    'run_suite',
+    'scaling_exponents',
+]
@@ -0,0 +1,101 @@
+"""
+Run or compare pipeline scaling benchmarks.
+
+    python -m benchmarks run [--sizes N ...] [--seed S] [--workers N] [--memory] [--output PATH]
+    python -m benchmarks compare BASE HEAD
+    python -m benchmarks show [RESULT]
+    python -m benchmarks retrieval [--papers N] [--queries N] [--k K ...] [--backends NAME ...] [--output PATH]
+
+BASE, HEAD and RESULT are commits with saved results in benchmarks/results/
+or paths to result files.
+"""
+import argparse
+import json
+import os
+import sys
+
+from .corpus import generate_corpus
+from .retrieval import DEFAULT_KS, print_comparison, run_retrieval_benchmark
+from .suite import (DEFAULT_SIZES, compare_results, configure_environment, git_commit, print_results, results_path,
+                    run_pipeline, run_suite)
+
+
+def load_results(name):
+    """Load a result file by path or by the commit it was recorded at."""
+    path = name if os.path.exists(name) else results_path(name)
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks', description='Scaling benchmarks on synthetic corpora')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='Benchmark every stage across corpus sizes')
+    run.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='Corpus sizes in papers')
+    run.add_argument('--seed', type=int, default=0, help='Synthetic corpus seed')
+    run.add_argument('--workers', type=int, default=None, help='Canvas worker threads')
+    run.add_argument('--memory', action='store_true', help='Record tracemalloc peaks per stage (slower)')
+    run.add_argument('--output', default=None, help='Result file (default benchmarks/results/<commit>.json)')
+    compare = commands.add_parser('compare', help='Compare the results of two commits')
+    compare.add_argument('base', help='Baseline commit or result file')
+    compare.add_argument('head', help='Commit or result file under test')
+    show = commands.add_parser('show', help='Print a saved result')
+    show.add_argument('result', nargs='?', default=None, help='Commit or result file (default HEAD)')
+    retrieval = commands.add_parser('retrieval', help='Compare retrieval backends on recall, MRR, latency and memory')
+    retrieval.add_argument('--papers', type=int, default=1000, help='Synthetic corpus size')
+    retrieval.add_argument('--seed', type=int, default=0, help='Corpus and query sampling seed')
+    retrieval.add_argument('--queries', type=int, default=200, help='Labeled queries drawn from paper keywords')
+    retrieval.add_argument('--k', type=int, nargs='+', default=list(DEFAULT_KS), help='Recall cutoffs')
+    retrieval.add_argument('--backends', nargs='+', default=None,
+                           help='Backends to compare (default all: semantic_search exact sparse quantized ivf hybrid)')
+    retrieval.add_argument('--output', default=None,
+                           help='Result file (default benchmarks/results/retrieval-<commit>.json)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare':
+        compare_results(load_results(args.base), load_results(args.head))
+        return 0
+    if args.command == 'show':
+        results = load_results(args.result or git_commit())
+        print(f"\n📈 Scaling benchmark at {results['commit']} ({results['created']})")
+        print_results(results)
+        return 0
+
+    if args.command == 'retrieval':
+        print("=" * 80)
+        print("RETRIEVAL QUALITY VS LATENCY")
+        print("=" * 80)
+        configure_environment()
+        papers = generate_corpus(args.papers, args.seed)
+        executor = run_pipeline(papers, targets=['Semantic Search System'])
+        if executor.summary()['failed']:
+            print(f"\n❌ Failed: {', '.join(executor.summary()['failed'])}")
+            return 1
+        results = run_retrieval_benchmark(executor.namespace(), papers, args.backends, tuple(sorted(args.k)),
+                                          args.queries, args.seed)
+        results.update(commit=git_commit(), seed=args.seed)
+        path = args.output or results_path(f"retrieval-{results['commit']}")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print_comparison(results)
+        print(f"\n💾 Results: {path}")
+        print("=" * 80)
+        return 0
+
+    print("=" * 80)
+    print("PIPELINE SCALING BENCHMARK")
+    print("=" * 80)
+    results = run_suite(args.sizes, args.seed, args.workers, args.memory)
+    path = args.output or results_path(results['commit'])
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print_results(results)
+    print(f"\n💾 Results: {path}")
+    print("=" * 80)
+    return 1 if any(run['status'] != 'ok' for run in results['runs']) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,362 @@
+"""
+Retrieval quality-vs-latency comparison across index modes.
+
+A labeled query set is built from the corpus: each query is a paper's
+keywords and its expected answer is that paper (or any other paper tagged
+with all of those keywords). Every backend answers queries in
+semantic_search's result schema, so anything returning those dictionaries
+from search(query, top_k) plugs in. For each backend the harness measures recall@k, MRR, overlap with
+exact search, p50/p99 query latency, build time and index memory.
+
+Backends:
+    semantic_search  the canvas function as is (re-stacks the embeddings per query)
+    exact            normalized dense matrix built once, one product per query
+    sparse           normalized CSR TF-IDF matrix, never densified
+    quantized        int8 codes with a per-row scale, scored on the query's terms only
+    ivf              approximate: k-means inverted lists, nearest lists probed exactly
+    hybrid           query cleaned like the corpus, TF-IDF and BM25 fused by reciprocal rank
+"""
+import math
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import CountVectorizer
+
+# Cutoffs reported for recall; the deepest one is also the MRR and overlap depth
+DEFAULT_KS = (1, 3, 10)
+
+
+def _nbytes(*arrays):
+    """Memory held by numpy arrays and scipy sparse matrices."""
+    total = 0
+    for array in arrays:
+        if sp.issparse(array):
+            total += array.data.nbytes + array.indices.nbytes + array.indptr.nbytes
+        elif array is not None:
+            total += np.asarray(array).nbytes
+    return total
+
+
+def top_indices(scores, top_k):
+    """Indices of the top_k scores, best first."""
+    top_k = min(top_k, len(scores))
+    if top_k <= 0:
+        return np.array([], dtype=int)
+    candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+def search_results(knowledge_base, indices, scores):
+    """Result dictionaries in semantic_search's schema."""
+    return [{
+        'rank': rank,
+        'similarity': float(scores[idx]),
+        'chunk_id': knowledge_base[idx]['chunk_id'],
+        'paper_id': knowledge_base[idx]['paper_id'],
+        'paper_title': knowledge_base[idx]['paper_title'],
+        'chunk_text': knowledge_base[idx]['chunk_text'],
+        'token_count': knowledge_base[idx]['token_count'],
+        'token_start': knowledge_base[idx]['token_start'],
+        'token_end': knowledge_base[idx]['token_end']
+    } for rank, idx in enumerate(indices, 1)]
+
+
+class SemanticSearchBackend:
+    """The canvas semantic_search function, unchanged; its index is the knowledge base embeddings."""
+
+    def __init__(self, search, knowledge_base):
+        self.search = search
+        self.nbytes = sum(k['embedding'].nbytes for k in knowledge_base)
+
+
+class ExactBackend:
+    """Brute-force cosine similarity over a dense matrix normalized once at build time."""
+
+    def __init__(self, knowledge_base, vectorizer):
+        self.knowledge_base = knowledge_base
+        self.vectorizer = vectorizer
+        matrix = np.vstack([k['embedding'] for k in knowledge_base])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms == 0, 1.0, norms)
+        self.nbytes = _nbytes(self.matrix)
+
+    def search(self, query, top_k=3):
+        scores = np.asarray(self.vectorizer.transform([query]) @ self.matrix.T).ravel()
+        return search_results(self.knowledge_base, top_indices(scores, top_k), scores)
+
+
+class SparseBackend:
+    """Cosine similarity on the CSR TF-IDF matrix; memory grows with non-zeros, not vocabulary."""
+
+    def __init__(self, knowledge_base, vectorizer):
+        self.knowledge_base = knowledge_base
+        self.vectorizer = vectorizer
+        matrix = sp.csr_matrix(np.vstack([k['embedding'] for k in knowledge_base]))
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1))).ravel()
+        # Rows are stored transposed (terms × chunks) so a query reads only its terms' rows
+        self.matrix_t = (sp.diags(1.0 / np.where(norms == 0, 1.0, norms)) @ matrix).T.tocsr()
+        self.nbytes = _nbytes(self.matrix_t)
+
+    def search(self, query, top_k=3):
+        scores = (self.vectorizer.transform([query]) @ self.matrix_t).toarray().ravel()
+        return search_results(self.knowledge_base, top_indices(scores, top_k), scores)
+
+
+class QuantizedBackend:
+    """
+    int8 embeddings with one float scale per chunk.
+
+    Codes are kept column-major, so scoring gathers only the columns of the
+    query's non-zero terms. Scores approximate the exact cosine to about 1%.
+    """
+
+    def __init__(self, knowledge_base, vectorizer):
+        self.knowledge_base = knowledge_base
+        self.vectorizer = vectorizer
+        matrix = np.vstack([k['embedding'] for k in knowledge_base])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1.0, norms)
+        peaks = np.abs(matrix).max(axis=1)
+        self.scales = (np.where(peaks == 0, 1.0, peaks) / 127.0).astype(np.float32)
+        self.codes = np.asfortranarray(np.round(matrix / self.scales[:, None]).astype(np.int8))
+        self.nbytes = _nbytes(self.codes, self.scales)
+
+    def search(self, query, top_k=3):
+        query_vector = self.vectorizer.transform([query])
+        terms, weights = query_vector.indices, query_vector.data.astype(np.float32)
+        if len(terms) == 0:
+            scores = np.zeros(len(self.knowledge_base), dtype=np.float32)
+        else:
+            scores = (self.codes[:, terms].astype(np.float32) @ weights) * self.scales
+        return search_results(self.knowledge_base, top_indices(scores, top_k), scores)
+
+
+class IVFBackend:
+    """
+    Approximate search over k-means inverted lists (IVF).
+
+    Chunks are assigned to their nearest of about sqrt(n) centroids; a query
+    scores the centroids, then only the chunks of its n_probe nearest lists.
+    """
+
+    def __init__(self, knowledge_base, vectorizer, n_lists=None, n_probe=4, random_state=42):
+        self.knowledge_base = knowledge_base
+        self.vectorizer = vectorizer
+        matrix = np.vstack([k['embedding'] for k in knowledge_base])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms == 0, 1.0, norms)
+        n_lists = n_lists or max(1, int(math.sqrt(len(knowledge_base))))
+        n_lists = min(n_lists, len(knowledge_base))
+        model = MiniBatchKMeans(n_clusters=n_lists, batch_size=1024, random_state=random_state, n_init=1)
+        assignments = model.fit_predict(self.matrix)
+        self.centroids = model.cluster_centers_
+        self.lists = [np.flatnonzero(assignments == cluster) for cluster in range(n_lists)]
+        self.n_probe = min(n_probe, n_lists)
+        self.nbytes = _nbytes(self.matrix, self.centroids, *self.lists)
+
+    def search(self, query, top_k=3):
+        query_vector = self.vectorizer.transform([query])
+        centroid_scores = np.asarray(query_vector @ self.centroids.T).ravel()
+        probed = np.argpartition(-centroid_scores, self.n_probe - 1)[:self.n_probe]
+        candidates = np.concatenate([self.lists[cluster] for cluster in probed])
+        candidate_scores = np.asarray(query_vector @ self.matrix[candidates].T).ravel()
+        best = top_indices(candidate_scores, top_k)
+        scores = np.zeros(len(self.knowledge_base))
+        scores[candidates] = candidate_scores
+        return search_results(self.knowledge_base, candidates[best], scores)
+
+
+class HybridBackend:
+    """
+    Lexical and TF-IDF retrieval fused by reciprocal rank.
+
+    The query is cleaned and lemmatized like the chunks before scoring. BM25
+    runs over the full unigram vocabulary of the chunks (not capped like the
+    TF-IDF features), so rare terms still match. Each side contributes its
+    top candidates and results are ranked by the sum of 1 / (rrf_k + rank).
+    """
+
+    def __init__(self, knowledge_base, vectorizer, normalize=None, candidates=50, rrf_k=60, k1=1.2, b=0.75):
+        self.knowledge_base = knowledge_base
+        self.dense = SparseBackend(knowledge_base, vectorizer)
+        self.normalize = normalize or (lambda text: text)
+        self.candidates = candidates
+        self.rrf_k = rrf_k
+        self.counter = CountVectorizer()
+        counts = self.counter.fit_transform(k['chunk_text'] for k in knowledge_base).tocsr().astype(np.float64)
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+        self.idf = np.log(1 + (len(knowledge_base) - document_frequency + 0.5) / (document_frequency + 0.5))
+        # BM25 term saturation precomputed per non-zero, stored terms × chunks
+        row_lengths = np.repeat(lengths, np.diff(counts.indptr))
+        counts.data = counts.data * (k1 + 1) / (counts.data + k1 * (1 - b + b * row_lengths / lengths.mean()))
+        self.bm25_t = counts.T.tocsr()
+        self.nbytes = self.dense.nbytes + _nbytes(self.bm25_t, self.idf)
+
+    def search(self, query, top_k=3):
+        text = self.normalize(query)
+        tfidf_scores = (self.dense.vectorizer.transform([text]) @ self.dense.matrix_t).toarray().ravel()
+        terms = self.counter.transform([text]).indices
+        bm25_scores = np.asarray(self.bm25_t[terms].T @ self.idf[terms]).ravel() if len(terms) else \
+            np.zeros(len(self.knowledge_base))
+        fused = np.zeros(len(self.knowledge_base))
+        for scores in (tfidf_scores, bm25_scores):
+            ranked = top_indices(scores, self.candidates)
+            ranked = ranked[scores[ranked] > 0]
+            fused[ranked] += 1.0 / (self.rrf_k + np.arange(1, len(ranked) + 1))
+        return search_results(self.knowledge_base, top_indices(fused, top_k), fused)
+
+
+def default_backends(namespace):
+    """
+    Backend builders over a canvas namespace, by name.
+
+    Each builder takes no arguments and returns an object with
+    search(query, top_k) and nbytes; its run time is the build time.
+    """
+    knowledge_base, vectorizer = namespace['knowledge_base'], namespace['tfidf_vectorizer']
+    normalize = lambda text: ' '.join(namespace['tokenize_and_clean'](namespace['clean_text'](text)))
+    return {
+        'semantic_search': lambda: SemanticSearchBackend(namespace['semantic_search'], knowledge_base),
+        'exact': lambda: ExactBackend(knowledge_base, vectorizer),
+        'sparse': lambda: SparseBackend(knowledge_base, vectorizer),
+        'quantized': lambda: QuantizedBackend(knowledge_base, vectorizer),
+        'ivf': lambda: IVFBackend(knowledge_base, vectorizer),
+        'hybrid': lambda: HybridBackend(knowledge_base, vectorizer, normalize=normalize),
+    }
+
+
+def build_query_set(papers, max_queries=200, seed=0):
+    """
+    Labeled queries from paper keywords.
+
+    Args:
+        papers: Papers as in sample_papers; paper_id is the 1-based position
+        max_queries: Queries sampled (deterministically) when there are more papers
+        seed: Sampling seed
+
+    Returns:
+        List of {'query', 'paper_id', 'relevant_paper_ids'}; every paper tagged
+        with all of the query's keywords is relevant
+    """
+    papers_by_keyword = {}
+    for paper_id, paper in enumerate(papers, 1):
+        for keyword in paper['keywords']:
+            papers_by_keyword.setdefault(keyword.lower(), set()).add(paper_id)
+    paper_ids = list(range(1, len(papers) + 1))
+    if len(paper_ids) > max_queries:
+        paper_ids = sorted(random.Random(seed).sample(paper_ids, max_queries))
+    queries = []
+    for paper_id in paper_ids:
+        keywords = papers[paper_id - 1]['keywords']
+        queries.append({
+            'query': ' '.join(keywords),
+            'paper_id': paper_id,
+            'relevant_paper_ids': sorted(set.intersection(*(papers_by_keyword[k.lower()] for k in keywords)))
+        })
+    return queries
+
+
+def evaluate_backend(build, query_set, ks=DEFAULT_KS, reference=None):
+    """
+    Build a backend and score it on a labeled query set.
+
+    Args:
+        build: Zero-argument builder returning an object with search() and nbytes
+        query_set: Queries from build_query_set()
+        ks: Recall cutoffs; max(ks) results are requested per query
+        reference: Per-query chunk id lists of the exact backend, for overlap@k
+
+    Returns:
+        Tuple of (metrics dictionary, per-query chunk id lists)
+    """
+    depth = max(ks)
+    started = time.perf_counter()
+    backend = build()
+    build_seconds = time.perf_counter() - started
+
+    hits = {k: 0 for k in ks}
+    reciprocal_ranks, latencies, overlaps, retrieved = [], [], [], []
+    for position, item in enumerate(query_set):
+        started = time.perf_counter()
+        results = backend.search(item['query'], top_k=depth)
+        latencies.append((time.perf_counter() - started) * 1000)
+        relevant = set(item['relevant_paper_ids'])
+        first = next((r['rank'] for r in results if r['paper_id'] in relevant), None)
+        for k in ks:
+            hits[k] += first is not None and first <= k
+        reciprocal_ranks.append(1.0 / first if first else 0.0)
+        chunk_ids = [r['chunk_id'] for r in results]
+        retrieved.append(chunk_ids)
+        if reference is not None:
+            overlaps.append(len(set(chunk_ids) & set(reference[position])) / max(len(reference[position]), 1))
+
+    latencies.sort()
+    metrics = {
+        **{f"recall@{k}": round(hits[k] / len(query_set), 4) for k in ks},
+        'mrr': round(statistics.fmean(reciprocal_ranks), 4),
+        f"overlap@{depth}": round(statistics.fmean(overlaps), 4) if overlaps else None,
+        'p50_ms': round(latencies[len(latencies) // 2], 4),
+        'p99_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 4),
+        'build_seconds': round(build_seconds, 4),
+        'index_mb': round(backend.nbytes / 1e6, 3)
+    }
+    return metrics, retrieved
+
+
+def run_retrieval_benchmark(namespace, papers, backends=None, ks=DEFAULT_KS, max_queries=200, seed=0):
+    """
+    Compare retrieval backends on one corpus.
+
+    Args:
+        namespace: Canvas namespace with knowledge_base, tfidf_vectorizer and semantic_search
+        papers: The papers the knowledge base was built from
+        backends: Names from default_backends() to run (all by default)
+        ks: Recall cutoffs
+        max_queries: Size of the labeled query set
+        seed: Query sampling seed
+
+    Returns:
+        Dictionary with the query set size and per-backend metrics, in run order
+    """
+    builders = default_backends(namespace)
+    names = list(backends or builders)
+    unknown = [name for name in names if name not in builders]
+    if unknown:
+        raise ValueError(f"Unknown retrieval backends: {', '.join(unknown)} (available: {', '.join(builders)})")
+    query_set = build_query_set(papers, max_queries, seed)
+    # Exact search runs first so every other backend is compared against its results
+    reference_metrics, reference = evaluate_backend(builders['exact'], query_set, ks)
+    results = {}
+    for name in names:
+        if name == 'exact':
+            results[name] = dict(reference_metrics, **{f"overlap@{max(ks)}": 1.0})
+        else:
+            results[name], _ = evaluate_backend(builders[name], query_set, ks, reference)
+    return {
+        'papers': len(papers),
+        'chunks': len(namespace['knowledge_base']),
+        'queries': len(query_set),
+        'ks': list(ks),
+        'backends': results
+    }
+
+
+def print_comparison(results, out=None):
+    """Quality-vs-latency table, one row per backend."""
+    out = out or sys.stdout
+    depth = max(results['ks'])
+    columns = [f"recall@{k}" for k in results['ks']] + ['mrr', f"overlap@{depth}", 'p50_ms', 'p99_ms',
+                                                        'build_seconds', 'index_mb']
+    headers = [f"R@{k}" for k in results['ks']] + ['MRR', f"Ovl@{depth}", 'p50 ms', 'p99 ms', 'Build s', 'Index MB']
+    out.write(f"\n   {results['papers']:,} papers | {results['chunks']:,} chunks | {results['queries']} queries\n")
+    out.write(f"\n   {'Backend':<16}" + ''.join(f"{h:>10}" for h in headers) + '\n')
+    out.write(f"   {'─' * 16}" + ''.join(f"{'─' * 9:>10}" for _ in headers) + '\n')
+    for name, metrics in results['backends'].items():
+        out.write(f"   {name:<16}" + ''.join(f"{metrics[c]:>10.4g}" if metrics[c] is not None else f"{'-':>10}"
+                                              for c in columns) + '\n')
@@ -0,0 +1,278 @@
+"""
+Scaling benchmark for the canvas pipeline on synthetic corpora.
+
+For each corpus size the canvas is run headless up to the agents, with the
+synthetic papers injected in place of sample_papers and the stage cache
+disabled. Stage times come from the Stage Tracer spans (NLP, create_chunks,
+embedding, each agent) and from the runner's per-block timings;
+semantic_search is timed separately on the research questions and keywords
+against the finished index. Runs are unbounded (no run deadline); a run that
+still produces a partial agent output is recorded with status 'partial' and,
+like a failed run, left out of scaling exponents and comparisons. Results
+are stored as JSON keyed by the git commit, so runs on two commits can be
+compared stage by stage.
+"""
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from canvas_runtime import StageCache, run_canvas
+
+from .corpus import corpus_statistics, generate_corpus
+
+DEFAULT_SIZES = (10, 100, 1000)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Blocks run for every size, with their ancestors; dashboards and reports are left out
+BENCHMARK_TARGETS = ['Agent 5 - Report Writer & Controller', 'Enhanced Fact-Check with Inconsistency Detection']
+
+# Reported stage -> Stage Tracer span
+STAGE_SPANS = {
+    'nlp': 'nlp.process_papers',
+    'create_chunks': 'chunking.segment_papers',
+    'embedding': 'embedding.fit_transform',
+    'agent.paper_reader': 'agent.paper_reader',
+    'agent.summarization': 'agent.summarization',
+    'agent.fact_check': 'agent.fact_check',
+    'agent.insight_generator': 'agent.insight_generator',
+    'agent.report_writer': 'agent.report_writer',
+    'agent.enhanced_fact_check': 'agent.enhanced_fact_check',
+}
+
+# Times each benchmark query is searched; the per-query latency is the median
+SEARCH_REPEATS = 5
+
+
+def git_commit(path=os.path.dirname(os.path.abspath(__file__))):
+    """Short HEAD commit, suffixed with '-dirty' when the tree has uncommitted changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=path, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=path,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f"{commit}-dirty" if dirty else commit
+
+
+def time_search(search, queries, repeats=SEARCH_REPEATS):
+    """Median and worst per-query latency of a search function, in milliseconds."""
+    latencies = []
+    for query in queries:
+        runs = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            search(query, top_k=3)
+            runs.append((time.perf_counter() - started) * 1000)
+        latencies.append(statistics.median(runs))
+    latencies.sort()
+    return {
+        'queries': len(queries),
+        'p50_ms': round(statistics.median(latencies), 4),
+        'max_ms': round(latencies[-1], 4),
+        'mean_ms': round(statistics.fmean(latencies), 4)
+    }
+
+
+def configure_environment(memory=False):
+    """
+    Headless, untraced and unbounded block settings for benchmark runs
+    (read by the Event Log, Stage Tracer and Run Deadline blocks).
+    """
+    os.environ['RESEARCH_QUIET'] = '1'
+    os.environ.pop('RESEARCH_TRACE', None)
+    # A deadline would time cut-short stages, which are not comparable across sizes or commits
+    os.environ.pop('RESEARCH_RUN_DEADLINE', None)
+    if memory:
+        os.environ['RESEARCH_TRACE_MEMORY'] = '1'
+    else:
+        os.environ.pop('RESEARCH_TRACE_MEMORY', None)
+
+
+def run_pipeline(papers, targets=BENCHMARK_TARGETS, workers=None):
+    """Run the target blocks with the given papers in place of sample_papers and no stage cache."""
+    return run_canvas(max_workers=workers, echo=False, targets=targets, overrides={'sample_papers': papers},
+                      cache=StageCache(directory=None))
+
+
+def partial_outputs(namespace):
+    """Agent outputs flagged partial by a deadline, with what each one skipped."""
+    return {name: {'incomplete_papers': len(value.get('incomplete_papers', [])),
+                   'partial_sections': value.get('partial_sections', [])}
+            for name, value in namespace.items() if isinstance(value, dict) and value.get('partial')}
+
+
+def run_size(n_papers, seed=0, workers=None):
+    """
+    Run the benchmark targets on one synthetic corpus.
+
+    Args:
+        n_papers: Corpus size
+        seed: Corpus seed
+        workers: Canvas worker threads
+
+    Returns:
+        Result dictionary: status ('ok', 'partial' or 'failed'), corpus
+        statistics, stage and block timings
+    """
+    started = time.perf_counter()
+    papers = generate_corpus(n_papers, seed)
+    generate_seconds = time.perf_counter() - started
+
+    executor = run_pipeline(papers, workers=workers)
+    summary = executor.summary()
+    result = {
+        'papers': n_papers,
+        'status': 'failed' if summary['failed'] else 'ok',
+        'corpus': corpus_statistics(papers),
+        'generate_seconds': round(generate_seconds, 4),
+        'wall_seconds': round(summary['wall_time'], 4),
+        'critical_path_seconds': round(summary['critical_path_time'], 4),
+        'blocks': {r.name: {'status': r.status, 'wall_seconds': round(r.duration, 4), 'cpu_seconds': round(r.cpu, 4)}
+                   for r in executor.results.values()},
+        'stages': {}
+    }
+    if summary['failed']:
+        # The exception line is the last unindented line of the traceback
+        result['errors'] = {r.name: [line for line in r.error.splitlines() if line[:1].strip()][-1]
+                            for r in executor.results.values() if r.status == 'failed'}
+        return result
+
+    namespace = executor.namespace()
+    partial = partial_outputs(namespace)
+    if partial:
+        result['status'] = 'partial'
+        result['partial_outputs'] = partial
+    spans = {row['name']: row for row in namespace['stage_tracer'].summary()}
+    for stage, span in STAGE_SPANS.items():
+        if span in spans:
+            row = spans[span]
+            result['stages'][stage] = {'wall_seconds': round(row['wall_ms'] / 1000, 4),
+                                       'cpu_seconds': round(row['cpu_ms'] / 1000, 4)}
+            if row['peak_kb'] is not None:
+                result['stages'][stage]['peak_kb'] = row['peak_kb']
+    queries = namespace['research_questions'] + namespace['research_keywords']
+    search = time_search(namespace['semantic_search'], queries)
+    result['stages']['semantic_search'] = {'wall_seconds': round(search['p50_ms'] / 1000, 6), **search}
+    result['chunks'] = len(namespace['knowledge_base'])
+    return result
+
+
+def scaling_exponents(runs):
+    """
+    Least-squares slope of log(stage time) against log(corpus size) per stage.
+
+    1.0 is linear scaling and 2.0 quadratic; stages with fewer than two
+    successful sizes are left out.
+    """
+    exponents = {}
+    stages = sorted({stage for run in runs for stage in run['stages']})
+    for stage in stages:
+        points = [(math.log(run['papers']), math.log(run['stages'][stage]['wall_seconds'])) for run in runs
+                  if stage in run['stages'] and run['stages'][stage]['wall_seconds'] > 0]
+        if len(points) < 2:
+            continue
+        mean_x = statistics.fmean(x for x, _ in points)
+        mean_y = statistics.fmean(y for _, y in points)
+        spread = sum((x - mean_x) ** 2 for x, _ in points)
+        if spread > 0:
+            exponents[stage] = round(sum((x - mean_x) * (y - mean_y) for x, y in points) / spread, 3)
+    return exponents
+
+
+def run_suite(sizes=DEFAULT_SIZES, seed=0, workers=None, memory=False, log=print):
+    """
+    Benchmark every corpus size, smallest first.
+
+    Sizes after the first failing or partial one are not attempted: a stage
+    that fails (typically out of memory) or is cut short at one size is at
+    every larger size too.
+
+    Args:
+        sizes: Corpus sizes in papers
+        seed: Corpus seed
+        workers: Canvas worker threads
+        memory: Record tracemalloc peaks per stage (slows every stage down)
+        log: Progress callback taking one line of text
+
+    Returns:
+        Suite result dictionary, saved as JSON under results_path(commit)
+    """
+    configure_environment(memory)
+    runs = []
+    for n_papers in sorted(sizes):
+        log(f"   {n_papers:>8} papers ...")
+        run = run_size(n_papers, seed, workers)
+        runs.append(run)
+        log(f"   {n_papers:>8} papers: {run['status']} in {run['wall_seconds']:.2f}s")
+        if run['status'] == 'failed':
+            for block, error in run['errors'].items():
+                log(f"            {block}: {error}")
+            break
+        if run['status'] == 'partial':
+            for output, skipped in run['partial_outputs'].items():
+                log(f"            {output}: partial ({skipped['incomplete_papers']} papers incomplete, "
+                    f"sections skipped: {', '.join(skipped['partial_sections']) or 'none'})")
+            break
+    return {
+        'commit': git_commit(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'memory_traced': memory,
+        'runs': runs,
+        'scaling_exponents': scaling_exponents([run for run in runs if run['status'] == 'ok'])
+    }
+
+
+def results_path(commit, directory=RESULTS_DIR):
+    return os.path.join(directory, f"{commit}.json")
+
+
+def print_results(results, out=None):
+    """Stage-by-size wall time table with the fitted scaling exponents."""
+    out = out or sys.stdout
+    runs = [run for run in results['runs'] if run['status'] == 'ok']
+    stages = list(STAGE_SPANS) + ['semantic_search']
+    out.write(f"\n   {'Stage':<28}" + ''.join(f"{run['papers']:>12,}" for run in runs) + f"{'Exponent':>10}\n")
+    out.write(f"   {'─' * 28}" + ''.join(f"{'─' * 11:>12}" for _ in runs) + f"{'─' * 9:>10}\n")
+    for stage in stages:
+        cells = ''.join(f"{run['stages'][stage]['wall_seconds'] * 1000:>10.1f}ms" if stage in run['stages']
+                        else f"{'-':>12}" for run in runs)
+        exponent = results['scaling_exponents'].get(stage)
+        out.write(f"   {stage:<28}{cells}{exponent if exponent is not None else '-':>10}\n")
+    out.write(f"   {'canvas wall time':<28}" + ''.join(f"{run['wall_seconds']:>11.2f}s" for run in runs) + '\n')
+
+
+def compare_results(base, head, out=None):
+    """
+    Print head/base wall time ratios per stage and corpus size.
+
+    Args:
+        base: Suite result of the baseline commit
+        head: Suite result of the commit under test
+        out: Output stream (defaults to stdout)
+    """
+    out = out or sys.stdout
+    base_runs = {run['papers']: run for run in base['runs'] if run['status'] == 'ok'}
+    head_runs = {run['papers']: run for run in head['runs'] if run['status'] == 'ok'}
+    sizes = sorted(set(base_runs) & set(head_runs))
+    out.write(f"\n   {base['commit']} → {head['commit']} (ratio of wall times; < 1 is faster)\n")
+    out.write(f"\n   {'Stage':<28}" + ''.join(f"{size:>12,}" for size in sizes) + '\n')
+    out.write(f"   {'─' * 28}" + ''.join(f"{'─' * 11:>12}" for _ in sizes) + '\n')
+    for stage in list(STAGE_SPANS) + ['semantic_search']:
+        cells = []
+        for size in sizes:
+            old = base_runs[size]['stages'].get(stage, {}).get('wall_seconds')
+            new = head_runs[size]['stages'].get(stage, {}).get('wall_seconds')
+            cells.append(f"{new / old:>11.2f}x" if old and new is not None else f"{'-':>12}")
+        out.write(f"   {stage:<28}{''.join(cells)}\n")
+    missing = sorted(set(base_runs) ^ set(head_runs))
+    if missing:
+        out.write(f"\n   Sizes measured on only one commit: {', '.join(map(str, missing))}\n")
@@ -0,0 +1,21 @@
+"""Headless runtime for the research assistant canvas."""
+from .dag import (
+    Block,
+    BlockResult,
+    CanvasDAG,
+    CanvasExecutor,
+    DEFAULT_LAYER_PATH,
+    run_canvas,
+)
+from .memo import StageCache, UncacheableStage
+
+__all__ = [
+    'Block',
+    'BlockResult',
+    'CanvasDAG',
+    'CanvasExecutor',
+    'DEFAULT_LAYER_PATH',
+    'StageCache',
+    'UncacheableStage',
+    'run_canvas',
+]
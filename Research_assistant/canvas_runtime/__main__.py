@@ -0,0 +1,107 @@
+"""
+Run the canvas from the command line.
+
+    python -m canvas_runtime [layer.yaml] [--workers N] [--quiet] [--target BLOCK ...]
+                             [--param NAME=VALUE ...] [--cache-dir DIR | --no-cache]
+                             [--deadline SECONDS] [--log-level LEVEL] [--event-log PATH]
+                             [--trace PATH] [--trace-memory]
+"""
+import argparse
+import ast
+import json
+import os
+import sys
+
+from .dag import DEFAULT_LAYER_PATH, run_canvas
+from .memo import DEFAULT_CACHE_DIR, DEFAULT_STAGES_PATH, StageCache
+
+
+def parse_param(text):
+    """Parse NAME=VALUE, reading VALUE as a Python literal when possible."""
+    name, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got '{text}'")
+    try:
+        return name.strip(), ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name.strip(), value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='canvas_runtime', description='Execute the canvas blocks in layer.yaml')
+    parser.add_argument('layer', nargs='?', default=DEFAULT_LAYER_PATH, help='Path to layer.yaml')
+    parser.add_argument('--workers', type=int, default=None, help='Worker threads for independent blocks')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Do not print block output; per-item events are not even formatted')
+    parser.add_argument('--target', action='append', default=[],
+                        help='Run only this block and its ancestors (repeatable)')
+    parser.add_argument('--param', type=parse_param, action='append', default=[],
+                        help='Override a stage parameter declared in stages.yaml, e.g. CHUNK_SIZE=200')
+    parser.add_argument('--stages', default=DEFAULT_STAGES_PATH, help='Path to stages.yaml')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Stage cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='Run every stage without reading or writing the cache')
+    parser.add_argument('--deadline', type=float, default=None,
+                        help='Run deadline in seconds; agents degrade and optional blocks are skipped past it')
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default=None,
+                        help='Minimum level of pipeline events (default INFO)')
+    parser.add_argument('--event-log', default=None, help='Append pipeline events to this JSONL file')
+    parser.add_argument('--trace', default=None,
+                        help='Write block and stage spans to this Chrome trace JSON file (open in Perfetto)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Record tracemalloc peaks per stage span (slower)')
+    args = parser.parse_args(argv)
+    # Read by the Event Log block
+    if args.quiet:
+        os.environ['RESEARCH_QUIET'] = '1'
+    if args.log_level:
+        os.environ['RESEARCH_LOG_LEVEL'] = args.log_level
+    if args.event_log:
+        os.environ['RESEARCH_EVENT_LOG'] = os.path.abspath(args.event_log)
+    if args.deadline is not None:
+        # Read by the Run Deadline block, which hands out the per-stage budgets
+        os.environ['RESEARCH_RUN_DEADLINE'] = str(args.deadline)
+    if args.trace_memory:
+        # Read by the Stage Tracer block
+        os.environ['RESEARCH_TRACE_MEMORY'] = '1'
+
+    cache = StageCache(None if args.no_cache else args.cache_dir, args.stages, dict(args.param))
+    executor = run_canvas(args.layer, max_workers=args.workers, echo=not args.quiet,
+                          targets=args.target or None, cache=cache, deadline=args.deadline)
+    summary = executor.summary()
+
+    print("\n" + "=" * 80)
+    print("CANVAS RUN SUMMARY")
+    print("=" * 80)
+    for name, status, duration in summary['blocks']:
+        marker = {'ok': '✓', 'cached': '↺', 'failed': '✗', 'skipped': '-'}[status]
+        print(f"   {marker} {name:<55} {duration:8.3f}s")
+    print(f"\n   Workers: {executor.max_workers}")
+    print(f"   Stages loaded from cache: {len(summary['cached'])}")
+    print(f"   Wall time: {summary['wall_time']:.3f}s")
+    print(f"   Serial time (sum of blocks): {summary['serial_time']:.3f}s")
+    print(f"   Critical path: {summary['critical_path_time']:.3f}s")
+    print(f"      {' → '.join(summary['critical_path'])}")
+    if summary['pyplot_lock_wait']:
+        print(f"   Waiting for the pyplot lock: {summary['pyplot_lock_wait']:.3f}s (plotting blocks run one at a time)")
+    if args.trace:
+        tracer = executor.namespace().get('stage_tracer')
+        events = executor.trace_events()
+        if tracer is not None:
+            tracer.export(args.trace, events)
+        else:
+            with open(args.trace, 'w') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        print(f"   Trace: {args.trace} ({len(events)} blocks)")
+    if summary['deadline_skipped']:
+        print(f"\n⏱️  Skipped at the {args.deadline}s deadline: {', '.join(summary['deadline_skipped'])}")
+    if summary['failed']:
+        print(f"\n❌ Failed: {', '.join(summary['failed'])}")
+        downstream = [name for name in summary['skipped'] if name not in summary['deadline_skipped']]
+        if downstream:
+            print(f"   Skipped downstream: {', '.join(downstream)}")
+    print("=" * 80)
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,540 @@
+"""
+Headless executor for the canvas block graph stored in layer.yaml.
+
+Each block is a Python script that reads the variables its upstream blocks
+defined. The executor runs every block in its own module namespace, seeded
+explicitly with the exports of its ancestors, and schedules blocks on a
+thread pool as soon as all of their parents have finished, so independent
+branches (enhanced fact-check, batch runner, ...) run concurrently. Blocks
+that use matplotlib.pyplot, such as the dashboards, are the exception: they
+run one at a time, and the time a block waits for another to finish
+plotting is reported separately from its duration. Block sources are
+parsed and compiled up front on the calling thread; workers only execute
+the compiled code.
+"""
+import ast
+import io
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+import types
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import yaml
+
+from .memo import StageCache, UncacheableStage, definitions_digest, definitions_only
+
+DEFAULT_LAYER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'Development', 'layer.yaml')
+
+# Block modules are registered under this package name so their functions pickle
+BLOCK_MODULE_PREFIX = 'canvas_blocks'
+
+# pyplot keeps a process-wide "current figure"; blocks that use it run one at a time
+_PYPLOT_LOCK = threading.Lock()
+
+
+@dataclass
+class Block:
+    """One canvas block and its position in the graph."""
+    id: str
+    name: str
+    path: str
+    x: int = 0
+    y: int = 0
+    parents: list = field(default_factory=list)
+    children: list = field(default_factory=list)
+
+    @property
+    def module_name(self):
+        slug = re.sub(r'[^0-9a-zA-Z]+', '_', self.name).strip('_').lower()
+        return f"{BLOCK_MODULE_PREFIX}.{slug}"
+
+
+@dataclass
+class CompiledBlock:
+    """A block's source parsed, parameterized and compiled ahead of execution."""
+    source: str
+    tree: ast.Module = None
+    code: types.CodeType = None
+    definitions: types.CodeType = None
+    params: dict = None
+    definitions_digest: str = None
+    error: str = ''
+
+
+@dataclass
+class BlockResult:
+    """Outcome of executing one block."""
+    name: str
+    status: str
+    start: float = 0.0
+    end: float = 0.0
+    cpu: float = 0.0
+    lock_wait: float = 0.0
+    output: str = ''
+    exports: list = field(default_factory=list)
+    error: str = ''
+    cache_key: str = None
+    note: str = ''
+
+    @property
+    def duration(self):
+        """Seconds spent running the block, excluding any wait for the pyplot lock."""
+        return self.end - self.start
+
+
+class CanvasDAG:
+    """
+    Block graph parsed from a layer.yaml file.
+
+    Blocks are ordered topologically with ties broken by canvas position
+    (left to right, top to bottom), which is the order a reader follows.
+    """
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.order = self._topological_order()
+        self._ancestors = {}
+
+    @classmethod
+    def from_yaml(cls, layer_path=DEFAULT_LAYER_PATH):
+        """
+        Parse blocks and edges from a layer.yaml file.
+
+        Args:
+            layer_path: Path to the layer.yaml describing the canvas layer
+
+        Returns:
+            CanvasDAG with one Block per canvas block
+        """
+        with open(layer_path) as f:
+            layer = yaml.safe_load(f)
+        directory = os.path.dirname(os.path.abspath(layer_path))
+        blocks = {
+            spec['id']: Block(spec['id'], spec['name'], os.path.join(directory, f"{spec['name']}.py"),
+                              spec.get('x', 0), spec.get('y', 0))
+            for spec in layer['blocks']
+        }
+        for edge in layer['edges']:
+            blocks[edge['target']].parents.append(edge['source'])
+            blocks[edge['source']].children.append(edge['target'])
+        return cls(blocks)
+
+    def _topological_order(self):
+        remaining = {block_id: len(block.parents) for block_id, block in self.blocks.items()}
+        position = lambda block_id: (self.blocks[block_id].x, self.blocks[block_id].y)
+        ready = sorted((block_id for block_id, count in remaining.items() if count == 0), key=position)
+        order = []
+        while ready:
+            block_id = ready.pop(0)
+            order.append(block_id)
+            for child in self.blocks[block_id].children:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+            ready.sort(key=position)
+        if len(order) != len(self.blocks):
+            cyclic = sorted(self.blocks[block_id].name for block_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Canvas graph has a cycle through: {', '.join(cyclic)}")
+        return order
+
+    def ancestors(self, block_id):
+        """All upstream block ids of a block, in topological order."""
+        if block_id not in self._ancestors:
+            upstream = set()
+            stack = list(self.blocks[block_id].parents)
+            while stack:
+                parent = stack.pop()
+                if parent not in upstream:
+                    upstream.add(parent)
+                    stack.extend(self.blocks[parent].parents)
+            self._ancestors[block_id] = [b for b in self.order if b in upstream]
+        return self._ancestors[block_id]
+
+    def descendants(self, block_id):
+        """All downstream block ids of a block."""
+        downstream = set()
+        stack = list(self.blocks[block_id].children)
+        while stack:
+            child = stack.pop()
+            if child not in downstream:
+                downstream.add(child)
+                stack.extend(self.blocks[child].children)
+        return downstream
+
+    def by_name(self, name):
+        """Return the block id for a block name."""
+        for block_id, block in self.blocks.items():
+            if block.name == name:
+                return block_id
+        raise KeyError(f"No block named '{name}'")
+
+    def critical_path(self, durations):
+        """
+        Longest chain of dependent blocks given per-block durations.
+
+        Args:
+            durations: Mapping of block id to seconds
+
+        Returns:
+            Tuple of (total seconds, list of block ids on the path)
+        """
+        finish, previous = {}, {}
+        for block_id in self.order:
+            parents = self.blocks[block_id].parents
+            best = max(parents, key=lambda p: finish[p], default=None)
+            finish[block_id] = (finish[best] if best else 0.0) + durations.get(block_id, 0.0)
+            previous[block_id] = best
+        if not finish:
+            return 0.0, []
+        block_id = max(finish, key=finish.get)
+        total, path = finish[block_id], []
+        while block_id is not None:
+            path.append(block_id)
+            block_id = previous[block_id]
+        return total, path[::-1]
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """stdout proxy that sends each worker thread's prints to its own buffer."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    def _target(self):
+        buffer = getattr(self.local, 'buffer', None)
+        return self.fallback if buffer is None else buffer
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+
+def _ensure_block_package():
+    if BLOCK_MODULE_PREFIX not in sys.modules:
+        package = types.ModuleType(BLOCK_MODULE_PREFIX)
+        package.__path__ = []
+        sys.modules[BLOCK_MODULE_PREFIX] = package
+
+
+class CanvasExecutor:
+    """
+    Runs a CanvasDAG on a worker pool with explicit variable passing.
+
+    A block's globals are the merged exports of its ancestors; its exports are
+    the names it binds or rebinds. Objects are shared, not copied, so blocks
+    that mutate an upstream object in place (e.g. the handoff store) see the
+    same instance downstream.
+    """
+
+    def __init__(self, dag, max_workers=None, echo=True, overrides=None, cache=None, deadline=None):
+        """
+        Args:
+            dag: CanvasDAG to execute
+            max_workers: Worker threads (defaults to the CPU count, at most 8)
+            echo: Print each block's captured output when it finishes
+            overrides: Variables injected into every block namespace after its inputs
+            cache: StageCache for memoized stages (defaults to one without persistence)
+            deadline: Seconds after which blocks marked optional in stages.yaml are skipped
+        """
+        self.dag = dag
+        self.max_workers = max_workers or max(2, min(8, os.cpu_count() or 2))
+        self.echo = echo
+        self.overrides = dict(overrides or {})
+        self.cache = cache if cache is not None else StageCache(directory=None)
+        self.deadline = deadline
+        self.exports = {}
+        self.stage_keys = {}
+        self.results = {}
+        self.compiled = {}
+        self._echo_lock = threading.Lock()
+        self._out = sys.stdout
+
+    def inputs_for(self, block_id):
+        """Merged namespace a block starts from."""
+        namespace = {}
+        for ancestor in self.dag.ancestors(block_id):
+            namespace.update(self.exports.get(ancestor, {}))
+        namespace.update(self.overrides)
+        return namespace
+
+    def _producer(self, block_id, name):
+        """Nearest upstream block that exported a variable."""
+        for ancestor in reversed(self.dag.ancestors(block_id)):
+            if name in self.exports.get(ancestor, {}):
+                return ancestor
+        return None
+
+    def _stage_key(self, block_id, prepared, inputs):
+        block = self.dag.blocks[block_id]
+        spec = self.cache.spec(block.name)
+        input_keys = {}
+        for name in spec['inputs']:
+            producer = self._producer(block_id, name)
+            if producer in self.stage_keys:
+                input_keys[name] = self.stage_keys[producer]
+        upstream = {self.dag.blocks[ancestor].name: self.compiled[ancestor].definitions_digest
+                    for ancestor in self.dag.ancestors(block_id)}
+        key, _ = self.cache.stage_key(block, prepared.tree, input_keys, inputs, prepared.params, upstream)
+        return key
+
+    def compile_blocks(self, block_ids):
+        """
+        Parse and compile blocks on the calling thread.
+
+        CPython's conversions between Python AST objects and compiled code keep
+        interpreter-wide state, and concurrent ast.parse()/compile() calls on
+        worker threads fail at random ("AST constructor recursion depth
+        mismatch"). Every block is therefore prepared here, before any worker
+        starts, and workers only exec the resulting code objects. Parameter
+        overrides of memoized stages are applied to the tree first, and every
+        block's definitions are digested for the keys of the stages below it.
+
+        Args:
+            block_ids: Blocks to prepare; already prepared blocks are skipped
+        """
+        for block_id in block_ids:
+            if block_id in self.compiled:
+                continue
+            block = self.dag.blocks[block_id]
+            with open(block.path) as f:
+                prepared = CompiledBlock(f.read())
+            try:
+                tree = ast.parse(prepared.source, block.path)
+                if self.cache.spec(block.name) is not None:
+                    prepared.params = self.cache.resolve_params(block, tree)
+                    prepared.definitions = compile(definitions_only(tree), block.path, 'exec')
+                prepared.code = compile(tree, block.path, 'exec')
+                prepared.tree = tree
+                prepared.definitions_digest = definitions_digest(tree)
+            except Exception:
+                prepared.error = traceback.format_exc()
+            self.compiled[block_id] = prepared
+
+    def _run_block(self, block_id, stdout_proxy):
+        block = self.dag.blocks[block_id]
+        prepared = self.compiled[block_id]
+        inputs = self.inputs_for(block_id)
+        module = types.ModuleType(block.module_name)
+        module.__file__ = block.path
+        namespace = module.__dict__
+        namespace.update(inputs)
+        sys.modules[block.module_name] = module
+
+        buffer = io.StringIO()
+        stdout_proxy.local.buffer = buffer
+        result = BlockResult(block.name, 'ok', start=time.perf_counter())
+        cpu_start = time.thread_time()
+        try:
+            if prepared.error:
+                result.status = 'failed'
+                result.error = prepared.error
+            else:
+                if self.cache.spec(block.name) is not None:
+                    try:
+                        result.cache_key = self._stage_key(block_id, prepared, inputs)
+                    except UncacheableStage as exc:
+                        result.note = f"not memoized: {exc}"
+                if result.cache_key is not None and self.cache.contains(block, result.cache_key):
+                    # Restore definitions in this module first: stored instances reference its classes
+                    exec(prepared.definitions, namespace)
+                    namespace.update(self.cache.load(block, result.cache_key))
+                    result.status = 'cached'
+                elif 'matplotlib.pyplot' in prepared.source:
+                    waiting = time.perf_counter()
+                    with _PYPLOT_LOCK:
+                        # Time spent waiting for another plotting block is not part of this block's duration
+                        result.lock_wait = time.perf_counter() - waiting
+                        result.start += result.lock_wait
+                        exec(prepared.code, namespace)
+                else:
+                    exec(prepared.code, namespace)
+        except Exception:
+            result.status = 'failed'
+            result.error = traceback.format_exc()
+        finally:
+            result.end = time.perf_counter()
+            result.cpu = time.thread_time() - cpu_start
+            stdout_proxy.local.buffer = None
+        result.output = buffer.getvalue()
+
+        exports = {
+            name: value for name, value in namespace.items()
+            if not name.startswith('__') and (name not in inputs or inputs[name] is not value)
+        }
+        result.exports = sorted(exports)
+        self.exports[block_id] = exports
+        if result.cache_key is not None and result.status != 'failed':
+            self.stage_keys[block_id] = result.cache_key
+            if result.status == 'ok':
+                try:
+                    self.cache.save(block, result.cache_key, exports)
+                except UncacheableStage as exc:
+                    result.note = f"not memoized: {exc}"
+        return result
+
+    def _past_deadline(self):
+        return self.deadline is not None and time.perf_counter() - self.wall_start >= self.deadline
+
+    def _skip(self, block_id, remaining, note=''):
+        """Mark a block's not-yet-run descendants as skipped."""
+        for skipped in self.dag.descendants(block_id) & set(remaining):
+            del remaining[skipped]
+            self.results[skipped] = BlockResult(self.dag.blocks[skipped].name, 'skipped', note=note)
+
+    def _report(self, result):
+        if not self.echo:
+            # Quiet runs still surface why a block failed
+            if result.status == 'failed':
+                with self._echo_lock:
+                    sys.stderr.write(f"\n# {result.name} failed [{result.duration:.2f}s]\n{result.error}")
+                    sys.stderr.flush()
+            return
+        with self._echo_lock:
+            out = self._out
+            waited = f", waited {result.lock_wait:.2f}s for pyplot" if result.lock_wait else ''
+            out.write(f"\n{'#' * 100}\n# {result.name}  [{result.status}, {result.duration:.2f}s{waited}]\n{'#' * 100}\n")
+            if result.note:
+                out.write(f"# {result.note}\n")
+            out.write(result.output)
+            if result.error:
+                out.write(result.error)
+            out.flush()
+
+    def run(self, targets=None):
+        """
+        Execute the graph (or only the ancestors of the target blocks).
+
+        Args:
+            targets: Optional block names; only these and their ancestors are run
+
+        Returns:
+            Dictionary of block id to BlockResult
+        """
+        selected = set(self.dag.order)
+        if targets:
+            selected = set()
+            for name in targets:
+                block_id = self.dag.by_name(name)
+                selected.update([block_id, *self.dag.ancestors(block_id)])
+
+        _ensure_block_package()
+        self.compile_blocks(b for b in self.dag.order if b in selected)
+        remaining = {b: sum(p in selected for p in self.dag.blocks[b].parents) for b in selected}
+        stdout_proxy = _ThreadLocalStdout(sys.stdout)
+        previous_stdout, sys.stdout = sys.stdout, stdout_proxy
+        self._out = previous_stdout
+        self.wall_start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='canvas') as pool:
+                running = {}
+
+                def submit_ready():
+                    ready = [b for b in self.dag.order if b in remaining and remaining[b] == 0]
+                    for block_id in ready:
+                        del remaining[block_id]
+                        name = self.dag.blocks[block_id].name
+                        if self.cache.is_optional(name) and self._past_deadline():
+                            note = f"skipped: run deadline of {self.deadline}s reached"
+                            self.results[block_id] = BlockResult(name, 'skipped', note=note)
+                            self._skip(block_id, remaining, note)
+                            continue
+                        running[pool.submit(self._run_block, block_id, stdout_proxy)] = block_id
+
+                submit_ready()
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        block_id = running.pop(future)
+                        result = future.result()
+                        self.results[block_id] = result
+                        self._report(result)
+                        if result.status == 'failed':
+                            # Downstream blocks cannot run without this block's exports
+                            self._skip(block_id, remaining)
+                            continue
+                        for child in self.dag.blocks[block_id].children:
+                            if child in remaining:
+                                remaining[child] -= 1
+                    submit_ready()
+        finally:
+            sys.stdout = previous_stdout
+            self.wall_time = time.perf_counter() - self.wall_start
+        return self.results
+
+    def namespace(self):
+        """All exports merged in topological order, like the canvas global scope."""
+        merged = {}
+        for block_id in self.dag.order:
+            merged.update(self.exports.get(block_id, {}))
+        return merged
+
+    def trace_events(self):
+        """
+        One Chrome trace 'X' event per executed block.
+
+        Timestamps come from the same perf_counter clock as the Stage Tracer
+        block's spans, so both sets of events line up in one trace.
+        """
+        pid = os.getpid()
+        return [{
+            'name': result.name, 'cat': 'block', 'ph': 'X', 'pid': pid, 'tid': 0,
+            'ts': result.start * 1e6, 'dur': result.duration * 1e6,
+            'args': {'status': result.status, 'cpu_ms': round(result.cpu * 1000, 3),
+                     'lock_wait_ms': round(result.lock_wait * 1000, 3)}
+        } for block_id in self.dag.order
+            if (result := self.results.get(block_id)) is not None and result.status != 'skipped']
+
+    def summary(self):
+        """Per-block timings (excluding pyplot lock waits), total wall time and the critical path."""
+        durations = {b: r.duration for b, r in self.results.items()}
+        critical_seconds, critical_blocks = self.dag.critical_path(durations)
+        rows = [(r.name, r.status, r.duration) for b in self.dag.order
+                if (r := self.results.get(b)) is not None]
+        return {
+            'blocks': rows,
+            'wall_time': self.wall_time,
+            'serial_time': sum(durations.values()),
+            'critical_path_time': critical_seconds,
+            'critical_path': [self.dag.blocks[b].name for b in critical_blocks],
+            'pyplot_lock_wait': sum(r.lock_wait for r in self.results.values()),
+            'cached': [r.name for r in self.results.values() if r.status == 'cached'],
+            'failed': [r.name for r in self.results.values() if r.status == 'failed'],
+            'skipped': [r.name for r in self.results.values() if r.status == 'skipped'],
+            'deadline_skipped': [r.name for r in self.results.values() if r.status == 'skipped' and 'deadline' in r.note]
+        }
+
+
+def run_canvas(layer_path=DEFAULT_LAYER_PATH, max_workers=None, echo=True, targets=None, overrides=None,
+               cache=None, deadline=None):
+    """
+    Parse a layer.yaml and execute its blocks.
+
+    Args:
+        layer_path: Path to layer.yaml
+        max_workers: Worker threads
+        echo: Print each block's output as it completes
+        targets: Optional block names to run (with their ancestors)
+        overrides: Variables injected into every block namespace
+        cache: StageCache used to skip unchanged memoized stages
+        deadline: Seconds after which optional blocks are no longer started
+
+    Returns:
+        The CanvasExecutor, holding results and exports
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+    except ImportError:
+        pass
+    executor = CanvasExecutor(CanvasDAG.from_yaml(layer_path), max_workers, echo, overrides, cache, deadline)
+    executor.run(targets)
+    return executor
@@ -0,0 +1,249 @@
+"""
+Stage-level memoization for canvas blocks.
+
+A stage declared in stages.yaml is keyed by the hash of its source (after
+parameter overrides), its parameter values, the definitions of its ancestor
+blocks (the functions and classes it may call, such as semantic_search), its
+inputs and the contents of any data files it declares. An input produced by
+another memoized stage
+contributes that stage's key; any other input contributes a digest of its
+pickled value. On a hit the block's imports,
+functions, classes and literal constants are re-executed (so module-level
+definitions exist) and its data exports are loaded from the store instead of being recomputed.
+"""
+import ast
+import hashlib
+import os
+import pickle
+import types
+
+import yaml
+
+DEFAULT_STAGES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   'Development', 'stages.yaml')
+DEFAULT_CACHE_DIR = os.environ.get('CANVAS_CACHE_DIR', '.canvas_cache')
+
+DEFINITION_NODES = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+class UncacheableStage(Exception):
+    """Raised when a stage's inputs or exports cannot be pickled."""
+
+
+def _assigned_name(node):
+    if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+        return node.target.id
+    return None
+
+
+def apply_params(tree, param_names, overrides):
+    """
+    Resolve a block's declared parameters and substitute overrides in its AST.
+
+    Args:
+        tree: Parsed module AST of the block (modified in place)
+        param_names: Parameter names declared for the stage
+        overrides: Mapping of parameter name to override value
+
+    Returns:
+        Dictionary of effective parameter values
+    """
+    values = {}
+    for node in tree.body:
+        name = _assigned_name(node)
+        if name not in param_names:
+            continue
+        if name in overrides:
+            node.value = ast.parse(repr(overrides[name]), mode='eval').body
+        values[name] = ast.literal_eval(node.value)
+    missing = set(param_names) - set(values)
+    if missing:
+        raise ValueError(f"Declared parameters not assigned at top level: {', '.join(sorted(missing))}")
+    ast.fix_missing_locations(tree)
+    return values
+
+
+def _is_literal_assignment(node):
+    if _assigned_name(node) is None:
+        return False
+    try:
+        ast.literal_eval(node.value)
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        return False
+    return True
+
+
+def definitions_only(tree):
+    """
+    Module containing only the imports, functions, classes and literal
+    constants (e.g. parameters used as default arguments) of a block.
+    """
+    body = [node for node in tree.body if isinstance(node, DEFINITION_NODES) or _is_literal_assignment(node)]
+    return ast.Module(body=body, type_ignores=[])
+
+
+def definitions_digest(tree):
+    """Digest of a block's definitions (see definitions_only); formatting and comments do not count."""
+    return hashlib.sha256(ast.dump(definitions_only(tree)).encode()).hexdigest()
+
+
+def is_data_export(value):
+    """Exports that are restored by re-running definitions are not stored."""
+    return not isinstance(value, (types.ModuleType, types.FunctionType, types.BuiltinFunctionType, type))
+
+
+def files_digest(paths):
+    """Digest of the contents of files and (recursively) directories; missing paths hash as absent."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.encode())
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, name) for root, _, names in os.walk(path) for name in names)
+        else:
+            files = [path] if os.path.exists(path) else []
+        for file_path in files:
+            digest.update(os.path.relpath(file_path, path).encode())
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def value_digest(value):
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exc:
+        raise UncacheableStage(f"input of type {type(value).__name__} cannot be pickled: {exc}") from exc
+    return hashlib.sha256(payload).hexdigest()
+
+
+class StageCache:
+    """
+    On-disk store of stage exports keyed by input hashes.
+
+    Layout: <directory>/<block module>/<key>.pkl. With directory=None keys
+    and parameter overrides still apply but nothing is loaded or stored.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, stages_path=DEFAULT_STAGES_PATH, params=None):
+        """
+        Args:
+            directory: Cache directory, or None to disable persistence
+            stages_path: stages.yaml declaring memoized stages
+            params: Parameter overrides applied to every stage that declares them
+        """
+        self.directory = directory
+        self.params = dict(params or {})
+        stages, optional = {}, []
+        if stages_path and os.path.exists(stages_path):
+            with open(stages_path) as f:
+                config = yaml.safe_load(f) or {}
+            stages = config.get('stages') or {}
+            optional = config.get('optional') or []
+        base = os.path.dirname(os.path.abspath(stages_path)) if stages_path else '.'
+        self.stages = {name: {'inputs': spec.get('inputs', []), 'params': spec.get('params', []),
+                              'files': [os.path.normpath(os.path.join(base, path)) for path in spec.get('files', [])]}
+                       for name, spec in stages.items()}
+        self.optional = set(optional or [])
+
+    def is_optional(self, block_name):
+        """Whether a block may be skipped once the run deadline has passed."""
+        return block_name in self.optional
+
+    def spec(self, block_name):
+        """Declared inputs and params of a stage, or None if it is not memoized."""
+        return self.stages.get(block_name)
+
+    def resolve_params(self, block, tree):
+        """
+        Substitute parameter overrides in a stage's AST.
+
+        Parses the override literals, so callers running blocks on worker
+        threads do this up front on one thread (see CanvasExecutor).
+
+        Returns:
+            Dictionary of effective parameter values
+        """
+        return apply_params(tree, self.stages[block.name]['params'], self.params)
+
+    def stage_key(self, block, tree, input_keys, namespace, params=None, upstream=None):
+        """
+        Compute the cache key of a stage.
+
+        Args:
+            block: Block being executed
+            tree: Block AST
+            input_keys: Mapping of input name to the key of the memoized stage that produced it
+            namespace: Block input namespace
+            params: Effective params when resolve_params() was already applied to tree
+            upstream: Mapping of ancestor block name to its definitions_digest, so
+                editing a function the stage calls from another block invalidates it
+
+        Returns:
+            Tuple of (hex key, effective params)
+        """
+        spec = self.stages[block.name]
+        if params is None:
+            params = self.resolve_params(block, tree)
+        digest = hashlib.sha256()
+        digest.update(ast.dump(tree).encode())
+        digest.update(repr(sorted(params.items())).encode())
+        for name, upstream_digest in sorted((upstream or {}).items()):
+            digest.update(name.encode())
+            digest.update(upstream_digest.encode())
+        for name in spec['inputs']:
+            if name not in namespace:
+                raise UncacheableStage(f"declared input '{name}' is not defined upstream")
+            digest.update(name.encode())
+            digest.update((input_keys.get(name) or value_digest(namespace[name])).encode())
+        if spec['files']:
+            digest.update(files_digest(spec['files']).encode())
+        return digest.hexdigest(), params
+
+    def _path(self, block, key):
+        return os.path.join(self.directory, block.module_name, f"{key}.pkl")
+
+    def contains(self, block, key):
+        """Whether exports are stored for a stage key."""
+        return self.directory is not None and os.path.exists(self._path(block, key))
+
+    def load(self, block, key):
+        """
+        Load the stored data exports for a key.
+
+        Classes defined by the block must already exist in its module,
+        since stored instances are unpickled by reference to them.
+        """
+        with open(self._path(block, key), 'rb') as f:
+            return pickle.load(f)
+
+    def save(self, block, key, exports):
+        """
+        Store a stage's data exports.
+
+        Returns:
+            Path of the stored file, or None when persistence is disabled
+
+        Raises:
+            UncacheableStage: If an export cannot be pickled or is a partial
+                output (flagged 'partial' when a deadline cut the stage short)
+        """
+        if self.directory is None:
+            return None
+        data = {name: value for name, value in exports.items() if is_data_export(value)}
+        partial = sorted(name for name, value in data.items() if isinstance(value, dict) and value.get('partial'))
+        if partial:
+            raise UncacheableStage(f"{', '.join(partial)} cut short by a deadline")
+        try:
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            raise UncacheableStage(f"exports cannot be pickled: {exc}") from exc
+        path = self._path(block, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a concurrent or interrupted run never reads a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return path